@@ -0,0 +1,101 @@
+"""Micro-benchmark of date parsing over a corpus of blog date strings.
+
+Compares the per-scraper parsing the scrapers used before, a long month
+regex searched for on every call followed by ``strptime`` formats tried
+one by one, with the shared ``scrapers.dates.parse_date``, both with and
+without its memo cache. Listing pages repeat the same dates many times, so
+the corpus is replayed ``--pages`` times. Run from the repository root:
+
+    python benchmarks/bench_dates.py [--pages N] [--repeat N]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.dates import parse_date  # noqa: E402
+
+CORPUS = Path(__file__).parent / "fixtures" / "date_strings.txt"
+
+
+def legacy_parse_date(text: str) -> Optional[datetime]:
+    """Parse a date string the way the scrapers did before the date module."""
+    date_pattern = r"(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})"
+    match = re.search(date_pattern, text)
+    if match:
+        date_str = match.group(0).replace(",", "")
+        for date_format in ("%b %d %Y", "%B %d %Y"):
+            try:
+                return datetime.strptime(date_str, date_format).replace(
+                    tzinfo=timezone.utc
+                )
+            except ValueError:
+                continue
+    for date_format in ("%d %b %Y",):
+        try:
+            return datetime.strptime(text, date_format).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(text)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def load_corpus() -> List[str]:
+    lines = CORPUS.read_text(encoding="utf-8").splitlines()
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200, help="Corpus replays")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs each")
+    args = parser.parse_args()
+
+    corpus = load_corpus()
+    workload = corpus * args.pages
+
+    for text in corpus:
+        expected = legacy_parse_date(text)
+        actual = parse_date(text)
+        assert actual is not None, f"Could not parse {text!r}"
+        assert expected == actual, f"{text!r}: {expected} != {actual}"
+
+    uncached = parse_date.__wrapped__
+
+    def run(func) -> float:
+        best = min(
+            timeit.repeat(
+                lambda: [func(text) for text in workload], number=1, repeat=args.repeat
+            )
+        )
+        return best / len(workload) * 1e6
+
+    legacy = run(legacy_parse_date)
+    plain = run(uncached)
+    parse_date.cache_clear()
+    memoized = run(parse_date)
+
+    print(f"{len(corpus)} date strings x {args.pages} pages")
+    print(f"legacy:     {legacy:6.2f} us/date")
+    print(f"uncached:   {plain:6.2f} us/date  {legacy / plain:5.1f}x")
+    print(f"memoized:   {memoized:6.2f} us/date  {legacy / memoized:5.1f}x")
+    print(f"cache:      {parse_date.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark HTML parsing of each scraper's listing page.
+
+Compares building a full ``html.parser`` tree, as the scrapers used to do,
+with the shared parser backend: the fastest installed tree builder,
+restricted to each scraper's ``parse_only`` subtrees. Run from the
+repository root:
+
+    python benchmarks/bench_html_parser.py [--repeat N]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.anthropic import AnthropicScraper  # noqa: E402
+from scrapers.bytebytego import ByteByteGoScraper  # noqa: E402
+from scrapers.claude import ClaudeScraper  # noqa: E402
+from scrapers.github import GitHubAIScraper  # noqa: E402
+from scrapers.google_research import GoogleResearchScraper  # noqa: E402
+from scrapers.html_parser import html_backend, parse_html  # noqa: E402
+from scrapers.uber import UberScraper  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+SCRAPERS = {
+    "anthropic.html": AnthropicScraper,
+    "bytebytego.html": ByteByteGoScraper,
+    "claude.html": ClaudeScraper,
+    "github.html": GitHubAIScraper,
+    "google_research.html": GoogleResearchScraper,
+    "uber.html": UberScraper,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per parse")
+    args = parser.parse_args()
+
+    def best_of(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    print(f"backend: {html_backend()}")
+    print(f"{'fixture':<22}{'before ms':>11}{'after ms':>10}{'speedup':>9}")
+    for fixture, scraper_class in SCRAPERS.items():
+        html = (FIXTURES_DIR / fixture).read_text(encoding="utf-8")
+        strainer = scraper_class.parse_only
+
+        # The restricted tree must hold exactly what the scraper reads
+        full = BeautifulSoup(html, "html.parser")
+        with parse_html(html, parse_only=strainer) as restricted:
+            expected = [tag.get_text() for tag in full.find_all(strainer)]
+            actual = [tag.get_text() for tag in restricted.find_all(strainer)]
+            assert expected == actual, f"Parsed content differs for {fixture}"
+
+        def restricted_parse() -> None:
+            with parse_html(html, parse_only=strainer):
+                pass
+
+        before = best_of(lambda: BeautifulSoup(html, "html.parser").decompose())
+        after = best_of(restricted_parse)
+        print(
+            f"{fixture:<22}{before * 1000:>11.1f}{after * 1000:>10.1f}"
+            f"{before / after:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
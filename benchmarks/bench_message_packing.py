@@ -0,0 +1,119 @@
+"""Benchmark of digest message packing over synthetic post volumes.
+
+Compares one message per day, as the Telegram channel used to send, with
+the size-aware packer: messages (API calls) per digest, how many exceed
+Telegram's 4096 character limit, and the time spent rendering. Every
+packed message is checked to fit the limit and to keep every post. Run
+from the repository root:
+
+    python benchmarks/bench_message_packing.py [--repeat N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("TELEGRAM_BOT_TOKEN", "benchmark")
+os.environ.setdefault("TELEGRAM_CHANNEL_ID", "benchmark")
+
+from channels.message_packer import MESSAGE_LIMIT, text_length  # noqa: E402
+from channels.telegram import SOURCE_EMOJIS, TelegramChannel  # noqa: E402
+from scrapers.base_scraper import BlogPost  # noqa: E402
+
+WORDS = (
+    "scaling distributed systems kubernetes observability latency postgres "
+    "migration machine learning inference caching pipeline streaming kafka "
+    "reliability incident review building faster safer platform"
+).split()
+
+# Scenario name -> posts per day, newest day first
+SCENARIOS: Dict[str, List[int]] = {
+    "quiet day": [2],
+    "quiet week": [1, 0, 2, 1, 0, 1, 3],
+    "busy day": [60],
+    "launch week": [45, 30, 8, 3, 0, 12, 5],
+    "30-day backfill": [],
+}
+
+
+def make_posts(per_day: List[int], rng: random.Random) -> List[BlogPost]:
+    now = datetime.now(timezone.utc).replace(hour=12)
+    sources = list(SOURCE_EMOJIS)
+    posts = []
+    for day, count in enumerate(per_day):
+        for i in range(count):
+            title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12)))
+            source = rng.choice(sources)
+            slug = title.replace(" ", "-")
+            posts.append(
+                BlogPost(
+                    title=title.capitalize(),
+                    url=f"https://example.com/{source.split()[0].lower()}/{slug}",
+                    date=now - timedelta(days=day, minutes=i),
+                    source=source,
+                )
+            )
+    return posts
+
+
+def render_per_day(channel: TelegramChannel, posts: List[BlogPost]) -> List[str]:
+    """One message per day, the way the channel rendered digests before."""
+    packer_limit = channel.packer.limit
+    channel.packer.limit = sys.maxsize
+    try:
+        days = {}
+        for post in posts:
+            days.setdefault(post.date.date(), []).append(post)
+        return [
+            channel.render_messages(day_posts)[0].text for day_posts in days.values()
+        ]
+    finally:
+        channel.packer.limit = packer_limit
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Timed runs each")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    SCENARIOS["30-day backfill"] = [rng.choice([0, 1, 2, 3, 8]) for _ in range(30)]
+    channel = TelegramChannel(dry_run=True)
+
+    print(
+        f"{'scenario':<17}{'posts':>6}{'per-day':>9}{'>limit':>8}"
+        f"{'packed':>8}{'fill':>7}{'render us':>11}"
+    )
+    for name, per_day in SCENARIOS.items():
+        posts = make_posts(per_day, rng)
+        before = render_per_day(channel, posts)
+        packed = channel.render_messages(posts)
+
+        assert sum(message.post_count for message in packed) == len(posts)
+        for post in posts:
+            assert sum(message.text.count(post.url) for message in packed) >= 1
+        assert all(text_length(m.text) <= MESSAGE_LIMIT for m in packed)
+
+        oversized = sum(text_length(text) > MESSAGE_LIMIT for text in before)
+        fill = sum(text_length(m.text) for m in packed) / (len(packed) * MESSAGE_LIMIT)
+        seconds = min(
+            timeit.repeat(
+                lambda: channel.render_messages(posts), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f"{name:<17}{len(posts):>6}{len(before):>9}{oversized:>8}"
+            f"{len(packed):>8}{fill:>7.0%}{seconds * 1e6:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,321 @@
+"""Offline benchmark of every scraper against saved fixtures.
+
+Each of the ten scrapers runs its full ``scrape()`` — fetching, parsing and
+post-processing — against a local stand-in HTTP server that serves the
+saved pages and feeds in ``fixtures``. The shared HTTP client sends every
+request for the real hosts to that server, so no network is needed. Every
+run starts from an empty data directory, so conditional GET and metadata
+caches never short-cut a scrape.
+
+Reported per scraper: pages fetched and items returned per scrape, the
+median wall and parse time, throughput in pages and items per second, and
+the tracemalloc peak of one extra run. Results can be written as JSON and
+compared against a previous run. Run from the repository root:
+
+    python benchmarks/bench_scrapers.py [--repeat N] [--sources a,b]
+        [--output results.json] [--compare baseline.json]
+
+The Selenium scrapers (Uber, ByteByteGo) are measured on their embedded
+JSON tier, which is what they use when the plain page carries the listing;
+parsing of their rendered pages is covered by ``bench_html_parser.py``.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from scrapers.html_parser import html_backend  # noqa: E402
+from scrapers.http_client import close_http_client, get_http_client  # noqa: E402
+from scrapers.registry import SOURCES, load_scraper_class, resolve_sources  # noqa: E402
+from utils import profiling  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# URL the scrapers request -> fixture served for it
+ROUTES: Dict[str, str] = {
+    "https://eng.uber.com/": "uber_state.html",
+    "https://netflixtechblog.com/feed": "netflix.xml",
+    "https://medium.com/feed/airbnb-engineering": "airbnb.xml",
+    "https://blog.bytebytego.com/": "bytebytego_preloads.html",
+    "https://aws.amazon.com/blogs/architecture/feed/": "aws.xml",
+    "https://eng.lyft.com/feed": "lyft.xml",
+    "https://www.anthropic.com/engineering": "anthropic.html",
+    "https://github.blog/ai-and-ml/": "github.html",
+    "https://research.google/blog/": "google_research.html",
+    "https://claude.com/blog": "claude.html",
+}
+# Post pages linked from the Claude listing share one templated fixture
+CLAUDE_POST_PREFIX = "https://claude.com/blog/post-"
+CLAUDE_POST_FIXTURE = "claude_post.html"
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".xml": "application/rss+xml; charset=utf-8",
+}
+
+
+class FixtureServer:
+    """Serves the fixtures on localhost in place of the real blogs.
+
+    A request for ``https://<host><path>`` arrives as ``/<host><path>``,
+    the URL the client's host overrides map it to.
+    """
+
+    def __init__(self) -> None:
+        self._pages: Dict[str, Tuple[bytes, str]] = {
+            self._local_path(url): self._load(fixture)
+            for url, fixture in ROUTES.items()
+        }
+        self._claude_post = Template(
+            (FIXTURES_DIR / CLAUDE_POST_FIXTURE).read_text(encoding="utf-8")
+        )
+        self.requests = 0
+        self.missing: List[str] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @staticmethod
+    def _load(fixture: str) -> Tuple[bytes, str]:
+        path = FIXTURES_DIR / fixture
+        return path.read_bytes(), CONTENT_TYPES[path.suffix]
+
+    @staticmethod
+    def _local_path(url: str) -> str:
+        parts = urlsplit(url)
+        return f"/{parts.hostname}{parts.path or '/'}"
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def host_overrides(self) -> Dict[str, str]:
+        """Host name -> local base URL, for every host the routes cover."""
+        hosts = {urlsplit(url).hostname for url in [*ROUTES, CLAUDE_POST_PREFIX]}
+        return {host: f"{self.base_url}/{host}" for host in hosts}
+
+    def page(self, path: str) -> Optional[Tuple[bytes, str]]:
+        """Return the body and content type served for a local path, if any."""
+        if path in self._pages:
+            return self._pages[path]
+        post_prefix = self._local_path(CLAUDE_POST_PREFIX)
+        if path.startswith(post_prefix):
+            number = path[len(post_prefix) :].strip("/")
+            if number.isdigit():
+                published = date(2026, 3, 11) - timedelta(days=int(number))
+                body = self._claude_post.substitute(
+                    number=number, date=published.isoformat()
+                )
+                return body.encode("utf-8"), CONTENT_TYPES[".html"]
+        return None
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                path = urlsplit(self.path).path
+                page = server.page(path)
+                with server._lock:
+                    server.requests += 1
+                    if page is None:
+                        server.missing.append(path)
+                if page is None:
+                    self.send_error(404)
+                    return
+                body, content_type = page
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "FixtureServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def git_commit() -> Optional[str]:
+    """The commit being benchmarked, if the tree is a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+async def scrape_once(
+    source: str, server: FixtureServer, trace_memory: bool
+) -> Dict[str, Any]:
+    """Run one cold scrape of a source and measure it."""
+    previous_data_dir = os.environ.get("KORAN_DATA_DIR")
+    with tempfile.TemporaryDirectory() as data_dir:
+        # Scrapers resolve their cache and breaker files when they are created
+        os.environ["KORAN_DATA_DIR"] = data_dir
+        scraper = load_scraper_class(source)()
+        requests_before = server.requests
+        profiler = profiling.start_profiling(trace_memory=trace_memory)
+        start = time.perf_counter()
+        try:
+            posts = await scraper.scrape()
+        finally:
+            wall = time.perf_counter() - start
+            profiling.stop_profiling()
+            await scraper.close()
+            if previous_data_dir is None:
+                del os.environ["KORAN_DATA_DIR"]
+            else:
+                os.environ["KORAN_DATA_DIR"] = previous_data_dir
+
+    parse = profiler.stats.get((scraper.source_name, "parse"))
+    return {
+        "pages": server.requests - requests_before,
+        "items": len(posts),
+        "wall": wall,
+        "parse": parse.self_wall if parse else 0.0,
+        "peak": profiler.memory_peaks.get(scraper.source_name, 0),
+    }
+
+
+async def bench_source(
+    source: str, server: FixtureServer, repeat: int
+) -> Dict[str, Any]:
+    """Benchmark a source: one warm-up, ``repeat`` timed runs, one traced run."""
+    warmup = await scrape_once(source, server, trace_memory=False)
+    if not warmup["items"]:
+        raise RuntimeError(f"{source} scraped no posts from its fixture")
+
+    runs = [
+        await scrape_once(source, server, trace_memory=False) for _ in range(repeat)
+    ]
+    traced = await scrape_once(source, server, trace_memory=True)
+
+    wall = statistics.median(run["wall"] for run in runs)
+    parse = statistics.median(run["parse"] for run in runs)
+    pages, items = warmup["pages"], warmup["items"]
+    return {
+        "pages": pages,
+        "items": items,
+        "wall_s": round(wall, 6),
+        "wall_min_s": round(min(run["wall"] for run in runs), 6),
+        "parse_s": round(parse, 6),
+        "pages_per_s": round(pages / wall, 1),
+        "items_per_s": round(items / wall, 1),
+        "parse_items_per_s": round(items / parse, 1) if parse else None,
+        "peak_mib": round(traced["peak"] / 2**20, 3),
+    }
+
+
+def print_results(
+    results: Dict[str, Dict[str, Any]], baseline: Optional[Dict[str, Any]]
+) -> None:
+    header = (
+        f"{'source':<17}{'pages':>6}{'items':>6}{'wall ms':>9}{'parse ms':>10}"
+        f"{'pages/s':>9}{'items/s':>9}{'peak MiB':>10}"
+    )
+    if baseline:
+        header += f"{'wall':>8}{'peak':>8}"
+    print(header)
+    for source, result in results.items():
+        line = (
+            f"{source:<17}{result['pages']:>6}{result['items']:>6}"
+            f"{result['wall_s'] * 1000:>9.1f}{result['parse_s'] * 1000:>10.1f}"
+            f"{result['pages_per_s']:>9.0f}{result['items_per_s']:>9.0f}"
+            f"{result['peak_mib']:>10.2f}"
+        )
+        before = (baseline or {}).get("results", {}).get(source)
+        if before:
+            for key in ("wall_s", "peak_mib"):
+                change = result[key] / before[key] - 1 if before[key] else 0
+                line += f"{change:>+8.0%}"
+        print(line)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    results = {}
+    with FixtureServer() as server:
+        get_http_client().host_overrides.update(server.host_overrides())
+        try:
+            for source in args.sources:
+                results[source] = await bench_source(source, server, args.repeat)
+        finally:
+            await close_http_client()
+        if server.missing:
+            raise RuntimeError(f"No fixture for: {', '.join(sorted(server.missing))}")
+
+    return {
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "html_backend": html_backend(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs each")
+    parser.add_argument(
+        "--sources",
+        type=lambda value: resolve_sources(value.split(",")),
+        default=list(SOURCES),
+        help="Comma-separated source IDs (default: all)",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument(
+        "--compare", type=Path, help="JSON results of an earlier run to compare"
+    )
+    args = parser.parse_args()
+
+    # Keep the scrapers' progress logs out of the table and the timings
+    logging.disable(logging.INFO)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+
+    report = asyncio.run(run(args))
+    print(f"commit: {report['commit']}  backend: {report['html_backend']}")
+    if baseline:
+        print(f"compared with: {baseline.get('commit')} ({baseline['created_at']})")
+    print_results(report["results"], baseline)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Startup benchmark of the CLI and HTTP entry points using ``-X importtime``.
+
+Each scenario runs in a fresh interpreter with ``python -X importtime`` and
+the cumulative import time of its top-level imports is summed. The
+``eager`` scenario imports what ``main.py`` used to import up front (both
+command handlers, FastAPI and every scraper); the others import what the
+entry points load now. Run from the repository root:
+
+    python benchmarks/bench_startup.py [--repeat N] [--top N]
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The service checks for Telegram credentials; nothing is sent
+ENV = {
+    **os.environ,
+    "TELEGRAM_BOT_TOKEN": os.environ.get("TELEGRAM_BOT_TOKEN", "benchmark"),
+    "TELEGRAM_CHANNEL_ID": os.environ.get("TELEGRAM_CHANNEL_ID", "benchmark"),
+}
+
+SCENARIOS: Dict[str, str] = {
+    "eager (previous main.py)": (
+        "import cmd.cli, cmd.http, services.koran_service;"
+        "from scrapers.registry import SOURCES, load_scraper_class;"
+        "[load_scraper_class(source) for source in SOURCES]"
+    ),
+    "main.py --help": "import main",
+    "cli, all sources": (
+        "import main, cmd.cli;"
+        "from services.koran_service import KoranService;"
+        "KoranService().scrapers"
+    ),
+    "cli --sources netflix,aws": (
+        "import main, cmd.cli;"
+        "from services.koran_service import KoranService;"
+        "KoranService(sources=['netflix', 'aws']).scrapers"
+    ),
+    "http": "import main, cmd.http",
+}
+
+# "import time: self [us] | cumulative | imported package"
+IMPORT_LINE_RE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(snippet: str) -> Tuple[int, List[Tuple[int, str]]]:
+    """Run a snippet in a fresh interpreter and collect its import times.
+
+    Returns:
+        Total microseconds spent importing and the (cumulative, module) pairs
+        of the top-level imports
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", snippet],
+        cwd=ROOT,
+        env=ENV,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    top_level = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE_RE.match(line)
+        if match and len(match.group(3)) == 1:
+            top_level.append((int(match.group(2)), match.group(4)))
+    return sum(cumulative for cumulative, _ in top_level), top_level
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per scenario")
+    parser.add_argument("--top", type=int, default=5, help="Heaviest imports shown")
+    args = parser.parse_args()
+
+    baseline = None
+    for name, snippet in SCENARIOS.items():
+        runs = [measure(snippet) for _ in range(args.repeat)]
+        total, modules = min(runs)
+        if baseline is None:
+            baseline = total
+        print(f"{name:28} {total / 1000:8.1f} ms  {baseline / total:5.1f}x")
+        for cumulative, module in sorted(modules, reverse=True)[: args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
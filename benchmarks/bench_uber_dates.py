@@ -0,0 +1,119 @@
+"""Benchmark the Uber Engineering page parser on a saved listing page.
+
+Compares the single-pass date index used by ``UberScraper.parse_posts``
+against the previous approach, which searched every ancestor of every link
+with a ``container.find`` lambda. Run from the repository root:
+
+    python benchmarks/bench_uber_dates.py [--repeat N] [--fixture PATH]
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from scrapers.base_scraper import BlogPost  # noqa: E402
+from scrapers.uber import UberScraper  # noqa: E402
+
+FIXTURE = Path(__file__).parent / "fixtures" / "uber.html"
+_MONTHS = [
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+]
+
+
+def legacy_extract_posts(soup: BeautifulSoup, source_name: str) -> List[BlogPost]:
+    """The ancestor-walking extraction UberScraper used before the date index."""
+    posts: List[BlogPost] = []
+    for link in soup.find_all("a", href=True):
+        href = link.get("href", "")
+        if not href or "/blog/" not in href:
+            continue
+        if not href.startswith("http"):
+            href = f"https://www.uber.com{href}"
+
+        title = link.get_text(strip=True)
+        if not title or len(title) < 10:
+            continue
+
+        container = link.find_parent("div")
+        date_elem = None
+        while container and not date_elem:
+            date_elem = container.find(
+                lambda tag: tag.name == "div"
+                and (
+                    any(month in tag.get_text() for month in _MONTHS)
+                    or any(f"{i} " in tag.get_text() for i in range(1, 32))
+                )
+            )
+            container = container.find_parent("div")
+        if not date_elem:
+            continue
+
+        try:
+            pub_date = datetime.strptime(
+                date_elem.get_text(strip=True), "%B %d, %Y"
+            ).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+        posts.append(BlogPost(title=title, url=href, date=pub_date, source=source_name))
+
+    unique_posts = {}
+    for post in posts:
+        unique_posts.setdefault(post.url, post)
+    return list(unique_posts.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per parser")
+    parser.add_argument("--fixture", type=Path, default=FIXTURE, help="Saved page")
+    args = parser.parse_args()
+
+    html = args.fixture.read_text(encoding="utf-8")
+    scraper = UberScraper()
+
+    soup = BeautifulSoup(html, "html.parser")
+    legacy = legacy_extract_posts(soup, scraper.source_name)
+    indexed = scraper.extract_posts(soup)
+
+    # Every post the old parser found must come out of the new one unchanged;
+    # the new parser may find more, since the old lambda also matched title
+    # divs containing text like "3 " and then failed to parse them as dates
+    by_url = {post.url: post for post in indexed}
+    for post in legacy:
+        assert by_url.get(post.url) == post, f"Mismatch for {post.url}"
+
+    def best_of(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    parse_time = best_of(lambda: BeautifulSoup(html, "html.parser"))
+    legacy_time = best_of(lambda: legacy_extract_posts(soup, scraper.source_name))
+    indexed_time = best_of(lambda: scraper.extract_posts(soup))
+
+    # Parsing the markup costs the same for both, so report it separately
+    print(f"fixture: {args.fixture} ({len(html)} bytes)")
+    print(f"parse:   {parse_time * 1000:9.1f} ms")
+    print(f"legacy:  {legacy_time * 1000:9.1f} ms  {len(legacy)} posts")
+    print(f"indexed: {indexed_time * 1000:9.1f} ms  {len(indexed)} posts")
+    print(f"speedup: {legacy_time / indexed_time:9.1f}x (date extraction only)")
+
+
+if __name__ == "__main__":
+    main()
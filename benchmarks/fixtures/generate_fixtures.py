@@ -0,0 +1,361 @@
+"""Generate the synthetic HTML and RSS fixtures used by the benchmarks.
+
+The fixtures mimic the structure of the pages and feeds the scrapers parse
+(article cards nested in layout divs, navigation and footer links, feed
+items with full post bodies, JSON state embedded in plain HTML pages)
+without depending on a live network fetch. Run this script to regenerate
+them:
+
+    python benchmarks/fixtures/generate_fixtures.py
+"""
+
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+from xml.sax.saxutils import escape
+
+FIXTURES_DIR = Path(__file__).parent
+
+_TOPICS = [
+    "Scaling Kafka Consumers",
+    "Building a Real-Time Pricing Engine",
+    "Lessons From Migrating a Million Rides",
+    "How We Cut Seconds From App Startup",
+    "Observability for Microservices",
+    "Designing a Geospatial Index",
+    "Running Spark on Kubernetes",
+    "Testing Mobile Releases at Scale",
+]
+
+
+def _publication_dates(rng: random.Random, count: int) -> List[date]:
+    """Return ``count`` descending publication dates ending on 2026-03-11."""
+    day = date(2026, 3, 11)
+    dates = []
+    for _ in range(count):
+        day -= timedelta(days=rng.randint(0, 3))
+        dates.append(day)
+    return dates
+
+
+def _page(title: str, body: str, rng: random.Random) -> str:
+    """Wrap ``body`` in the head, navigation and footer boilerplate of a blog.
+
+    Real blog pages spend most of their bytes on inline scripts, styles and
+    site chrome, which the scrapers never look at.
+    """
+    styles = "".join(
+        f".c{index}{{margin:{index % 7}px;padding:{index % 5}px}}"
+        for index in range(400)
+    )
+    state = ",".join(f'"k{index}":"{rng.getrandbits(64):x}"' for index in range(400))
+    nav = "".join(
+        f'<li class="nav-item"><a href="/{section}/">{section.title()}</a></li>'
+        for section in ("products", "research", "company", "careers", "news")
+    )
+    footer = "".join(
+        f'<div class="footer-column"><ul><li><a href="/legal/{index}/">'
+        f"Legal notice {index}</a></li></ul></div>"
+        for index in range(40)
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title>"
+        f"<style>{styles}</style><script>window.state={{{state}}}</script>"
+        f"</head><body><header><nav><ul>{nav}</ul></nav></header>"
+        f"<main>{body}</main><footer>{footer}</footer></body></html>"
+    )
+
+
+def anthropic_engineering_page(cards: int = 60, seed: int = 11) -> str:
+    """Build the Anthropic Engineering listing: dates inside the post links."""
+    rng = random.Random(seed)
+    body = "".join(
+        f'<div class="card"><a href="/engineering/post-{index + 1}">'
+        f"<h3>{rng.choice(_TOPICS)} (part {index + 1})</h3>"
+        f'<div class="date">{day:%b} {day.day}, {day:%Y}</div></a></div>'
+        for index, day in enumerate(_publication_dates(rng, cards))
+    )
+    return _page("Engineering at Anthropic", body, rng)
+
+
+def github_ai_page(cards: int = 60, seed: int = 13) -> str:
+    """Build the GitHub AI & ML listing: one ``<article>`` per post."""
+    rng = random.Random(seed)
+    body = "".join(
+        "<article><h3>"
+        f'<a href="https://github.blog/ai-and-ml/post-{index + 1}/">'
+        f"{rng.choice(_TOPICS)} (part {index + 1})</a></h3>"
+        "<p>A look at how we build and ship this feature.</p>"
+        f"<time>{day:%B} {day.day}, {day:%Y}</time></article>"
+        for index, day in enumerate(_publication_dates(rng, cards))
+    )
+    return _page("AI & ML - The GitHub Blog", body, rng)
+
+
+def google_research_page(cards: int = 60, seed: int = 17) -> str:
+    """Build the Google Research listing: dated headline links and filters."""
+    rng = random.Random(seed)
+    filters = "".join(
+        f'<a href="/blog/{year}">{year}</a>' for year in range(2016, 2027)
+    ) + "".join(
+        f'<a href="/blog/label/{label}/">{label}</a>'
+        for label in ("algorithms", "health", "robotics", "security")
+    )
+    cards_html = "".join(
+        f'<a href="/blog/post-{index + 1}/"><p class="glue-label">'
+        f"{day:%B} {day.day}, {day:%Y}</p>"
+        f'<span class="headline-5">{rng.choice(_TOPICS)} (part {index + 1})</span>'
+        "<p>Algorithms &amp; Theory · Machine Intelligence</p></a>"
+        for index, day in enumerate(_publication_dates(rng, cards))
+    )
+    return _page("Google Research Blog", filters + cards_html, rng)
+
+
+def bytebytego_page(cards: int = 60, seed: int = 19) -> str:
+    """Build the rendered ByteByteGo archive: Substack post previews."""
+    rng = random.Random(seed)
+    body = "".join(
+        '<div role="article" class="post-preview">'
+        '<a data-testid="post-preview-title" '
+        f'href="https://blog.bytebytego.com/p/post-{index + 1}">'
+        f"{rng.choice(_TOPICS)} (part {index + 1})</a>"
+        f'<time class="date-rtYe1v" datetime="{day.isoformat()}T15:30:00.000Z">'
+        f"{day:%b} {day.day}</time></div>"
+        for index, day in enumerate(_publication_dates(rng, cards))
+    )
+    return _page("ByteByteGo Newsletter", body, rng)
+
+
+def claude_blog_page(cards: int = 60, seed: int = 23) -> str:
+    """Build the Claude blog listing: post and category links."""
+    rng = random.Random(seed)
+    categories = "".join(
+        f'<a href="/blog/category/{name}">{name.title()}</a>'
+        for name in ("product", "enterprise", "developers")
+    )
+    posts = "".join(
+        f'<div class="card"><a href="/blog/post-{index + 1}">'
+        f"{rng.choice(_TOPICS)} (part {index + 1})</a></div>"
+        for index in range(cards)
+    )
+    return _page("Blog | Claude", categories + posts, rng)
+
+
+def uber_blog_page(cards: int = 200, seed: int = 7) -> str:
+    """Build a rendered Uber Engineering listing with ``cards`` article cards."""
+    rng = random.Random(seed)
+    day = date(2026, 3, 11)
+    nav = "".join(
+        f'<div class="menu-item"><a href="/blog/engineering/{area}/">{label}</a></div>'
+        for area, label in [
+            ("backend", "Backend Engineering"),
+            ("data", "Data Infrastructure"),
+            ("mobile", "Mobile Engineering"),
+            ("security", "Security and Privacy"),
+        ]
+    )
+    parts = [
+        "<html><head><title>Uber Engineering</title></head><body>",
+        '<div id="root"><div class="header"><div class="menu">',
+        '<a href="/blog/engineering/">Engineering Blog Home</a>',
+        nav,
+        "</div></div>",
+        '<div class="page"><div class="grid">',
+    ]
+    for index in range(cards):
+        day -= timedelta(days=rng.randint(0, 3))
+        title = f"{rng.choice(_TOPICS)} (part {index + 1})"
+        slug = f"post-{index + 1}"
+        parts.append(
+            '<div class="card">'
+            f'<div class="date">{day:%B} {day.day}, {day:%Y}</div>'
+            '<div class="body"><div class="media"><img src="/img.png"></div>'
+            f'<div class="title"><a href="/blog/{slug}/">{title}</a></div>'
+            f"<p>Read about {title.lower()} at Uber.</p>"
+            f'<a href="/blog/{slug}/">Read more</a>'
+            "</div></div>"
+        )
+    parts.extend(
+        [
+            "</div></div>",
+            '<div class="footer">',
+            "".join(
+                f'<div class="column"><div class="link">'
+                f'<a href="/blog/engineering/archive/{year}/">Archive for {year}</a>'
+                "</div></div>"
+                for year in range(2000, 2027)
+            ),
+            "</div></div>",
+            "</body></html>",
+        ]
+    )
+    return "\n".join(parts)
+
+
+def _post_body(rng: random.Random, paragraphs: int) -> str:
+    """Build the HTML body of a post, as feeds embed it in every item."""
+    sentences = [
+        f"We rolled out {topic.lower()} to every region over the last quarter."
+        for topic in _TOPICS
+    ]
+    parts = []
+    for index in range(paragraphs):
+        parts.append("<p>" + " ".join(rng.choice(sentences) for _ in range(6)) + "</p>")
+        if index % 3 == 0:
+            parts.append(
+                "<figure><img "
+                f'src="https://cdn.example.com/{rng.getrandbits(32):x}.png">'
+                "<figcaption>Architecture overview</figcaption></figure>"
+            )
+    return "".join(parts)
+
+
+def medium_feed(host: str, title: str, items: int = 10, seed: int = 29) -> str:
+    """Build a Medium RSS feed, as served for Netflix, Airbnb and Lyft."""
+    rng = random.Random(seed)
+    entries = []
+    for index, day in enumerate(_publication_dates(rng, items)):
+        post_id = f"{rng.getrandbits(48):012x}"
+        slug = f"post-{index + 1}-{post_id}"
+        entries.append(
+            "<item>"
+            f"<title><![CDATA[{rng.choice(_TOPICS)} (part {index + 1})]]></title>"
+            f"<link>https://{host}/{slug}?source=rss----{post_id[:8]}---4</link>"
+            f'<guid isPermaLink="false">https://medium.com/p/{post_id}</guid>'
+            "<category><![CDATA[engineering]]></category>"
+            "<category><![CDATA[distributed-systems]]></category>"
+            "<dc:creator><![CDATA[Engineering Team]]></dc:creator>"
+            f"<pubDate>{day:%a, %d %b %Y} 17:01:02 GMT</pubDate>"
+            f"<atom:updated>{day.isoformat()}T17:01:02.123Z</atom:updated>"
+            f"<content:encoded><![CDATA[{_post_body(rng, 12)}]]></content:encoded>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss xmlns:dc="http://purl.org/dc/elements/1.1/" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+        'xmlns:atom="http://www.w3.org/2005/Atom" version="2.0"><channel>'
+        f"<title><![CDATA[{title} - Medium]]></title>"
+        f"<link>https://{host}?source=rss----4</link>"
+        "<generator>Medium</generator>"
+        f"<lastBuildDate>Wed, 11 Mar 2026 18:00:00 GMT</lastBuildDate>"
+        + "".join(entries)
+        + "</channel></rss>"
+    )
+
+
+def aws_architecture_feed(items: int = 20, seed: int = 31) -> str:
+    """Build the WordPress RSS feed of the AWS Architecture Blog."""
+    rng = random.Random(seed)
+    entries = []
+    for index, day in enumerate(_publication_dates(rng, items)):
+        title = f"{rng.choice(_TOPICS)} (part {index + 1})"
+        url = f"https://aws.amazon.com/blogs/architecture/post-{index + 1}/"
+        body = _post_body(rng, 8)
+        entries.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>{url}</link>"
+            "<dc:creator><![CDATA[Solutions Architect]]></dc:creator>"
+            f"<pubDate>{day:%a, %d %b %Y} 16:05:00 +0000</pubDate>"
+            "<category><![CDATA[Architecture]]></category>"
+            f'<guid isPermaLink="false">{rng.getrandbits(64):x}</guid>'
+            f"<description>{escape(body[:300])}</description>"
+            f"<content:encoded><![CDATA[{body}]]></content:encoded>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+        'xmlns:dc="http://purl.org/dc/elements/1.1/"><channel>'
+        "<title>AWS Architecture Blog</title>"
+        "<link>https://aws.amazon.com/blogs/architecture/</link>"
+        "<language>en-US</language>" + "".join(entries) + "</channel></rss>"
+    )
+
+
+def uber_state_page(cards: int = 60, seed: int = 37) -> str:
+    """Build the plain HTML Uber Engineering page with its embedded state."""
+    rng = random.Random(seed)
+    posts = [
+        {
+            "id": rng.getrandbits(32),
+            "title": f"{rng.choice(_TOPICS)} (part {index + 1})",
+            "url": f"/blog/post-{index + 1}/",
+            "date": f"{day.isoformat()}T09:00:00Z",
+            "author": {"name": "Uber Engineering"},
+            "categories": [{"name": "Backend"}, {"name": "Data / ML"}],
+        }
+        for index, day in enumerate(_publication_dates(rng, cards))
+    ]
+    state = {"blog": {"posts": posts, "page": 1}, "router": {"path": "/blog/"}}
+    script = f"<script>window.__REDUX_STATE__ = {json.dumps(state)};</script>"
+    return _page("Uber Engineering", '<div id="root"></div>' + script, rng)
+
+
+def bytebytego_preloads_page(cards: int = 60, seed: int = 41) -> str:
+    """Build the plain HTML ByteByteGo archive with Substack's preloads."""
+    rng = random.Random(seed)
+    posts = [
+        {
+            "id": rng.getrandbits(32),
+            "title": f"{rng.choice(_TOPICS)} (part {index + 1})",
+            "slug": f"post-{index + 1}",
+            "canonical_url": f"https://blog.bytebytego.com/p/post-{index + 1}",
+            "post_date": f"{day.isoformat()}T15:30:00.000Z",
+            "audience": "everyone",
+            "description": "A look at how the system works under the hood.",
+        }
+        for index, day in enumerate(_publication_dates(rng, cards))
+    ]
+    preloads = json.dumps({"pub": {"name": "ByteByteGo"}, "posts": posts})
+    script = f"<script>window._preloads = JSON.parse({json.dumps(preloads)})</script>"
+    return _page("ByteByteGo Newsletter", '<div id="entry"></div>' + script, rng)
+
+
+def claude_post_page() -> str:
+    """Build a Claude blog post page, with ``$number`` and ``$date`` to fill in.
+
+    The stand-in server serves it for every post linked from the listing.
+    """
+    rng = random.Random(43)
+    json_ld = (
+        '{"@context": "https://schema.org", "@type": "BlogPosting", '
+        '"headline": "Claude blog post $number", "datePublished": "$date", '
+        '"author": {"@type": "Organization", "name": "Anthropic"}}'
+    )
+    head = (
+        "<!DOCTYPE html><html><head><title>Claude blog post $number</title>"
+        '<meta property="og:title" content="Claude blog post $number">'
+        f'<script type="application/ld+json">{json_ld}</script></head>'
+    )
+    page = _page("", _post_body(rng, 20), rng)
+    return head + page[page.index("<body>") :]
+
+
+def main() -> None:
+    pages = {
+        "anthropic.html": anthropic_engineering_page(),
+        "bytebytego.html": bytebytego_page(),
+        "claude.html": claude_blog_page(),
+        "github.html": github_ai_page(),
+        "google_research.html": google_research_page(),
+        "uber.html": uber_blog_page(),
+        "airbnb.xml": medium_feed(
+            "medium.com/airbnb-engineering", "The Airbnb Tech Blog", seed=47
+        ),
+        "aws.xml": aws_architecture_feed(),
+        "bytebytego_preloads.html": bytebytego_preloads_page(),
+        "claude_post.html": claude_post_page(),
+        "lyft.xml": medium_feed("eng.lyft.com", "Lyft Engineering", seed=53),
+        "netflix.xml": medium_feed("netflixtechblog.com", "Netflix TechBlog"),
+        "uber_state.html": uber_state_page(),
+    }
+    for name, html in pages.items():
+        (FIXTURES_DIR / name).write_text(html, encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
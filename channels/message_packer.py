@@ -0,0 +1,190 @@
+"""Packing of digest sections into as few Telegram messages as possible.
+
+A Telegram message holds at most 4096 characters, counted in UTF-16 code
+units, so emoji count twice. The Markdown markup is counted as well, which
+makes the measured length an upper bound of what Telegram counts.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, Tuple
+
+MESSAGE_LIMIT = 4096
+
+
+def text_length(text: str) -> int:
+    """Length of a text as Telegram counts it."""
+    return len(text.encode("utf-16-le")) // 2
+
+
+@dataclass
+class Entry:
+    """One post of a section.
+
+    Only the title is shortened when the entry doesn't fit in a message, so
+    the link and the Markdown around the title always stay intact.
+    """
+
+    prefix: str
+    title: str
+    suffix: str = ""
+
+    def render(self) -> str:
+        return f"{self.prefix}{self.title}{self.suffix}"
+
+
+@dataclass
+class Section:
+    """The posts of one source on one day."""
+
+    header: str
+    entries: List[Entry]
+
+    def render(self) -> str:
+        return "\n".join([self.header, *(entry.render() for entry in self.entries)])
+
+
+@dataclass
+class Day:
+    """The sections of one day, under a date header."""
+
+    post_date: date
+    header: str
+    sections: List[Section]
+
+
+@dataclass
+class PackedMessage:
+    """A message holding the sections of one or more consecutive days."""
+
+    text: str
+    post_count: int
+    first_date: date
+    last_date: date
+
+    @property
+    def date_range(self) -> str:
+        """The days the message covers, e.g. ``2024-03-01 to 2024-03-04``."""
+        start, end = sorted((self.first_date, self.last_date))
+        return str(start) if start == end else f"{start} to {end}"
+
+
+@dataclass
+class _Draft:
+    parts: List[str] = field(default_factory=list)
+    length: int = 0
+    post_count: int = 0
+    days: List[date] = field(default_factory=list)
+
+    def add(self, text: str, post_count: int, post_date: date) -> None:
+        self.parts.append(text)
+        self.length += text_length(text)
+        self.post_count += post_count
+        if not self.days or self.days[-1] != post_date:
+            self.days.append(post_date)
+
+    def build(self) -> PackedMessage:
+        return PackedMessage(
+            text="".join(self.parts),
+            post_count=self.post_count,
+            first_date=self.days[0],
+            last_date=self.days[-1],
+        )
+
+
+class MessagePacker:
+    """Fills messages close to the size limit, in digest order.
+
+    Sections are added to the current message while they fit, so quiet days
+    share a message and a busy day spills into the next one. A section is
+    only split, between two posts, when it does not fit in a message of its
+    own. A day or section continued from the previous message repeats its
+    header with ``continued`` appended.
+    """
+
+    def __init__(self, limit: int = MESSAGE_LIMIT, continued: str = " (cont.)") -> None:
+        """Initialize the packer.
+
+        Args:
+            limit: Maximum length of a message
+            continued: Suffix of headers repeated in a following message
+        """
+        self.limit = limit
+        self.continued = continued
+
+    def pack(self, days: List[Day]) -> List[PackedMessage]:
+        """Pack days, in the given order, into messages.
+
+        Args:
+            days: Days to pack, each with at least one section
+
+        Returns:
+            Messages in delivery order
+        """
+        messages: List[PackedMessage] = []
+        draft = _Draft()
+        for day in days:
+            day_started = False
+            for section in day.sections:
+                for text, post_count in self._pieces(day, section):
+                    piece = self._join(draft, day, day_started, text)
+                    if draft.parts and draft.length + text_length(piece) > self.limit:
+                        messages.append(draft.build())
+                        draft = _Draft()
+                        piece = self._join(draft, day, day_started, text)
+                    draft.add(piece, post_count, day.post_date)
+                    day_started = True
+        if draft.parts:
+            messages.append(draft.build())
+        return messages
+
+    def _join(self, draft: _Draft, day: Day, day_started: bool, text: str) -> str:
+        """The text that adds a section to a draft, with any headers needed."""
+        if draft.days and draft.days[-1] == day.post_date:
+            return "\n\n" + text
+        header = day.header + (self.continued if day_started else "")
+        separator = "\n\n" if draft.parts else ""
+        return f"{separator}{header}\n\n{text}"
+
+    def _pieces(self, day: Day, section: Section) -> List[Tuple[str, int]]:
+        """Split a section that can't fit in a message of its own.
+
+        Returns:
+            (text, post count) pairs, a single one when the section fits
+        """
+        budget = (
+            self.limit - text_length(day.header + self.continued) - text_length("\n\n")
+        )
+        text = section.render()
+        if text_length(text) <= budget:
+            return [(text, len(section.entries))]
+
+        entry_budget = budget - text_length(section.header + self.continued) - 1
+        pieces = []
+        header = section.header
+        entries: List[str] = []
+        length = text_length(header)
+        for entry in section.entries:
+            text = self._truncate(entry, entry_budget)
+            entry_length = text_length(text) + 1
+            if entries and length + entry_length > budget:
+                pieces.append(("\n".join([header, *entries]), len(entries)))
+                header = section.header + self.continued
+                entries = []
+                length = text_length(header)
+            entries.append(text)
+            length += entry_length
+        pieces.append(("\n".join([header, *entries]), len(entries)))
+        return pieces
+
+    @staticmethod
+    def _truncate(entry: Entry, limit: int) -> str:
+        """Shorten the title of a post that is longer than a whole message."""
+        text = entry.render()
+        if text_length(text) <= limit:
+            return text
+        # Cut in UTF-16 code units; a surrogate pair cut in half is dropped
+        title_limit = max(limit - text_length(entry.prefix + entry.suffix) - 1, 0)
+        encoded = entry.title.encode("utf-16-le")[: 2 * title_limit]
+        title = encoded.decode("utf-16-le", errors="ignore")
+        return f"{entry.prefix}{title}…{entry.suffix}"
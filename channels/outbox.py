@@ -0,0 +1,292 @@
+"""Durable outbox of rendered messages waiting to be delivered."""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from channels.message_packer import PackedMessage
+from utils.storage import data_dir
+
+PENDING = "pending"
+SENT = "sent"
+FAILED = "failed"
+
+_COLUMNS = (
+    "id, chat_id, text, post_count, date_range, status, attempts, last_error, "
+    "created_at, next_attempt_at, sent_at"
+)
+
+
+@dataclass
+class DeliveryReport:
+    """Outcome of an attempt to send the queued messages.
+
+    ``sent`` counts the messages this attempt delivered. ``queued`` and
+    ``failed`` count the messages left in the outbox afterwards: waiting for
+    a retry, and given up on. ``error`` is the first error that stopped the
+    delivery to a chat.
+    """
+
+    sent: int = 0
+    queued: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+
+    @property
+    def complete(self) -> bool:
+        """True if nothing is left to deliver."""
+        return self.error is None and not self.queued and not self.failed
+
+
+@dataclass
+class OutboxMessage:
+    """A message queued for one chat and its delivery status."""
+
+    id: int
+    chat_id: str
+    text: str
+    post_count: int
+    date_range: str
+    status: str
+    attempts: int
+    last_error: Optional[str]
+    created_at: datetime
+    next_attempt_at: datetime
+    sent_at: Optional[datetime]
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "OutboxMessage":
+        values = list(row)
+        for i in (8, 9, 10):
+            if values[i] is not None:
+                values[i] = datetime.fromisoformat(values[i])
+        return cls(*values)
+
+
+class Outbox:
+    """SQLite-backed queue of messages, kept until they are delivered.
+
+    Messages are queued before anything is sent, so a failed send or a
+    restart never loses them and they can be re-sent without scraping again.
+    A message whose send fails is retried with exponential backoff; after
+    ``max_attempts`` failures it is marked failed and skipped so it does not
+    hold up the rest of its chat. Sent messages are kept for
+    ``sent_retention`` seconds, for inspection, then deleted when the outbox
+    is opened or new messages are queued.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        max_attempts: int = 8,
+        backoff: float = 30.0,
+        max_backoff: float = 3600.0,
+        sent_retention: float = 7 * 86400,
+    ) -> None:
+        """Open the outbox, creating the database if needed.
+
+        Args:
+            path: Optional database location, mainly for testing
+            max_attempts: Failed sends before a message is marked failed
+            backoff: Seconds before the first retry, doubled on every failure
+            max_backoff: Longest wait between two attempts
+            sent_retention: Seconds sent messages are kept before deletion
+        """
+        self.path = path or data_dir() / "outbox.sqlite3"
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sent_retention = sent_retention
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS outbox_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                chat_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                post_count INTEGER NOT NULL,
+                date_range TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                last_error TEXT,
+                created_at TEXT NOT NULL,
+                next_attempt_at TEXT NOT NULL,
+                sent_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_outbox_messages_status_chat
+                ON outbox_messages (status, chat_id, id);
+            """
+        )
+        self.purge_sent()
+
+    def enqueue(self, chat_ids: List[str], messages: List[PackedMessage]) -> List[int]:
+        """Queue messages for delivery to every chat.
+
+        Args:
+            chat_ids: Chats to deliver to
+            messages: Messages in the order they should appear
+
+        Returns:
+            IDs of the queued messages
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        ids = []
+        with self._conn:
+            for chat_id in chat_ids:
+                for message in messages:
+                    cursor = self._conn.execute(
+                        """
+                        INSERT INTO outbox_messages
+                            (chat_id, text, post_count, date_range, status,
+                             created_at, next_attempt_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            chat_id,
+                            message.text,
+                            message.post_count,
+                            message.date_range,
+                            PENDING,
+                            now,
+                            now,
+                        ),
+                    )
+                    ids.append(cursor.lastrowid)
+        self.purge_sent()
+        return ids
+
+    def due(self) -> Dict[str, List[OutboxMessage]]:
+        """Pending messages that may be sent now, grouped by chat.
+
+        A chat's messages are returned in queue order and stop at its first
+        message that is still waiting for a retry, so they never overtake it.
+
+        Returns:
+            Messages to send, keyed by chat ID
+        """
+        now = datetime.now(timezone.utc)
+        rows = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM outbox_messages WHERE status = ? "
+            "ORDER BY chat_id, id",
+            (PENDING,),
+        )
+        batches: Dict[str, List[OutboxMessage]] = {}
+        blocked = set()
+        for row in rows:
+            message = OutboxMessage.from_row(row)
+            if message.chat_id in blocked:
+                continue
+            if message.next_attempt_at > now:
+                blocked.add(message.chat_id)
+                continue
+            batches.setdefault(message.chat_id, []).append(message)
+        return batches
+
+    def mark_sent(self, message_id: int) -> None:
+        """Record a message as delivered."""
+        with self._conn:
+            self._conn.execute(
+                "UPDATE outbox_messages SET status = ?, sent_at = ?, last_error = NULL "
+                "WHERE id = ?",
+                (SENT, datetime.now(timezone.utc).isoformat(), message_id),
+            )
+
+    def mark_attempt_failed(self, message_id: int, error: str) -> str:
+        """Record a failed send and schedule the next attempt.
+
+        Args:
+            message_id: The message that could not be sent
+            error: Why sending failed
+
+        Returns:
+            The new status of the message
+        """
+        row = self._conn.execute(
+            "SELECT attempts FROM outbox_messages WHERE id = ?", (message_id,)
+        ).fetchone()
+        attempts = (row[0] if row else 0) + 1
+        status = FAILED if attempts >= self.max_attempts else PENDING
+        delay = min(self.backoff * 2 ** (attempts - 1), self.max_backoff)
+        next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+        with self._conn:
+            self._conn.execute(
+                """
+                UPDATE outbox_messages
+                SET status = ?, attempts = ?, last_error = ?, next_attempt_at = ?
+                WHERE id = ?
+                """,
+                (status, attempts, error, next_attempt_at.isoformat(), message_id),
+            )
+        return status
+
+    def retry_failed(self) -> int:
+        """Queue the messages that were given up on again.
+
+        Returns:
+            Number of messages queued again
+        """
+        with self._conn:
+            cursor = self._conn.execute(
+                "UPDATE outbox_messages "
+                "SET status = ?, attempts = 0, next_attempt_at = ? "
+                "WHERE status = ?",
+                (PENDING, datetime.now(timezone.utc).isoformat(), FAILED),
+            )
+        return cursor.rowcount
+
+    def purge_sent(self) -> int:
+        """Delete the messages sent longer than ``sent_retention`` ago.
+
+        Returns:
+            Number of messages deleted
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.sent_retention)
+        with self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM outbox_messages WHERE status = ? AND sent_at < ?",
+                (SENT, cutoff.isoformat()),
+            )
+        return cursor.rowcount
+
+    def get(self, message_id: int) -> Optional[OutboxMessage]:
+        """Return a queued message and its status, if it exists."""
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM outbox_messages WHERE id = ?", (message_id,)
+        ).fetchone()
+        return OutboxMessage.from_row(row) if row else None
+
+    def messages(
+        self, status: Optional[str] = None, limit: int = 50
+    ) -> List[OutboxMessage]:
+        """Return the most recently queued messages.
+
+        Args:
+            status: Only return messages with this status
+            limit: Maximum number of messages returned
+
+        Returns:
+            Messages, newest first
+        """
+        query = f"SELECT {_COLUMNS} FROM outbox_messages"
+        params: tuple = ()
+        if status is not None:
+            query += " WHERE status = ?"
+            params = (status,)
+        query += " ORDER BY id DESC LIMIT ?"
+        rows = self._conn.execute(query, (*params, limit))
+        return [OutboxMessage.from_row(row) for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        """Number of messages in each status."""
+        counts = {PENDING: 0, SENT: 0, FAILED: 0}
+        rows = self._conn.execute(
+            "SELECT status, COUNT(*) FROM outbox_messages GROUP BY status"
+        )
+        counts.update(dict(rows))
+        return counts
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,198 @@
+"""Rate-limited, ordered delivery of messages to Telegram chats.
+
+Telegram allows a bot about 30 messages per second overall, one message per
+second in a chat and 20 messages per minute in a group or channel. Going
+over makes it answer 429 with a ``retry_after`` the bot must wait out.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable, Dict, Generic, List, Optional, TypeVar
+
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+T = TypeVar("T")
+
+GLOBAL_RATE = 30.0
+CHAT_RATE = 1.0
+GROUP_RATE = 20 / 60
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second with bursts of ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens, i.e. the largest burst
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - max(self._updated, self._paused_until)
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(now, self._updated)
+
+    async def acquire(self) -> None:
+        """Take a token, waiting until one is available.
+
+        Waiters are served in the order they arrived.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds`` and start empty afterwards."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+
+class TelegramRateLimiter:
+    """Token buckets for Telegram's global and per-chat limits."""
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_RATE,
+        chat_rate: float = CHAT_RATE,
+        group_rate: float = GROUP_RATE,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            global_rate: Messages per second across all chats
+            chat_rate: Messages per second in one chat
+            group_rate: Messages per second in one group or channel
+        """
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self._global = TokenBucket(global_rate)
+        self._chats: Dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def is_group(chat_id: str) -> bool:
+        """Whether a chat ID names a group or channel rather than a user."""
+        return chat_id.startswith(("-", "@"))
+
+    def _chat(self, chat_id: str) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            rate = self.group_rate if self.is_group(chat_id) else self.chat_rate
+            bucket = self._chats[chat_id] = TokenBucket(rate)
+        return bucket
+
+    async def acquire(self, chat_id: str) -> None:
+        """Wait until a message may be sent to a chat."""
+        # The chat's token is taken last so its spacing holds when sending
+        await self._global.acquire()
+        await self._chat(chat_id).acquire()
+
+    def retry_after(self, chat_id: str, seconds: float) -> None:
+        """Hold off sending to a chat after Telegram asked to retry later."""
+        self._chat(chat_id).pause(seconds)
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Seconds to wait from a flood-control error, None for other errors."""
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+    return None
+
+
+class DeliveryPipeline(Generic[T]):
+    """Sends messages to several chats concurrently within the rate limits.
+
+    Each chat has one worker sending its messages in order, so a chat never
+    receives them out of order, while different chats are served in
+    parallel. A message that hits flood control is retried after the
+    ``retry_after`` Telegram asked for. Any other error stops the delivery
+    to that chat, since sending the remaining messages would break their
+    order, and is raised once the other chats are done.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, T], Awaitable[None]],
+        limiter: Optional[TelegramRateLimiter] = None,
+        max_attempts: int = 5,
+        on_failure: Optional[Callable[[str, T, Exception], None]] = None,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            send: Sends one message to a chat
+            limiter: Rate limiter shared by every delivery of the bot
+            max_attempts: Attempts per message before flood control errors
+                are given up on
+            on_failure: Called with the chat, message and error when a
+                message is given up on
+        """
+        self.send = send
+        self.on_failure = on_failure
+        self.limiter = limiter or TelegramRateLimiter()
+        self.max_attempts = max_attempts
+
+    async def deliver(self, batches: Dict[str, List[T]]) -> None:
+        """Send the messages of every chat, in order.
+
+        Args:
+            batches: Messages keyed by chat ID, in the order they should appear
+
+        Raises:
+            Exception: The first error that stopped the delivery to a chat
+        """
+        results = await asyncio.gather(
+            *(
+                self._deliver_to_chat(chat_id, messages)
+                for chat_id, messages in batches.items()
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+    async def _deliver_to_chat(self, chat_id: str, messages: List[T]) -> None:
+        for message in messages:
+            await self._send_with_retry(chat_id, message)
+
+    async def _send_with_retry(self, chat_id: str, message: T) -> None:
+        for attempt in range(1, self.max_attempts + 1):
+            await self.limiter.acquire(chat_id)
+            try:
+                await self.send(chat_id, message)
+                return
+            except Exception as e:
+                seconds = _retry_after_seconds(e)
+                if seconds is None or attempt == self.max_attempts:
+                    logger.error(f"Failed to send to chat {chat_id}: {str(e)}")
+                    if self.on_failure is not None:
+                        self.on_failure(chat_id, message, e)
+                    raise
+                logger.warning(
+                    f"Flood control for chat {chat_id}, retrying in {seconds:g}s "
+                    f"(attempt {attempt}/{self.max_attempts})"
+                )
+                self.limiter.retry_after(chat_id, seconds)
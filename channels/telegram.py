@@ -1,17 +1,34 @@
 """Telegram channel for sending blog post updates."""
 
 import os
+import time
 from collections import defaultdict
 from datetime import date
-from typing import List, Optional
-
-from telegram import Bot
+from typing import TYPE_CHECKING, List, Optional
 
+from channels.message_packer import Day, Entry, MessagePacker, PackedMessage, Section
+from channels.outbox import FAILED, PENDING, SENT, DeliveryReport, Outbox, OutboxMessage
+from channels.rate_limiter import DeliveryPipeline, TelegramRateLimiter
 from scrapers.base_scraper import BlogPost
+from utils import metrics, profiling
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from telegram import Bot
+
 logger = setup_logger(__name__)
 
+SEND_DURATION = metrics.Histogram(
+    "koran_telegram_send_duration_seconds",
+    "Time to send a message to Telegram, by outcome",
+    ["outcome"],
+)
+MESSAGES = metrics.Counter(
+    "koran_telegram_messages_total",
+    "Queued messages, by delivery result (sent, requeued or failed)",
+    ["status"],
+)
+
 # Emoji mapping for different blog sources
 SOURCE_EMOJIS = {
     "Netflix Engineering": "🎬",
@@ -30,12 +47,21 @@ SOURCE_EMOJIS = {
 class TelegramChannel:
     """A channel for sending blog posts via Telegram."""
 
-    def __init__(self, bot: Optional[Bot] = None, dry_run: bool = False) -> None:
+    def __init__(
+        self,
+        bot: Optional["Bot"] = None,
+        dry_run: bool = False,
+        limiter: Optional[TelegramRateLimiter] = None,
+        outbox: Optional[Outbox] = None,
+    ) -> None:
         """Initialize the Telegram channel.
 
         Args:
             bot: Optional Bot instance for testing
             dry_run: If True, print messages instead of sending them
+            limiter: Rate limiter for Telegram's flood limits
+            outbox: Queue of messages waiting to be delivered; defaults to
+                the on-disk outbox, unused in dry-run mode
 
         Raises:
             ValueError: If required environment variables are missing
@@ -51,16 +77,111 @@ class TelegramChannel:
                 "TELEGRAM_BOT_TOKEN and TELEGRAM_CHANNEL_ID environment variables are required"
             )
 
-        self.bot = bot or Bot(token=token)
+        self._token = token
+        self._bot = bot
+        self.packer = MessagePacker()
+        self.outbox = outbox if outbox is not None or dry_run else Outbox()
+        self.pipeline: DeliveryPipeline[OutboxMessage] = DeliveryPipeline(
+            self._send_message, limiter, on_failure=self._record_failure
+        )
+
+    @property
+    def bot(self) -> "Bot":
+        """The Telegram bot, created on first use.
+
+        python-telegram-bot is only imported once a message is actually
+        sent, so dry runs and startup don't pay for it.
+        """
+        if self._bot is None:
+            from telegram import Bot
+
+            self._bot = Bot(token=self._token)
+        return self._bot
 
-    async def send_posts(self, posts: List[BlogPost]) -> None:
+    async def send_posts(
+        self, posts: List[BlogPost], messages: Optional[List[PackedMessage]] = None
+    ) -> Optional[DeliveryReport]:
         """Send multiple blog posts to Telegram, grouped by day.
 
-        Posts are grouped by their publication date and sent as a single message
-        per day, reducing message spam and improving readability.
+        Posts are grouped by their publication date and packed into as few
+        messages as fit Telegram's size limit, reducing message spam and
+        improving readability. Messages are queued in the outbox, then sent as
+        fast as Telegram's rate limits allow, newest day first.
 
         Args:
             posts: List of blog posts to send
+            messages: Messages already rendered from ``posts`` with
+                ``render_messages``, to skip rendering them again
+
+        Returns:
+            How the delivery went; None in dry-run mode. Messages that could
+            not be sent stay queued.
+        """
+        if messages is None:
+            messages = self.render_messages(posts)
+        if self.dry_run:
+            for message in messages:
+                self._print_message(message)
+            return None
+        self.queue_messages(messages)
+        return await self.deliver_queued()
+
+    def queue_messages(self, messages: List[PackedMessage]) -> List[int]:
+        """Queue rendered messages in the outbox for the channel.
+
+        Args:
+            messages: Messages in delivery order
+
+        Returns:
+            IDs of the queued messages
+        """
+        ids = self.outbox.enqueue([self.channel_id], messages)
+        logger.info(f"Queued {len(ids)} messages for delivery")
+        return ids
+
+    async def deliver_queued(self) -> DeliveryReport:
+        """Send the queued messages that are due, including earlier failures.
+
+        An error stops the delivery to its chat and is reported instead of
+        raised; the unsent messages stay queued for a later attempt.
+
+        Returns:
+            The messages sent, and those still queued or given up on
+        """
+        batches = self.outbox.due()
+        before = self.outbox.counts()[SENT]
+        error = None
+        if batches:
+            try:
+                await self.pipeline.deliver(batches)
+            except Exception as e:
+                error = str(e)
+                logger.error(f"Error delivering queued messages: {error}")
+        counts = self.outbox.counts()
+        report = DeliveryReport(
+            sent=counts[SENT] - before,
+            queued=counts[PENDING],
+            failed=counts[FAILED],
+            error=error,
+        )
+        if batches:
+            logger.info(
+                f"Delivered {report.sent} queued messages, {report.queued} still "
+                f"queued, {report.failed} failed"
+            )
+        return report
+
+    def render_messages(self, posts: List[BlogPost]) -> List[PackedMessage]:
+        """Render the messages for a list of posts, newest day first.
+
+        Posts are grouped by day and by source, then packed into as few
+        messages as Telegram's size limit allows.
+
+        Args:
+            posts: List of blog posts to render
+
+        Returns:
+            Messages in delivery order
         """
         # Sort posts by date (newest first)
         sorted_posts = sorted(posts, key=lambda x: x.date, reverse=True)
@@ -71,62 +192,100 @@ class TelegramChannel:
             post_date = post.date.date()
             posts_by_date[post_date].append(post)
 
-        # Send one message per day with all posts from that day
-        for post_date in sorted(posts_by_date.keys(), reverse=True):
-            posts_for_day = posts_by_date[post_date]
-            await self._send_daily_posts(post_date, posts_for_day)
+        days = [
+            self._render_day(post_date, posts_by_date[post_date])
+            for post_date in sorted(posts_by_date.keys(), reverse=True)
+        ]
+        return self.packer.pack(days)
 
-    async def _send_daily_posts(self, post_date: date, posts: List[BlogPost]) -> None:
-        """Send all posts from a specific day as a single message.
-
-        In dry-run mode, prints the message instead of sending it.
+    def _render_day(self, post_date: date, posts: List[BlogPost]) -> Day:
+        """Build the sections listing all posts from a specific day.
 
         Args:
             post_date: The date for these posts
             posts: List of blog posts from this date
-        """
-        # Build message with all posts from this day
-        message_lines = [f"📰 *{post_date.strftime('%b %d, %Y')}*", ""]
 
+        Returns:
+            The day's Markdown header and one section per source
+        """
         # Group by source for better organization
         posts_by_source = defaultdict(list)
         for post in posts:
             posts_by_source[post.source].append(post)
 
-        # Add posts organized by source
+        sections = []
         for source in sorted(posts_by_source.keys()):
-            source_posts = posts_by_source[source]
             emoji = SOURCE_EMOJIS.get(source, "📝")
-            message_lines.append(f"{emoji} *{source}*")
+            sections.append(
+                Section(
+                    header=f"{emoji} *{source}*",
+                    # Bold title with source counter and a short link text
+                    entries=[
+                        Entry(
+                            prefix=f"  *{i}.* ",
+                            title=post.title,
+                            suffix=f"\n      [Read →]({post.url})",
+                        )
+                        for i, post in enumerate(posts_by_source[source], 1)
+                    ],
+                )
+            )
 
-            for i, post in enumerate(source_posts, 1):
-                # Bold title with source counter
-                message_lines.append(f"  *{i}.* {post.title}")
-                # Shorter link text for better formatting
-                message_lines.append(f"      [Read →]({post.url})")
+        return Day(
+            post_date=post_date,
+            header=f"📰 *{post_date.strftime('%b %d, %Y')}*",
+            sections=sections,
+        )
 
-            message_lines.append("")  # Blank line between sources
+    def _print_message(self, message: PackedMessage) -> None:
+        """Print a message instead of sending it (dry run).
 
-        message = "\n".join(message_lines).rstrip()
+        Args:
+            message: The rendered message
+        """
+        print()
+        print(message.text)
+        logger.info(
+            f"DRY-RUN: Would send {message.post_count} posts "
+            f"from {message.date_range} to Telegram"
+        )
 
-        if self.dry_run:
-            # In dry-run mode, print the message
-            print()
-            print(message)
-            logger.info(
-                f"DRY-RUN: Would send {len(posts)} posts from {post_date} to Telegram"
-            )
-        else:
-            # In normal mode, send via Telegram
-            try:
+    async def _send_message(self, chat_id: str, message: OutboxMessage) -> None:
+        """Send a queued message to its chat and mark it sent.
+
+        Args:
+            chat_id: The chat to send to
+            message: The queued message
+        """
+        start = time.perf_counter()
+        try:
+            with profiling.stage("send", source="telegram"):
                 await self.bot.send_message(
-                    chat_id=self.channel_id, text=message, parse_mode="Markdown"
+                    chat_id=chat_id, text=message.text, parse_mode="Markdown"
                 )
-                logger.info(
-                    f"Successfully sent {len(posts)} posts from {post_date} to Telegram"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to send posts from {post_date} to Telegram: {str(e)}"
-                )
-                raise
+        except Exception:
+            SEND_DURATION.observe(time.perf_counter() - start, outcome="error")
+            raise
+        SEND_DURATION.observe(time.perf_counter() - start, outcome="success")
+        MESSAGES.inc(status="sent")
+        self.outbox.mark_sent(message.id)
+        logger.info(
+            f"Successfully sent {message.post_count} posts "
+            f"from {message.date_range} to Telegram"
+        )
+
+    def _record_failure(
+        self, chat_id: str, message: OutboxMessage, error: Exception
+    ) -> None:
+        """Keep a message that could not be sent queued for a later attempt."""
+        status = self.outbox.mark_attempt_failed(message.id, str(error))
+        MESSAGES.inc(status="failed" if status == FAILED else "requeued")
+        if status == FAILED:
+            logger.error(f"Giving up on queued message {message.id} for {chat_id}")
+        else:
+            logger.warning(f"Queued message {message.id} for {chat_id} will be retried")
+
+    def close(self) -> None:
+        """Close the outbox."""
+        if self.outbox is not None:
+            self.outbox.close()
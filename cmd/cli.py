@@ -2,8 +2,11 @@
 
 import os
 from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Optional
 
 from services.koran_service import KoranService
+from utils import profiling
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -23,23 +26,73 @@ def validate_environment() -> bool:
     return True
 
 
-async def run_cli(days: int = 1, dry_run: bool = False) -> None:
+async def run_cli(
+    days: int = 1,
+    dry_run: bool = False,
+    max_concurrency: int = 4,
+    scraper_timeout: Optional[float] = 60.0,
+    cache_ttl: float = 0,
+    sources: Optional[List[str]] = None,
+    profile: bool = False,
+    profile_dir: Optional[Path] = None,
+) -> None:
     """Run the CLI command.
 
     Args:
         days: Number of days to look back for posts
         dry_run: If True, just print posts instead of sending to Telegram
+        max_concurrency: Maximum number of sources scraped at the same time
+        scraper_timeout: Seconds before a single source is given up on
+        cache_ttl: Seconds scraped posts are reused across runs; 0 disables.
+            Stale posts are never served, since a single run can't refresh
+            them in the background.
+        sources: Source IDs to scrape; None scrapes every source
+        profile: If True, time every stage of every source and print a summary;
+            sources are then scraped one at a time so timings can't overlap,
+            and never served from the result cache
+        profile_dir: If set with ``profile``, write a cProfile of every source
     """
     try:
         if not dry_run and not validate_environment():
             return
 
+        profile = profile or profile_dir is not None
+        if profile and max_concurrency != 1:
+            logger.info("Profiling, so scraping one source at a time")
+            max_concurrency = 1
+        if profile and cache_ttl > 0:
+            logger.info("Profiling, so scraping every source instead of using cache")
+            cache_ttl = 0
+
         logger.info("Starting Koran Teknologi CLI...")
-        service = KoranService(dry_run=dry_run)
+        service = KoranService(
+            dry_run=dry_run,
+            max_concurrency=max_concurrency,
+            scraper_timeout=scraper_timeout,
+            cache_ttl=cache_ttl,
+            cache_max_stale=0,
+            sources=sources,
+        )
         since = datetime.now() - timedelta(days=days)
+        profiler = profiling.start_profiling(profile_dir) if profile else None
 
-        posts = await service.fetch_new_posts(since=since)
-        await service.send_posts(posts)
+        try:
+            posts = await service.fetch_new_posts(since=since)
+            result = await service.send_posts(posts)
+            delivery = result.delivery
+            if delivery is not None and not delivery.complete:
+                logger.warning(
+                    f"Sent {delivery.sent} messages; {delivery.queued} are still "
+                    f"queued and {delivery.failed} failed. Queued messages are "
+                    "sent on the next run"
+                )
+        finally:
+            await service.close()
+            if profiler is not None:
+                print(profiler.summary())
+                for path in profiler.write_profiles():
+                    logger.info(f"Wrote profile {path}")
+                profiling.stop_profiling()
 
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
@@ -1,22 +1,65 @@
 """HTTP server handler for Koran Teknologi."""
 
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
+from channels.outbox import DeliveryReport, Outbox, OutboxMessage
 from services.koran_service import KoranService
+from services.scheduler import RefreshScheduler
+from services.single_flight import ServiceBusyError
+from utils import metrics
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
+
+# Seconds a client turned away with 429 is asked to wait before retrying
+RETRY_AFTER_SECONDS = 30
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the refresh scheduler, if configured, while the server is up.
+
+    On shutdown the scheduler is stopped before the service's network
+    resources are closed.
+    """
+    scheduler: Optional[RefreshScheduler] = getattr(app.state, "scheduler", None)
+    if scheduler is not None:
+        await scheduler.start()
+    try:
+        yield
+    finally:
+        if scheduler is not None:
+            await scheduler.stop()
+        if _service is not None:
+            await _service.close()
+
+
 app = FastAPI(
     title="Koran Teknologi API",
     description="API for fetching and sending tech blog posts to Telegram",
     version="1.0.0",
+    lifespan=lifespan,
 )
-service = KoranService()
+
+# Created on first use so importing the app does not load the scrapers
+_service: Optional[KoranService] = None
+_sources: Optional[List[str]] = None
+
+
+def get_service() -> KoranService:
+    """Return the service shared by the endpoints, creating it on first use."""
+    global _service
+    if _service is None:
+        _service = KoranService(sources=_sources)
+    return _service
 
 
 class SendPostsRequest(BaseModel):
@@ -26,6 +69,13 @@ class SendPostsRequest(BaseModel):
     dry_run: Optional[bool] = Field(
         default=False, description="If true, returns posts without sending to Telegram"
     )
+    sources: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Source IDs to fetch from, e.g. ['netflix', 'aws']; "
+            "all enabled sources if omitted"
+        ),
+    )
 
 
 class BlogPostResponse(BaseModel):
@@ -35,10 +85,60 @@ class BlogPostResponse(BaseModel):
     date: datetime
 
 
+class DeliveryResponse(BaseModel):
+    sent: int
+    queued: int
+    failed: int
+    error: Optional[str] = None
+
+
 class SendPostsResponse(BaseModel):
     status: str
     message: str
     posts: Optional[List[BlogPostResponse]] = None
+    delivery: Optional[DeliveryResponse] = None
+
+
+class SourceFreshnessResponse(BaseModel):
+    source: str
+    state: str
+    fetched_at: datetime
+    age_seconds: float
+    posts: int
+    refreshing: bool
+    last_error: Optional[str] = None
+
+
+class BreakerStatusResponse(BaseModel):
+    source: str
+    state: str
+    consecutive_failures: int
+    cooldown_seconds: float
+    retry_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+
+class OutboxMessageResponse(BaseModel):
+    id: int
+    chat_id: str
+    post_count: int
+    date_range: str
+    status: str
+    attempts: int
+    last_error: Optional[str] = None
+    created_at: datetime
+    next_attempt_at: datetime
+    sent_at: Optional[datetime] = None
+
+
+class OutboxResponse(BaseModel):
+    counts: Dict[str, int]
+    messages: List[OutboxMessageResponse]
+
+
+class OutboxRetryResponse(BaseModel):
+    requeued: int
+    delivery: DeliveryResponse
 
 
 class HealthResponse(BaseModel):
@@ -51,17 +151,33 @@ async def send_posts(request: SendPostsRequest) -> SendPostsResponse:
     """Send new tech blog posts to Telegram.
 
     Args:
-        request: SendPostsRequest containing days to look back and dry run flag
+        request: SendPostsRequest containing days to look back, dry run flag
+            and optional source IDs
 
     Returns:
-        JSON response with status and either sent posts confirmation or list of posts for dry run
+        JSON response with status and either the posts queued for delivery,
+        with the number of messages sent, still queued and failed, or the
+        list of posts for a dry run. The status is "partial" if some messages
+        could not be sent yet.
+
+    Concurrent requests share one fetch and posts are delivered only once.
 
     Raises:
-        HTTPException: If there's an error processing the request
+        HTTPException: If there's an error processing the request, with
+            status 400 for unknown sources or an invalid number of days, or
+            with status 429 if too many requests are already waiting
     """
+    service = get_service()
     try:
-        since = datetime.now() - timedelta(days=request.days)
-        posts = await service.fetch_new_posts(since=since)
+        since = _window_start(request.days)
+        service.get_scrapers(request.sources)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400, detail={"status": "error", "message": str(e)}
+        )
+
+    try:
+        posts = await service.fetch_new_posts(since=since, sources=request.sources)
 
         if not posts:
             return SendPostsResponse(
@@ -83,18 +199,44 @@ async def send_posts(request: SendPostsRequest) -> SendPostsResponse:
                 ],
             )
 
-        await service.send_posts(posts)
+        # A concurrent request may have delivered some of the posts already
+        result = await service.send_posts(posts)
+        delivery = result.delivery
+        if not result.posts:
+            return SendPostsResponse(
+                status="success",
+                message="No new posts found",
+                posts=[],
+                delivery=_delivery_response(delivery),
+            )
+        if delivery is None or delivery.complete:
+            status = "success"
+            message = f"Successfully sent {len(result.posts)} posts to Telegram"
+        else:
+            status = "partial"
+            message = (
+                f"Queued {len(result.posts)} posts: {delivery.sent} messages sent, "
+                f"{delivery.queued} waiting for a retry, {delivery.failed} failed"
+            )
         return SendPostsResponse(
-            status="success",
-            message=f"Successfully sent {len(posts)} posts to Telegram",
+            status=status,
+            message=message,
+            delivery=_delivery_response(delivery),
             posts=[
                 BlogPostResponse(
                     title=post.title, source=post.source, url=post.url, date=post.date
                 )
-                for post in posts
+                for post in result.posts
             ],
         )
 
+    except ServiceBusyError as e:
+        logger.warning(f"Rejecting request: {str(e)}")
+        raise HTTPException(
+            status_code=429,
+            detail={"status": "error", "message": str(e)},
+            headers={"Retry-After": str(RETRY_AFTER_SECONDS)},
+        )
     except Exception as e:
         logger.error(f"Error processing request: {str(e)}")
         raise HTTPException(
@@ -102,13 +244,147 @@ async def send_posts(request: SendPostsRequest) -> SendPostsResponse:
         )
 
 
+@app.get("/sources", response_model=List[SourceFreshnessResponse], tags=["system"])
+async def source_freshness() -> List[SourceFreshnessResponse]:
+    """Freshness of the cached posts of each source."""
+    return [
+        SourceFreshnessResponse(**asdict(record))
+        for record in get_service().source_freshness()
+    ]
+
+
+@app.get("/breakers", response_model=List[BreakerStatusResponse], tags=["system"])
+async def breaker_status() -> List[BreakerStatusResponse]:
+    """Circuit breaker state of each source."""
+    return [
+        BreakerStatusResponse(**asdict(status))
+        for status in get_service().breaker_status()
+    ]
+
+
+@app.post(
+    "/breakers/{source}/reset", response_model=BreakerStatusResponse, tags=["system"]
+)
+async def reset_breaker(source: str) -> BreakerStatusResponse:
+    """Close the circuit of a source so it is scraped again right away."""
+    try:
+        return BreakerStatusResponse(**asdict(get_service().reset_breaker(source)))
+    except ValueError as e:
+        raise HTTPException(
+            status_code=404, detail={"status": "error", "message": str(e)}
+        )
+
+
+def _window_start(days: Optional[int]) -> datetime:
+    """Start of a look-back window of ``days`` days from now.
+
+    Raises:
+        ValueError: If days is not a positive number of days
+    """
+    if days is None or days < 1:
+        raise ValueError(f"days must be a positive number, got {days}")
+    try:
+        return datetime.now() - timedelta(days=days)
+    except OverflowError:
+        raise ValueError(f"days is too large: {days}")
+
+
+def _outbox_message_response(message: OutboxMessage) -> OutboxMessageResponse:
+    fields = asdict(message)
+    fields.pop("text")
+    return OutboxMessageResponse(**fields)
+
+
+def _delivery_response(
+    report: Optional[DeliveryReport],
+) -> Optional[DeliveryResponse]:
+    if report is None:
+        return None
+    return DeliveryResponse(**asdict(report))
+
+
+def _outbox() -> Outbox:
+    outbox = get_service().channel.outbox
+    if outbox is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"status": "error", "message": "No outbox in dry-run mode"},
+        )
+    return outbox
+
+
+@app.get("/outbox", response_model=OutboxResponse, tags=["outbox"])
+async def list_outbox(
+    status: Optional[str] = Query(
+        default=None, description="Only list messages with this delivery status"
+    ),
+    limit: int = Query(default=50, ge=1, le=500),
+) -> OutboxResponse:
+    """Delivery status of the most recently queued Telegram messages."""
+    outbox = _outbox()
+    return OutboxResponse(
+        counts=outbox.counts(),
+        messages=[
+            _outbox_message_response(message)
+            for message in outbox.messages(status=status, limit=limit)
+        ],
+    )
+
+
+@app.get("/outbox/{message_id}", response_model=OutboxMessageResponse, tags=["outbox"])
+async def get_outbox_message(message_id: int) -> OutboxMessageResponse:
+    """Delivery status of one queued Telegram message."""
+    message = _outbox().get(message_id)
+    if message is None:
+        raise HTTPException(
+            status_code=404,
+            detail={"status": "error", "message": f"No message {message_id}"},
+        )
+    return _outbox_message_response(message)
+
+
+@app.post("/outbox/retry", response_model=OutboxRetryResponse, tags=["outbox"])
+async def retry_outbox() -> OutboxRetryResponse:
+    """Queue the messages that were given up on again and send what is due."""
+    requeued = _outbox().retry_failed()
+    report = await get_service().flush_outbox()
+    return OutboxRetryResponse(requeued=requeued, delivery=_delivery_response(report))
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["system"])
+async def prometheus_metrics() -> PlainTextResponse:
+    """Scraper, cache and Telegram metrics in the Prometheus text format."""
+    return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+
 @app.get("/health", response_model=HealthResponse, tags=["system"])
 async def health_check() -> HealthResponse:
     """Health check endpoint."""
     return HealthResponse()
 
 
-def run_http(host: str = "0.0.0.0", port: int = 8000) -> None:
-    """Run the HTTP server."""
+def run_http(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    refresh_interval: Optional[float] = None,
+    source_intervals: Optional[Dict[str, float]] = None,
+    sources: Optional[List[str]] = None,
+) -> None:
+    """Run the HTTP server.
+
+    Args:
+        host: Host to listen on
+        port: Port to listen on
+        refresh_interval: If set, refresh every source in the background at
+            this interval in seconds so requests are served from the cache
+        source_intervals: Per-source refresh intervals keyed by source ID
+        sources: Source IDs the server scrapes; None enables every source
+    """
+    global _sources
+    _sources = sources
+    if refresh_interval is not None:
+        app.state.scheduler = RefreshScheduler(
+            get_service(), interval=refresh_interval, source_intervals=source_intervals
+        )
     logger.info(f"Starting Koran Teknologi HTTP server on {host}:{port}...")
     uvicorn.run(app, host=host, port=port, log_level="info")
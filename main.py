@@ -2,16 +2,20 @@
 
 import argparse
 import asyncio
+import atexit
+import os
+import shutil
 import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List
 
 from dotenv import load_dotenv
 
 # Load environment variables BEFORE any other imports
 load_dotenv()
 
-from cmd.cli import run_cli  # noqa: E402
-from cmd.http import run_http  # noqa: E402
-
+from scrapers.registry import SOURCES, resolve_sources  # noqa: E402
 from utils.logger import setup_logger  # noqa: E402
 
 logger = setup_logger(__name__)
@@ -37,6 +41,45 @@ def parse_command() -> argparse.Namespace:
         action="store_true",
         help="Don't send to Telegram, just print posts",
     )
+    cli_parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of sources scraped at the same time (default: 4)",
+    )
+    cli_parser.add_argument(
+        "--scraper-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds before a single source is given up on (default: 60)",
+    )
+    cli_parser.add_argument(
+        "--sources",
+        type=parse_sources,
+        default=None,
+        help="Comma-separated source IDs to scrape, e.g. 'netflix,aws' "
+        f"(default: all of {', '.join(SOURCES)})",
+    )
+    cli_parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=0,
+        help="Seconds posts scraped by an earlier run are reused instead of "
+        "scraping again (default: 0, always scrape)",
+    )
+    cli_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time fetching, parsing, rendering and sending per source, and "
+        "print a summary; scrapes one source at a time and skips the cache",
+    )
+    cli_parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=None,
+        help="Also write a cProfile of every source to this directory as "
+        "<source>.pstats (implies --profile)",
+    )
 
     # HTTP command
     http_parser = subparsers.add_parser("http", help="Run HTTP server")
@@ -51,18 +94,164 @@ def parse_command() -> argparse.Namespace:
         default=8000,
         help="Port to run HTTP server on (default: 8000)",
     )
+    http_parser.add_argument(
+        "--sources",
+        type=parse_sources,
+        default=None,
+        help="Comma-separated source IDs the server scrapes (default: all)",
+    )
+    http_parser.add_argument(
+        "--refresh-interval",
+        type=float,
+        default=None,
+        help="Refresh every source in the background every N seconds "
+        "(default: disabled)",
+    )
+    http_parser.add_argument(
+        "--source-interval",
+        action="append",
+        default=[],
+        metavar="SOURCE=SECONDS",
+        help="Refresh interval of a single source by ID, e.g. 'uber=900' "
+        "(repeatable)",
+    )
+
+    for subparser in (cli_parser, http_parser):
+        add_http_options(subparser)
 
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
         sys.exit(1)
+    replaying = args.replay or os.environ.get("KORAN_HTTP_REPLAY")
+    replay_only = {
+        "--replay-latency": args.replay_latency,
+        "--replay-failure-rate": args.replay_failure_rate,
+        "--replay-seed": args.replay_seed,
+    }
+    used = [option for option, value in replay_only.items() if value is not None]
+    if used and not replaying:
+        parser.error(f"{', '.join(used)} can only be used with --replay")
     return args
 
 
-async def run_async_cli(days: int, dry_run: bool) -> int:
+def add_http_options(parser: argparse.ArgumentParser) -> None:
+    """Add the options that record or replay the scrapers' HTTP traffic."""
+    group = parser.add_argument_group("recording and replay")
+    mode = group.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--record",
+        type=Path,
+        metavar="DIR",
+        help="Save every HTTP response the scrapers receive to DIR",
+    )
+    mode.add_argument(
+        "--replay",
+        type=Path,
+        metavar="DIR",
+        help="Serve HTTP responses recorded with --record from DIR, without "
+        "using the network",
+    )
+    group.add_argument(
+        "--replay-latency",
+        type=parse_per_host,
+        metavar="SECONDS",
+        help="Delay every replayed response, optionally per host, e.g. "
+        "'0.2,eng.lyft.com=5'",
+    )
+    group.add_argument(
+        "--replay-failure-rate",
+        type=parse_per_host,
+        metavar="RATE",
+        help="Share of replayed requests that fail to connect, optionally per "
+        "host, e.g. 'eng.lyft.com=1'",
+    )
+    group.add_argument(
+        "--replay-seed",
+        type=int,
+        help="Seed of the injected failures, for repeatable runs",
+    )
+
+
+def parse_per_host(value: str) -> str:
+    """Validate a number with optional ``host=number`` entries."""
+    from scrapers.http_replay import PerHost
+
+    try:
+        PerHost.parse(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"Expected a number and/or HOST=NUMBER entries, got: {value}"
+        )
+    return value
+
+
+def apply_http_options(args: argparse.Namespace) -> None:
+    """Pass the recording and replay options on to the shared HTTP client.
+
+    A replayed run gets an empty, temporary cache directory, so the result
+    cache, circuit breakers and conditional GET validators of earlier live
+    runs can't change which requests it makes. The post ledger and outbox
+    stay in the data directory, so posts that were already sent are not
+    sent again.
+    """
+    options = {
+        "KORAN_HTTP_RECORD": args.record,
+        "KORAN_HTTP_REPLAY": args.replay,
+        "KORAN_HTTP_LATENCY": args.replay_latency,
+        "KORAN_HTTP_FAILURE_RATE": args.replay_failure_rate,
+        "KORAN_HTTP_SEED": args.replay_seed,
+    }
+    for name, value in options.items():
+        if value is not None:
+            os.environ[name] = str(value)
+
+    if os.environ.get("KORAN_HTTP_REPLAY"):
+        cache_dir = tempfile.mkdtemp(prefix="koran-replay-")
+        atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+        os.environ["KORAN_CACHE_DIR"] = cache_dir
+        logger.info(f"Replaying with an empty cache directory: {cache_dir}")
+
+
+def parse_sources(value: str) -> List[str]:
+    """Parse a comma-separated list of source IDs."""
+    try:
+        return resolve_sources(value.split(","))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def parse_source_intervals(values: List[str]) -> Dict[str, float]:
+    """Parse ``SOURCE=SECONDS`` options into refresh intervals by source ID.
+
+    Raises:
+        ValueError: If an option is malformed or names an unknown source
+    """
+    intervals = {}
+    for value in values:
+        source, sep, seconds = value.rpartition("=")
+        if not sep or not source:
+            raise ValueError(f"Expected SOURCE=SECONDS, got: {value}")
+        (source_id,) = resolve_sources([source])
+        intervals[source_id] = float(seconds)
+    return intervals
+
+
+async def run_async_cli(args: argparse.Namespace) -> int:
     """Run the CLI command asynchronously."""
+    from cmd.cli import run_cli
+
     try:
-        await run_cli(days=days, dry_run=dry_run)
+        await run_cli(
+            days=args.days,
+            dry_run=args.dry_run,
+            max_concurrency=args.max_concurrency,
+            scraper_timeout=args.scraper_timeout,
+            cache_ttl=args.cache_ttl,
+            sources=args.sources,
+            profile=args.profile,
+            profile_dir=args.profile_dir,
+        )
         return 0
     except Exception as e:
         logger.error(f"Fatal error: {str(e)}")
@@ -73,11 +262,21 @@ def main() -> int:
     """Main entry point for the application."""
     try:
         args = parse_command()
+        apply_http_options(args)
 
         if args.command == "cli":
-            return asyncio.run(run_async_cli(args.days, args.dry_run))
+            return asyncio.run(run_async_cli(args))
         elif args.command == "http":
-            run_http(host=args.host, port=args.port)
+            # FastAPI and uvicorn are only imported for the HTTP server
+            from cmd.http import run_http
+
+            run_http(
+                host=args.host,
+                port=args.port,
+                refresh_interval=args.refresh_interval,
+                source_intervals=parse_source_intervals(args.source_interval),
+                sources=args.sources,
+            )
             return 0
 
     except KeyboardInterrupt:
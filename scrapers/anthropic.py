@@ -1,17 +1,19 @@
 """Anthropic Engineering blog scraper."""
 
-import re
-from datetime import datetime, timezone
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
 from scrapers.base_scraper import BaseScraper, BlogPost
+from scrapers.dates import find_date
 
 
 class AnthropicScraper(BaseScraper):
     """Scraper for the Anthropic Engineering blog."""
 
+    parse_only = SoupStrainer("a", href=lambda x: x and "/engineering/" in x)
+
     def __init__(self) -> None:
         """Initialize the Anthropic Engineering blog scraper."""
         super().__init__(
@@ -19,9 +21,15 @@ class AnthropicScraper(BaseScraper):
             source_name="Anthropic Engineering",
         )
 
-    async def fetch_latest_posts(self) -> List[BlogPost]:
+    async def fetch_latest_posts(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[BlogPost]:
         """Fetch latest blog posts from Anthropic Engineering blog.
 
+        Args:
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
+
         Returns:
             A list of BlogPost objects representing the latest posts
         """
@@ -32,77 +40,71 @@ class AnthropicScraper(BaseScraper):
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
             }
-            response = self.session.get(self.base_url, headers=headers, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Find all links to engineering posts
-            links = soup.find_all("a", href=lambda x: x and "/engineering/" in x)
-            self.logger.debug(f"Found {len(links)} engineering links")
-
-            for link in links:
-                try:
-                    # Get title from link text
-                    title_text = link.get_text(strip=True)
-                    if not title_text:
-                        continue
-
-                    # Get URL
-                    url = link.get("href")
-                    if not url:
-                        continue
+            response = await self.fetch(
+                self.base_url, headers=headers, conditional=True
+            )
+            if response.status == 304:
+                return self.cached_posts()
 
-                    # Make URL absolute if relative
-                    if url.startswith("/"):
-                        url = "https://www.anthropic.com" + url
-                    elif not url.startswith("http"):
-                        url = "https://www.anthropic.com/" + url
-
-                    # Extract date from the link's text or parent's text
-                    # Dates are embedded in the text like "Title Mar 25, 2026"
-                    all_text = link.get_text()
-                    parent = link.parent
-                    while parent and not all_text:
-                        all_text = parent.get_text()
-                        parent = parent.parent
-
-                    # Look for date pattern: "Mon DD, YYYY" or "Mon DD YYYY"
-                    date_pattern = r"(January|February|March|April|May|June|July|August|September|October|November|December|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})"
-                    match = re.search(date_pattern, all_text)
-
-                    if not match:
-                        self.logger.debug(
-                            f"No date found for article '{title_text[:60]}'"
-                        )
-                        continue
+            with self.parse_html(response.text) as soup:
+                # Find all links to engineering posts
+                links = soup.find_all("a", href=lambda x: x and "/engineering/" in x)
+                self.logger.debug(f"Found {len(links)} engineering links")
 
-                    # Parse the date
-                    date_str = match.group(0)
-                    # Normalize format: "Mar 25, 2026" or "Mar 25 2026"
-                    date_str = date_str.replace(",", "")
+                for link in links:
+                    if limit is not None and len(posts) >= limit:
+                        break
 
                     try:
-                        pub_date = datetime.strptime(date_str, "%b %d %Y")
-                        pub_date = pub_date.replace(tzinfo=timezone.utc)
-                    except ValueError:
+                        # Get title from link text
+                        title_text = link.get_text(strip=True)
+                        if not title_text:
+                            continue
+
+                        # Get URL
+                        url = link.get("href")
+                        if not url:
+                            continue
+
+                        # Make URL absolute if relative
+                        if url.startswith("/"):
+                            url = "https://www.anthropic.com" + url
+                        elif not url.startswith("http"):
+                            url = "https://www.anthropic.com/" + url
+
+                        # Extract date from the link's text or parent's text
+                        # Dates are embedded in the text like "Title Mar 25, 2026"
+                        all_text = link.get_text()
+                        parent = link.parent
+                        while parent and not all_text:
+                            all_text = parent.get_text()
+                            parent = parent.parent
+
+                        # Look for date pattern: "Mon DD, YYYY" or "Mon DD YYYY"
+                        pub_date = find_date(all_text)
+                        if not pub_date:
+                            self.logger.debug(
+                                f"No date found for article '{title_text[:60]}'"
+                            )
+                            continue
+
+                        if self.is_too_old(pub_date, since):
+                            continue
+
+                        post = BlogPost(
+                            title=title_text,
+                            url=url,
+                            date=pub_date,
+                            source=self.source_name,
+                        )
+                        posts.append(post)
                         self.logger.debug(
-                            f"Could not parse date '{date_str}' for article '{title_text[:60]}'"
+                            f"Successfully parsed post: {title_text[:60]}"
                         )
-                        continue
 
-                    post = BlogPost(
-                        title=title_text,
-                        url=url,
-                        date=pub_date,
-                        source=self.source_name,
-                    )
-                    posts.append(post)
-                    self.logger.debug(f"Successfully parsed post: {title_text[:60]}")
-
-                except (AttributeError, ValueError) as e:
-                    self.logger.warning(f"Error parsing article: {str(e)}")
-                    continue
+                    except (AttributeError, ValueError) as e:
+                        self.logger.warning(f"Error parsing article: {str(e)}")
+                        continue
 
             self.logger.info(
                 f"Successfully fetched {len(posts)} posts from Anthropic Engineering"
@@ -1,16 +1,84 @@
 """Base classes and types for blog scrapers."""
 
+import time
 from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from logging import Logger
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 
+from scrapers.circuit_breaker import CircuitBreaker, CircuitOpenError
+from scrapers.embedded_json import find_embedded_posts
+from scrapers.html_parser import parse_html
+from scrapers.http_cache import ValidatorCache
+from scrapers.http_client import (
+    DEFAULT_USER_AGENT,
+    HttpClient,
+    HttpResponse,
+    StreamResponse,
+    get_http_client,
+)
+from scrapers.page_metadata import PageMetadata, read_page_metadata
+from utils import metrics, profiling
 from utils.logger import setup_logger
 
+SCRAPE_DURATION = metrics.Histogram(
+    "koran_scrape_duration_seconds",
+    "Time to scrape a source, by outcome",
+    ["source", "outcome"],
+)
+HTTP_REQUEST_DURATION = metrics.Histogram(
+    "koran_http_request_duration_seconds",
+    "Time to fetch a response from a source, retries included",
+    ["source"],
+)
+RESPONSE_BYTES = metrics.Histogram(
+    "koran_http_response_bytes",
+    "Size of the response bodies read from a source",
+    ["source"],
+    buckets=metrics.SIZE_BUCKETS,
+)
+PARSE_DURATION = metrics.Histogram(
+    "koran_parse_duration_seconds",
+    "Time spent parsing fetched pages and feeds",
+    ["source"],
+)
+POSTS_SCRAPED = metrics.Counter(
+    "koran_posts_scraped_total", "Posts returned by scrapes", ["source"]
+)
+SCRAPE_ERRORS = metrics.Counter(
+    "koran_scrape_errors_total", "Failed scrapes, by error type", ["source", "error"]
+)
+SCRAPES_SKIPPED = metrics.Counter(
+    "koran_scrapes_skipped_total",
+    "Scrapes skipped because the source's circuit is open",
+    ["source"],
+)
+HTTP_CACHE_REQUESTS = metrics.Counter(
+    "koran_http_cache_requests_total",
+    "Conditional requests, by result (hit when answered 304 Not Modified)",
+    ["source", "result"],
+)
+SCRAPES_IN_FLIGHT = metrics.Gauge(
+    "koran_scrapes_in_flight", "Scrapes currently running", ["source"]
+)
+
 
 @dataclass
 class BlogPost:
@@ -21,16 +89,49 @@ class BlogPost:
     date: datetime
     source: str
 
+    def to_dict(self) -> Dict[str, str]:
+        """Serialize the post to a JSON-compatible dictionary."""
+        return {
+            "title": self.title,
+            "url": self.url,
+            "date": self.date.isoformat(),
+            "source": self.source,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlogPost":
+        """Create a post from a dictionary produced by ``to_dict``."""
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            date=datetime.fromisoformat(data["date"]),
+            source=data["source"],
+        )
+
 
 class BaseScraper(ABC):
     """Base class for all blog scrapers.
 
     Implements common functionality such as:
-    - HTTP session management with retries
+    - Asynchronous HTTP fetching on a shared, pooled client with retries
+    - Conditional GET caching with ETag / Last-Modified validators
+    - Tiered fetching, from cheap strategies to expensive ones
+    - A circuit breaker that skips the source while it keeps failing
+    - Prometheus metrics for fetch and parse latency, bytes, posts and errors
+    - Fetch windows (``since`` cutoff and ``limit``) pushed down to parsing
     - Logging configuration
     - Common interface for fetching posts
+
+    Attributes:
+        source_id: Registry ID of the source (see ``scrapers.registry``),
+            which users select the source by; the source name until
+            ``create_scraper`` sets it
+        parse_only: Strainer restricting HTML parsing to the parts of the page
+            a scraper reads; None parses the whole document
     """
 
+    parse_only: Optional[SoupStrainer] = None
+
     def __init__(self, base_url: str, source_name: str) -> None:
         """Initialize a new scraper instance.
 
@@ -40,28 +141,375 @@ class BaseScraper(ABC):
         """
         self.base_url = base_url
         self.source_name = source_name
+        self.source_id = source_name
         self.logger: Logger = setup_logger(f"scraper.{source_name}")
+        self.http_cache = ValidatorCache(source_name)
+        self.breaker = CircuitBreaker(source_name)
+        self.tier_stats: Counter[str] = Counter()
+        self.last_tier: Optional[str] = None
+        self._window: Tuple[Optional[datetime], Optional[int]] = (None, None)
+
+    @property
+    def http(self) -> HttpClient:
+        """The HTTP client shared by all scrapers."""
+        return get_http_client()
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10,
+        verify_ssl: bool = True,
+        conditional: bool = False,
+    ) -> HttpResponse:
+        """Fetch a URL without blocking the event loop.
+
+        With ``conditional=True`` the request carries the validators of the
+        last successfully parsed response, and the server may answer with
+        status 304. Scrapers should then return ``cached_posts()`` instead of
+        parsing the (empty) body.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers; a browser User-Agent is sent by default
+            timeout: Total timeout in seconds for each attempt
+            verify_ssl: If False, skip TLS certificate verification
+            conditional: If True, send If-None-Match / If-Modified-Since headers
+
+        Returns:
+            The fully read response, possibly with status 304 when conditional
+
+        Raises:
+            HttpError: If the response has an error status code
+            aiohttp.ClientError: If the request fails after all retries
+        """
+        with (
+            profiling.stage("fetch"),
+            HTTP_REQUEST_DURATION.time(source=self.source_name),
+        ):
+            response = await self.http.get(
+                url,
+                headers=self._request_headers(url, headers, conditional),
+                timeout=timeout,
+                verify_ssl=verify_ssl,
+            )
+        RESPONSE_BYTES.observe(len(response.content), source=self.source_name)
+        response.raise_for_status()
+
+        if conditional:
+            self._count_conditional(response.status)
+        if conditional and response.status == 200:
+            self.http_cache.stage(url, response.headers)
+        return response
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10,
+        verify_ssl: bool = True,
+        conditional: bool = False,
+    ) -> AsyncIterator[StreamResponse]:
+        """Fetch a URL and yield the response before its body is read.
+
+        Takes the same arguments as ``fetch``. Leaving the block early stops
+        the download.
+
+        Yields:
+            The response, possibly with status 304 when conditional
+
+        Raises:
+            HttpError: If the response has an error status code
+        """
+        start = time.perf_counter()
+        with profiling.stage("fetch"):
+            async with self.http.stream(
+                url,
+                headers=self._request_headers(url, headers, conditional),
+                timeout=timeout,
+                verify_ssl=verify_ssl,
+            ) as response:
+                # The body is read by the caller, so only the time to headers counts
+                HTTP_REQUEST_DURATION.observe(
+                    time.perf_counter() - start, source=self.source_name
+                )
+                try:
+                    response.raise_for_status()
+                    if conditional:
+                        self._count_conditional(response.status)
+                    if conditional and response.status == 200:
+                        self.http_cache.stage(url, response.headers)
+                    yield response
+                finally:
+                    RESPONSE_BYTES.observe(response.bytes_read, source=self.source_name)
+
+    def _count_conditional(self, status: int) -> None:
+        result = "hit" if status == 304 else "miss"
+        HTTP_CACHE_REQUESTS.inc(source=self.source_name, result=result)
+
+    @contextmanager
+    def parse_html(self, markup: Union[str, bytes]) -> Iterator[BeautifulSoup]:
+        """Parse a page with the scraper's strainer, timing the block.
+
+        The time spent inside the block, parsing included, is recorded as
+        the source's parse latency.
+
+        Args:
+            markup: HTML to parse
+
+        Yields:
+            The parsed document, decomposed when the block exits
+        """
+        start = time.perf_counter()
+        try:
+            with (
+                profiling.stage("parse"),
+                parse_html(markup, parse_only=self.parse_only) as soup,
+            ):
+                yield soup
+        finally:
+            self.observe_parse_time(time.perf_counter() - start)
+
+    def observe_parse_time(self, seconds: float) -> None:
+        """Record time spent parsing, for scrapers that parse incrementally."""
+        PARSE_DURATION.observe(seconds, source=self.source_name)
+
+    def record_timeout(self, timeout: Optional[float]) -> None:
+        """Count a scrape the caller gave up on as a failure.
+
+        Args:
+            timeout: Seconds the scrape was allowed to take
+        """
+        SCRAPE_ERRORS.inc(source=self.source_name, error="TimeoutError")
+        self.breaker.record_failure(f"Timed out after {timeout}s")
+
+    async def fetch_page_metadata(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        until: Optional[Callable[[PageMetadata], bool]] = None,
+        timeout: float = 10,
+    ) -> PageMetadata:
+        """Read JSON-LD and meta tag metadata from the head of a page.
+
+        The page is streamed and the download is aborted once the head has
+        been parsed or ``until`` is satisfied. The time spent parsing is
+        recorded like that of ``parse_html``.
+
+        Args:
+            url: Page to fetch
+            headers: Extra request headers
+            until: Optional predicate that ends reading early when satisfied
+            timeout: Total timeout in seconds for each attempt
 
-        # Configure session with retries
-        self.session = requests.Session()
-        retries = Retry(
-            total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+        Returns:
+            The metadata found in the page head
+        """
+        async with self.stream(url, headers=headers, timeout=timeout) as response:
+            metadata = await read_page_metadata(response, until=until)
+        self.observe_parse_time(metadata.parse_seconds)
+        return metadata
+
+    def _request_headers(
+        self, url: str, headers: Optional[Mapping[str, str]], conditional: bool
+    ) -> Dict[str, str]:
+        """Build request headers with the default User-Agent and validators."""
+        request_headers = {"User-Agent": DEFAULT_USER_AGENT, **(headers or {})}
+        if conditional:
+            request_headers.update(
+                self.http_cache.conditional_headers(url, *self._window)
+            )
+        return request_headers
+
+    def cached_posts(self) -> list[BlogPost]:
+        """Return the posts parsed from the last full response.
+
+        Used when a conditional request was answered with 304 Not Modified.
+        The posts are trimmed to the window of the current fetch.
+        """
+        posts = self.apply_window(
+            [BlogPost.from_dict(post) for post in self.http_cache.load_posts()],
+            *self._window,
         )
-        self.session.mount("http://", HTTPAdapter(max_retries=retries))
-        self.session.mount("https://", HTTPAdapter(max_retries=retries))
+        self.logger.info(f"Not modified, reusing {len(posts)} cached posts")
+        return posts
+
+    @staticmethod
+    def is_too_old(date: datetime, since: Optional[datetime]) -> bool:
+        """Whether a post date falls at or before the ``since`` cutoff."""
+        return since is not None and date <= since
+
+    @classmethod
+    def apply_window(
+        cls,
+        posts: list[BlogPost],
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[BlogPost]:
+        """Drop posts older than ``since`` and keep at most ``limit`` of them."""
+        posts = [post for post in posts if not cls.is_too_old(post.date, since)]
+        return posts if limit is None else posts[:limit]
+
+    async def fetch_tiered(
+        self,
+        tiers: Sequence[Tuple[str, Callable[[], Awaitable[list[BlogPost]]]]],
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> list[BlogPost]:
+        """Try fetch strategies in order until one of them yields posts.
+
+        Errors in all but the last tier are logged and fall through to the
+        next tier; the last tier's errors propagate. The name of the tier
+        that produced the posts is recorded in ``last_tier`` and counted in
+        ``tier_stats``.
+
+        The window is applied only after a tier has been chosen, so a tier
+        that finds the listing but no new posts does not fall through to a
+        more expensive one.
+
+        Args:
+            tiers: (name, strategy) pairs, cheapest first
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
+
+        Returns:
+            The posts of the first tier that found any, trimmed to the window
+        """
+        posts: list[BlogPost] = []
+        for index, (name, strategy) in enumerate(tiers):
+            is_last = index == len(tiers) - 1
+            try:
+                posts = await strategy()
+            except Exception as e:
+                if is_last:
+                    raise
+                self.logger.warning(f"Fetch tier '{name}' failed: {str(e)}")
+                continue
+
+            if posts or is_last:
+                self.last_tier = name
+                self.tier_stats[name] += 1
+                self.logger.info(f"Fetched {len(posts)} posts via tier '{name}'")
+                return self.apply_window(posts, since, limit)
+            self.logger.info(f"Fetch tier '{name}' found no posts, falling back")
+        return posts
+
+    async def fetch_embedded_posts(
+        self,
+        url: str,
+        url_filter: Optional[Callable[[str], bool]] = None,
+    ) -> list[BlogPost]:
+        """Fetch a page over plain HTTP and read posts from its embedded JSON.
+
+        Args:
+            url: Page to fetch
+            url_filter: Optional predicate that post URLs must satisfy
+
+        Returns:
+            Posts found in the page's embedded JSON, possibly empty
+        """
+        response = await self.fetch(url)
+        start = time.perf_counter()
+        with profiling.stage("parse"):
+            embedded = find_embedded_posts(response.text, response.url)
+        self.observe_parse_time(time.perf_counter() - start)
+        return [
+            BlogPost(
+                title=post.title,
+                url=post.url,
+                date=post.date,
+                source=self.source_name,
+            )
+            for post in embedded
+            if url_filter is None or url_filter(post.url)
+        ]
+
+    async def scrape(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> list[BlogPost]:
+        """Fetch the latest posts and update the conditional GET cache.
+
+        This is the entry point used by the service. Validators staged while
+        fetching are only persisted once the scraper has returned its posts,
+        so a failed parse never leaves the cache pointing at posts it does
+        not have. Failures are counted by the source's circuit breaker, and
+        while its circuit is open the source is not contacted at all.
+
+        Args:
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
+
+        Returns:
+            A list of BlogPost objects representing the latest posts
+
+        Raises:
+            CircuitOpenError: If the source is skipped after repeated failures
+        """
+        try:
+            self.breaker.before_call()
+        except CircuitOpenError:
+            SCRAPES_SKIPPED.inc(source=self.source_name)
+            raise
+        self.http_cache.discard()
+        self._window = (since, limit)
+        start = time.perf_counter()
+        outcome = "success"
+        try:
+            with (
+                profiling.profile_source(self.source_name),
+                SCRAPES_IN_FLIGHT.track_inprogress(source=self.source_name),
+            ):
+                posts = await self.fetch_latest_posts(since=since, limit=limit)
+        except Exception as e:
+            outcome = "error"
+            self.http_cache.discard()
+            SCRAPE_ERRORS.inc(source=self.source_name, error=type(e).__name__)
+            self.breaker.record_failure(str(e) or type(e).__name__)
+            raise
+        except BaseException:
+            # Cancelled, e.g. by a timeout the caller reports to the breaker
+            outcome = "cancelled"
+            self.http_cache.discard()
+            self.breaker.release()
+            raise
+        finally:
+            self._window = (None, None)
+            SCRAPE_DURATION.observe(
+                time.perf_counter() - start, source=self.source_name, outcome=outcome
+            )
+
+        self.breaker.record_success()
+        POSTS_SCRAPED.inc(len(posts), source=self.source_name)
+        if self.http_cache.has_staged:
+            self.http_cache.commit([post.to_dict() for post in posts], since, limit)
+        return posts
 
     @abstractmethod
-    async def fetch_latest_posts(self) -> list[BlogPost]:
+    async def fetch_latest_posts(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> list[BlogPost]:
         """Fetch latest blog posts from the source.
 
+        Scrapers should stop parsing and skip per-post work as early as
+        possible once posts fall outside the window.
+
+        Args:
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
+
         Returns:
             A list of BlogPost objects representing the latest posts
 
         Raises:
-            requests.RequestException: If there's an error fetching the posts
+            HttpError: If there's an error fetching the posts
         """
         pass
 
-    def __del__(self) -> None:
-        """Clean up resources by closing the HTTP session."""
-        self.session.close()
+    async def close(self) -> None:
+        """Release resources held by this scraper.
+
+        The shared HTTP client is closed by the owner of the scrapers through
+        ``close_http_client``; subclasses holding their own resources should
+        override this method.
+        """
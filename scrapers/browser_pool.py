@@ -0,0 +1,242 @@
+"""Shared pool of warm headless Chrome browsers for Selenium scrapers."""
+
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Set
+
+from utils import profiling
+from utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+logger = setup_logger(__name__)
+
+
+def _process_tree_rss_mb(root_pid: int) -> float:
+    """Return the resident memory of a process and its descendants in MB.
+
+    Reads ``/proc`` directly, so it only reports memory on Linux and returns
+    0 elsewhere.
+    """
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return 0.0
+
+    children: Dict[int, List[int]] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces, so split after its closing paren
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry.name))
+
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    total = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            resident_pages = int((proc / str(pid) / "statm").read_text().split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        total += resident_pages * page_size
+    return total / (1024 * 1024)
+
+
+class PooledBrowser:
+    """A headless Chrome instance owned by the pool."""
+
+    def __init__(self, driver: "WebDriver") -> None:
+        self.driver = driver
+        self.base_handle = driver.current_window_handle
+        self.pages_served = 0
+
+    def open_tab(self) -> None:
+        """Open a fresh tab and switch the driver to it."""
+        self.driver.switch_to.new_window("tab")
+
+    def close_tab(self) -> None:
+        """Close the current tab and switch back to the base tab."""
+        if self.driver.current_window_handle != self.base_handle:
+            self.driver.close()
+        self.driver.switch_to.window(self.base_handle)
+        self.pages_served += 1
+
+    def memory_mb(self) -> float:
+        """Resident memory of the browser and its helper processes in MB."""
+        process = getattr(self.driver.service, "process", None)
+        if process is None:
+            return 0.0
+        return _process_tree_rss_mb(process.pid)
+
+    def quit(self) -> None:
+        """Shut the browser down."""
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logger.warning(f"Error shutting down browser: {str(e)}")
+
+
+class BrowserPool:
+    """Keeps headless Chrome instances warm and leases them to scrapers.
+
+    A lease has exclusive use of a whole browser, since a WebDriver session
+    can only drive one tab at a time; each lease gets a fresh tab so no page
+    state leaks between scrapers. Browsers are recycled after serving
+    ``max_pages_per_browser`` pages or once their process tree uses more than
+    ``max_memory_mb``, and at most ``max_browsers`` run at the same time.
+
+    Selenium is a blocking API, so callers should run the code that drives the
+    browser in a worker thread, e.g. with ``asyncio.to_thread``.
+    """
+
+    def __init__(
+        self,
+        max_browsers: int = 2,
+        max_pages_per_browser: int = 50,
+        max_memory_mb: float = 1024,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_browsers: Maximum number of browsers running at the same time
+            max_pages_per_browser: Pages a browser serves before it is replaced
+            max_memory_mb: Memory threshold above which a browser is replaced
+        """
+        self.max_browsers = max_browsers
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+        self._idle: List[PooledBrowser] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Shut down browsers whose launch outlived a cancelled lease
+        self._abandoned: Set[asyncio.Task] = set()
+
+    def _launch(self) -> PooledBrowser:
+        """Start a new headless Chrome instance."""
+        # Selenium is only imported once a browser is actually needed
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        logger.info("Launching headless Chrome")
+        return PooledBrowser(webdriver.Chrome(options=options))
+
+    async def _launch_for_lease(self) -> PooledBrowser:
+        """Launch a browser in a worker thread on behalf of a lease.
+
+        The thread can't be stopped, so if the lease is cancelled while the
+        browser starts, it is shut down as soon as the launch completes.
+        """
+        launch = asyncio.ensure_future(asyncio.to_thread(self._launch))
+        try:
+            return await asyncio.shield(launch)
+        except asyncio.CancelledError:
+            task = asyncio.create_task(self._quit_when_launched(launch))
+            self._abandoned.add(task)
+            task.add_done_callback(self._abandoned.discard)
+            raise
+
+    @staticmethod
+    async def _quit_when_launched(launch: "asyncio.Future[PooledBrowser]") -> None:
+        """Shut down a browser launched for a lease that was cancelled."""
+        try:
+            browser = await launch
+        except Exception as e:
+            logger.warning(f"Error launching browser: {str(e)}")
+            return
+        logger.info("Shutting down a browser launched for a cancelled lease")
+        await asyncio.to_thread(browser.quit)
+
+    def _should_recycle(self, browser: PooledBrowser) -> bool:
+        """Whether a browser has served enough pages or grown too large."""
+        if browser.pages_served >= self.max_pages_per_browser:
+            logger.info(f"Recycling browser after {browser.pages_served} pages")
+            return True
+        memory_mb = browser.memory_mb()
+        if memory_mb > self.max_memory_mb:
+            logger.info(f"Recycling browser using {memory_mb:.0f} MB")
+            return True
+        return False
+
+    @asynccontextmanager
+    async def browser(self) -> AsyncIterator["WebDriver"]:
+        """Lease exclusive use of a warm browser.
+
+        If the lease is cancelled, e.g. by a scraper timeout, the worker
+        thread driving the browser can't be stopped and may still be using
+        it, so the browser is shut down instead of being reused. A browser
+        still being launched is shut down once it has started.
+
+        Yields:
+            A WebDriver switched to a fresh tab
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_browsers)
+
+        # Launching the browser is part of rendering the page
+        with profiling.stage("render"):
+            async with self._semaphore:
+                browser = self._idle.pop() if self._idle else None
+                if browser is None:
+                    browser = await self._launch_for_lease()
+
+                # Only reuse the browser if its tab could be opened and closed again;
+                # errors raised by the caller itself don't mean the browser is broken
+                reusable = False
+                try:
+                    await asyncio.to_thread(browser.open_tab)
+                    cancelled = False
+                    try:
+                        yield browser.driver
+                    except asyncio.CancelledError:
+                        cancelled = True
+                        logger.info(
+                            "Browser lease cancelled, shutting the browser down"
+                        )
+                        raise
+                    finally:
+                        if not cancelled:
+                            await asyncio.to_thread(browser.close_tab)
+                            reusable = True
+                finally:
+                    if reusable and not await asyncio.to_thread(
+                        self._should_recycle, browser
+                    ):
+                        self._idle.append(browser)
+                    else:
+                        await asyncio.to_thread(browser.quit)
+
+    async def close(self) -> None:
+        """Shut down all idle browsers and those of cancelled launches."""
+        if self._abandoned:
+            await asyncio.gather(*self._abandoned, return_exceptions=True)
+        browsers, self._idle = self._idle, []
+        for browser in browsers:
+            await asyncio.to_thread(browser.quit)
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the browser pool shared by all Selenium scrapers."""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
+
+
+async def close_browser_pool() -> None:
+    """Shut down the shared browser pool if it has been created."""
+    if _pool is not None:
+        await _pool.close()
@@ -1,102 +1,141 @@
 """ByteByteGo blog scraper implementation."""
 
+import asyncio
 from datetime import datetime
+from typing import TYPE_CHECKING, Optional
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from bs4 import SoupStrainer
 
 from scrapers.base_scraper import BaseScraper, BlogPost
+from scrapers.browser_pool import get_browser_pool
+from scrapers.dates import parse_date
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 
 class ByteByteGoScraper(BaseScraper):
     """Scraper for the ByteByteGo blog."""
 
+    parse_only = SoupStrainer("div", attrs={"role": "article"})
+
     def __init__(self) -> None:
         """Initialize the ByteByteGo blog scraper."""
         super().__init__(
             base_url="https://blog.bytebytego.com/", source_name="ByteByteGo"
         )
 
-    async def fetch_latest_posts(self) -> list[BlogPost]:
-        """Fetch latest blog posts from ByteByteGo."""
-        posts: list[BlogPost] = []
+    async def fetch_latest_posts(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> list[BlogPost]:
+        """Fetch latest blog posts from ByteByteGo.
+
+        Substack preloads the post listing as JSON in the plain HTML page, so
+        that is tried first; the page is only rendered in a browser if it
+        yields nothing.
+
+        Args:
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
+        """
+        return await self.fetch_tiered(
+            [
+                ("embedded_json", self._fetch_from_embedded_json),
+                ("browser", self._fetch_with_browser),
+            ],
+            since=since,
+            limit=limit,
+        )
 
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
+    async def _fetch_from_embedded_json(self) -> list[BlogPost]:
+        """Fetch posts from Substack's preloaded JSON without a browser."""
+        return await self.fetch_embedded_posts(
+            self.base_url, url_filter=lambda url: "/p/" in url
+        )
 
-        driver = webdriver.Chrome(options=options)
-        wait = WebDriverWait(driver, 10)
+    async def _fetch_with_browser(self) -> list[BlogPost]:
+        """Fetch latest blog posts from ByteByteGo using Selenium."""
+        posts: list[BlogPost] = []
 
         try:
-            driver.get(self.base_url)
-
-            # Handle popup if it appears
-            try:
-                close_button = wait.until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "button[data-testid='close-modal']")
-                    )
-                )
-                close_button.click()
-            except Exception as e:
-                self.logger.warning(f"No popup found or couldn't close it: {str(e)}")
-
-            # Wait for articles to load
-            wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='article']"))
-            )
-
-            # Get the page content
-            content = driver.page_source
-            soup = BeautifulSoup(content, "html.parser")
-
-            articles = soup.select("div[role='article']")
-            self.logger.debug(f"Found {len(articles)} articles")
-
-            for article in articles:
-                try:
-                    title_elem = article.select_one(
-                        "a[data-testid='post-preview-title']"
-                    )
-                    if not title_elem:
+            async with get_browser_pool().browser() as driver:
+                content = await asyncio.to_thread(self._render, driver)
+
+            with self.parse_html(content) as soup:
+                articles = soup.select("div[role='article']")
+                self.logger.debug(f"Found {len(articles)} articles")
+
+                for article in articles:
+                    try:
+                        title_elem = article.select_one(
+                            "a[data-testid='post-preview-title']"
+                        )
+                        if not title_elem:
+                            continue
+
+                        title = title_elem.text.strip()
+                        url = title_elem["href"]
+                        if isinstance(url, list):
+                            url = url[0]
+
+                        date_elem = article.select_one("time.date-rtYe1v")
+                        if not date_elem or "datetime" not in date_elem.attrs:
+                            raise ValueError("Article date not found")
+
+                        datetime_str = date_elem["datetime"]
+                        if isinstance(datetime_str, list):
+                            datetime_str = datetime_str[0]
+                        pub_date = parse_date(datetime_str)
+                        if pub_date is None:
+                            raise ValueError(f"Invalid article date: {datetime_str}")
+
+                        post = BlogPost(
+                            title=title,
+                            url=url,
+                            date=pub_date,
+                            source=self.source_name,
+                        )
+                        posts.append(post)
+                    except (AttributeError, KeyError, ValueError) as e:
+                        self.logger.warning(f"Error parsing article: {str(e)}")
                         continue
 
-                    title = title_elem.text.strip()
-                    url = title_elem["href"]
-                    if isinstance(url, list):
-                        url = url[0]
-
-                    date_elem = article.select_one("time.date-rtYe1v")
-                    if not date_elem or "datetime" not in date_elem.attrs:
-                        raise ValueError("Article date not found")
-
-                    datetime_str = date_elem["datetime"]
-                    if isinstance(datetime_str, list):
-                        datetime_str = datetime_str[0]
-                    iso_date = datetime_str.replace("Z", "+00:00")
-
-                    post = BlogPost(
-                        title=title,
-                        url=url,
-                        date=datetime.fromisoformat(iso_date),
-                        source=self.source_name,
-                    )
-                    posts.append(post)
-                except (AttributeError, KeyError, ValueError) as e:
-                    self.logger.warning(f"Error parsing article: {str(e)}")
-                    continue
-
             self.logger.info(f"Successfully fetched {len(posts)} posts")
 
         except Exception as e:
             self.logger.error(f"Error fetching posts: {str(e)}")
             raise
-        finally:
-            driver.quit()
 
         return posts
+
+    def _render(self, driver: "WebDriver") -> str:
+        """Load the blog in a browser and return the rendered HTML.
+
+        Runs in a worker thread since Selenium calls are blocking.
+        """
+        # Selenium is only imported when the browser tier runs
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        wait = WebDriverWait(driver, 10)
+        driver.get(self.base_url)
+
+        # Handle popup if it appears
+        try:
+            close_button = wait.until(
+                EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, "button[data-testid='close-modal']")
+                )
+            )
+            close_button.click()
+        except Exception as e:
+            self.logger.warning(f"No popup found or couldn't close it: {str(e)}")
+
+        # Wait for articles to load
+        wait.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div[role='article']"))
+        )
+
+        # Get the page content
+        return driver.page_source
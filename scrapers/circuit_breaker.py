@@ -0,0 +1,201 @@
+"""Per-source circuit breaker that skips blogs which keep failing."""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.logger import setup_logger
+from utils.storage import cache_dir, read_json, slugify, write_json
+
+logger = setup_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of scraping a source whose circuit is open."""
+
+    def __init__(self, source_name: str, retry_at: float) -> None:
+        retry_time = datetime.fromtimestamp(retry_at, timezone.utc)
+        super().__init__(
+            f"Circuit open for {source_name}, "
+            f"skipping until {retry_time:%Y-%m-%d %H:%M:%S} UTC"
+        )
+        self.source_name = source_name
+        self.retry_at = retry_at
+
+
+@dataclass
+class BreakerStatus:
+    """Snapshot of the circuit breaker of a source."""
+
+    source: str
+    state: str
+    consecutive_failures: int
+    cooldown_seconds: float
+    retry_at: Optional[datetime]
+    last_error: Optional[str]
+
+
+class CircuitBreaker:
+    """Stops scraping a source after repeated failures, until it recovers.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    the source is skipped for ``cooldown`` seconds. Once the cool-down has
+    passed the circuit is half-open: a single scrape probes the source while
+    other calls keep being skipped. A successful probe closes the circuit;
+    a failed one opens it again with the cool-down doubled, up to
+    ``max_cooldown``, so a blog that stays down costs less and less. The
+    state is persisted so that it carries over between CLI runs.
+    """
+
+    def __init__(
+        self,
+        source_name: str,
+        failure_threshold: int = 3,
+        cooldown: float = 600,
+        max_cooldown: float = 86400,
+        path: Optional[Path] = None,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            source_name: Human-readable name of the blog source
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown: Seconds the circuit stays open after it first opens
+            max_cooldown: Longest cool-down after repeated failed probes
+            path: Optional state file location, mainly for testing
+        """
+        self.source_name = source_name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.path = (
+            path or cache_dir() / "circuit_breakers" / f"{slugify(source_name)}.json"
+        )
+        self._data: Optional[Dict[str, Any]] = None
+        self._probing = False
+
+    def _closed(self) -> Dict[str, Any]:
+        return {"state": CLOSED, "failures": 0, "cooldown": self.base_cooldown}
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = self._validate(read_json(self.path, {}))
+        return self._data
+
+    def _validate(self, data: Any) -> Dict[str, Any]:
+        """Fill in missing fields, and reset a state that can't be used.
+
+        The file may have been edited by hand or written by another version,
+        e.g. an open circuit without the time it opened.
+        """
+        if not isinstance(data, dict):
+            data = {}
+        data = {**self._closed(), **data}
+        numbers = ["failures", "cooldown"]
+        if data["state"] == OPEN:
+            numbers.append("opened_at")
+        valid = data["state"] in (CLOSED, OPEN) and all(
+            isinstance(data.get(key), (int, float)) for key in numbers
+        )
+        if not valid:
+            logger.warning(f"Resetting invalid circuit state of {self.source_name}")
+            return self._closed()
+        return data
+
+    def _save(self) -> None:
+        write_json(self.path, self._load())
+
+    @property
+    def state(self) -> str:
+        """The current state, half-open once an open circuit's cool-down ends."""
+        data = self._load()
+        if (
+            data["state"] == OPEN
+            and time.time() >= data["opened_at"] + data["cooldown"]
+        ):
+            return HALF_OPEN
+        return data["state"]
+
+    def before_call(self) -> None:
+        """Check whether the source may be scraped now.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                probe already underway
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        data = self._load()
+        if state == HALF_OPEN and not self._probing:
+            self._probing = True
+            logger.info(f"Probing {self.source_name} after its cool-down")
+            return
+        raise CircuitOpenError(self.source_name, data["opened_at"] + data["cooldown"])
+
+    def release(self) -> None:
+        """End a probe that finished without a verdict, e.g. when cancelled."""
+        self._probing = False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful scrape."""
+        data = self._load()
+        self._probing = False
+        if data["state"] == CLOSED and data["failures"] == 0:
+            return
+        if data["state"] != CLOSED:
+            logger.info(f"Circuit closed for {self.source_name}, source recovered")
+        self._data = self._closed()
+        self._save()
+
+    def record_failure(self, error: str) -> None:
+        """Count a failed scrape and open the circuit when needed.
+
+        Args:
+            error: Why the scrape failed
+        """
+        data = self._load()
+        probe_failed = self._probing or self.state == HALF_OPEN
+        self._probing = False
+        data["failures"] += 1
+        data["last_error"] = error
+
+        if probe_failed:
+            data["cooldown"] = min(data["cooldown"] * 2, self.max_cooldown)
+        if probe_failed or data["failures"] >= self.failure_threshold:
+            data["state"] = OPEN
+            data["opened_at"] = time.time()
+            logger.warning(
+                f"Circuit open for {self.source_name} after {data['failures']} "
+                f"failures, skipping it for {data['cooldown']:g}s"
+            )
+        self._save()
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures."""
+        self._probing = False
+        self._data = self._closed()
+        self._save()
+
+    def status(self) -> BreakerStatus:
+        """Describe the breaker's current state."""
+        data = self._load()
+        retry_at = None
+        if data["state"] == OPEN:
+            retry_at = datetime.fromtimestamp(
+                data["opened_at"] + data["cooldown"], timezone.utc
+            )
+        return BreakerStatus(
+            source=self.source_name,
+            state=self.state,
+            consecutive_failures=data["failures"],
+            cooldown_seconds=data["cooldown"],
+            retry_at=retry_at,
+            last_error=data.get("last_error"),
+        )
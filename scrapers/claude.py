@@ -1,31 +1,52 @@
 """Claude blog scraper implementation."""
 
-import json
-from datetime import datetime, timezone
-from typing import List
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 
 from scrapers.base_scraper import BaseScraper, BlogPost
+from scrapers.dates import parse_date
+from utils.storage import cache_dir, read_json, write_json
 
 
 class ClaudeScraper(BaseScraper):
     """Scraper for the Claude blog."""
 
-    def __init__(self) -> None:
-        """Initialize the Claude blog scraper."""
+    parse_only = SoupStrainer("a", href=lambda x: x and "/blog/" in x)
+
+    def __init__(self, max_concurrent_fetches: int = 5) -> None:
+        """Initialize the Claude blog scraper.
+
+        Args:
+            max_concurrent_fetches: Maximum number of post pages fetched at once
+        """
         super().__init__(
             base_url="https://claude.com/blog/",
             source_name="Claude Blog",
         )
-
-    async def fetch_latest_posts(self) -> List[BlogPost]:
+        self.max_concurrent_fetches = max(1, max_concurrent_fetches)
+        # Post URL -> {"headline", "datePublished"} for the posts on the
+        # listing page; an empty entry marks a page without BlogPosting metadata
+        self._metadata_path = cache_dir() / "claude_post_metadata.json"
+
+    async def fetch_latest_posts(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[BlogPost]:
         """Fetch latest blog posts from Claude blog.
 
         Uses HTML parsing with JSON-LD schema extraction approach.
         Strategy: Extract blog post links from the list page, then fetch
-        each post's JSON-LD BlogPosting schema for metadata.
+        each post's JSON-LD BlogPosting schema for metadata. Metadata is
+        cached on disk, so only newly discovered posts cost a request. The
+        listing leads with featured posts of any age, so every listed post
+        is resolved rather than stopping at the first old ones.
+
+        Args:
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
         """
         posts = []
 
@@ -35,86 +56,65 @@ class ClaudeScraper(BaseScraper):
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             }
-            response = self.session.get(blog_list_url, headers=headers, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, "html.parser")
+            response = await self.fetch(
+                blog_list_url, headers=headers, conditional=True
+            )
+            if response.status == 304:
+                return self.cached_posts()
 
             # Step 2: Extract blog post URLs from links
             post_links = []
-            for a in soup.find_all("a", href=True):
-                href = a.get("href")
-                if href and "/blog/" in href and "/blog/category/" not in href:
-                    # Normalize to full URL
-                    full_url = urljoin("https://claude.com", href)
-                    if full_url not in post_links:
-                        post_links.append(full_url)
+            with self.parse_html(response.content) as soup:
+                for a in soup.find_all("a", href=True):
+                    href = a.get("href")
+                    if "/blog/category/" not in href:
+                        # Normalize to full URL
+                        full_url = urljoin("https://claude.com", href)
+                        if full_url not in post_links:
+                            post_links.append(full_url)
 
             self.logger.debug(f"Found {len(post_links)} blog post links")
 
-            # Step 3: Fetch each post and extract metadata from JSON-LD schema
-            for post_url in post_links:
-                try:
-                    post_response = self.session.get(
-                        post_url, headers=headers, timeout=10
-                    )
-                    post_response.raise_for_status()
-                    post_soup = BeautifulSoup(post_response.content, "html.parser")
-
-                    # Find JSON-LD BlogPosting schema
-                    blog_post_data = None
-                    for script in post_soup.find_all(
-                        "script", type="application/ld+json"
-                    ):
-                        try:
-                            data = json.loads(script.string)
-                            if data.get("@type") == "BlogPosting":
-                                blog_post_data = data
-                                break
-                        except (json.JSONDecodeError, TypeError):
-                            continue
-
-                    if blog_post_data:
-                        # Extract required fields
-                        title = blog_post_data.get("headline", "Unknown Title")
-                        date_str = blog_post_data.get("datePublished", "")
-
-                        # Parse date (format: "Apr 14, 2026" or "April 14, 2026")
-                        if date_str:
-                            try:
-                                # Try parsing "Apr 14, 2026" format
-                                pub_date = datetime.strptime(
-                                    date_str.strip(), "%b %d, %Y"
-                                ).replace(tzinfo=timezone.utc)
-                            except ValueError:
-                                try:
-                                    # Try parsing "April 14, 2026" format
-                                    pub_date = datetime.strptime(
-                                        date_str.strip(), "%B %d, %Y"
-                                    ).replace(tzinfo=timezone.utc)
-                                except ValueError:
-                                    self.logger.warning(
-                                        f"Could not parse date: {date_str} for {title}"
-                                    )
-                                    continue
-                        else:
-                            self.logger.warning(f"No date found for post: {title}")
-                            continue
-
-                        # Create BlogPost object
-                        post = BlogPost(
-                            title=title,
-                            url=post_url,
-                            date=pub_date,
-                            source=self.source_name,
-                        )
-                        posts.append(post)
-                        self.logger.debug(
-                            f"Added post: {title} ({pub_date.strftime('%Y-%m-%d')})"
-                        )
-
-                except Exception as e:
-                    self.logger.debug(f"Error fetching post {post_url}: {str(e)}")
-                    continue
+            # Step 3: Resolve each post's metadata from the local cache, fetching
+            # the JSON-LD of newly discovered posts concurrently in batches
+            metadata = read_json(self._metadata_path, {})
+            known = len(metadata)
+            batch_size = self.max_concurrent_fetches
+
+            missing = [url for url in post_links if url not in metadata]
+            for start in range(0, len(missing), batch_size):
+                batch = missing[start : start + batch_size]
+                results = await asyncio.gather(
+                    *(self._fetch_post_metadata(url, headers) for url in batch)
+                )
+                for url, result in zip(batch, results):
+                    if result is not None:
+                        metadata[url] = result
+
+            listed_posts = [
+                self._post_from_metadata(post_url, metadata.get(post_url))
+                for post_url in post_links
+            ]
+            posts = self.apply_window(
+                sorted(
+                    (post for post in listed_posts if post is not None),
+                    key=lambda post: post.date,
+                    reverse=True,
+                ),
+                since,
+                limit,
+            )
+
+            # Forget posts that have dropped off the listing page so the cache
+            # never outgrows it
+            fetched = len(metadata) - known
+            listed = {url: metadata[url] for url in post_links if url in metadata}
+            if fetched or len(listed) != len(metadata):
+                write_json(self._metadata_path, listed)
+                self.logger.debug(
+                    f"Cached metadata of {fetched} new posts, "
+                    f"dropped {len(metadata) - len(listed)} unlisted posts"
+                )
 
             self.logger.info(f"Successfully fetched {len(posts)} posts")
 
@@ -123,3 +123,76 @@ class ClaudeScraper(BaseScraper):
             raise
 
         return posts
+
+    async def _fetch_post_metadata(
+        self, post_url: str, headers: Dict[str, str]
+    ) -> Optional[Dict[str, str]]:
+        """Read a post's BlogPosting metadata from the head of its page.
+
+        Only the page head is downloaded. If the page has no JSON-LD
+        BlogPosting schema, its OpenGraph title and ``article:published_time``
+        are used instead.
+
+        Args:
+            post_url: URL of the post page
+            headers: Request headers
+
+        Returns:
+            The headline and datePublished of the post, an empty dict if the
+            page has no post metadata, or None if the fetch failed
+        """
+        try:
+            page = await self.fetch_page_metadata(
+                post_url,
+                headers=headers,
+                until=lambda m: m.find_json_ld("BlogPosting") is not None,
+            )
+        except Exception as e:
+            self.logger.debug(f"Error fetching post {post_url}: {str(e)}")
+            return None
+
+        blog_post_data = page.find_json_ld("BlogPosting")
+        if blog_post_data:
+            return {
+                "headline": blog_post_data.get("headline", "Unknown Title"),
+                "datePublished": blog_post_data.get("datePublished", ""),
+            }
+        if page.title and page.published_time:
+            return {"headline": page.title, "datePublished": page.published_time}
+        return {}
+
+    def _post_from_metadata(
+        self, post_url: str, metadata: Optional[Dict[str, str]]
+    ) -> Optional[BlogPost]:
+        """Build a BlogPost from cached post metadata.
+
+        Args:
+            post_url: URL of the post page
+            metadata: The post's headline and datePublished, if known
+
+        Returns:
+            The post, or None if the metadata is missing or has no valid date
+        """
+        if not metadata:
+            return None
+
+        # Extract required fields
+        title = metadata.get("headline") or "Unknown Title"
+        date_str = metadata.get("datePublished", "")
+
+        # Parse date (format: "Apr 14, 2026", "April 14, 2026" or ISO 8601
+        # from article:published_time)
+        if not date_str:
+            self.logger.warning(f"No date found for post: {title}")
+            return None
+        pub_date = parse_date(date_str)
+        if pub_date is None:
+            self.logger.warning(f"Could not parse date: {date_str} for {title}")
+            return None
+
+        return BlogPost(
+            title=title,
+            url=post_url,
+            date=pub_date,
+            source=self.source_name,
+        )
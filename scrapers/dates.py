@@ -0,0 +1,115 @@
+"""Date extraction and parsing shared by all scrapers.
+
+Blogs print publication dates in a handful of formats: "March 11, 2026",
+"Mar 11 2026", "11 MAR 2026", ISO 8601 timestamps in markup and JSON, and
+RFC 2822 dates in RSS feeds. This module recognizes all of them with
+precompiled patterns, memoizes parsed strings (listing pages repeat the
+same dates many times) and always returns timezone-aware UTC datetimes.
+"""
+
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Optional
+
+_MONTHS = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+    "sept": 9,
+}
+_MONTHS.update({name[:3]: number for name, number in list(_MONTHS.items())})
+
+# Full names come first so that "March" is not matched as "Mar" + "ch". Dates
+# are not required to start on a word boundary since get_text() often glues
+# them to the preceding title, e.g. "Post titleMar 25, 2026"
+_MONTH = (
+    r"(?P<month>January|February|March|April|May|June|July|August|September"
+    r"|October|November|December|Sept|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sep|Oct"
+    r"|Nov|Dec)\.?"
+)
+
+DATE_RE = re.compile(
+    rf"{_MONTH}\s+(?P<day>\d{{1,2}}),?\s+(?P<year>\d{{4}})\b", re.IGNORECASE
+)
+"""Matches "Month DD, YYYY" dates with full or abbreviated month names."""
+
+_DAY_FIRST_RE = re.compile(
+    rf"\b(?P<day>\d{{1,2}})\s+{_MONTH},?\s+(?P<year>\d{{4}})\b", re.IGNORECASE
+)
+_DATE_CACHE_SIZE = 4096
+
+
+def to_utc(value: datetime) -> datetime:
+    """Return ``value`` in UTC, treating naive datetimes as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _from_match(match: "re.Match[str]") -> Optional[datetime]:
+    month = _MONTHS[match.group("month").lower()]
+    try:
+        return datetime(
+            int(match.group("year")),
+            month,
+            int(match.group("day")),
+            tzinfo=timezone.utc,
+        )
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
+def parse_date(text: str) -> Optional[datetime]:
+    """Parse a date string in any of the formats used by the blogs.
+
+    Supported formats are month-first and day-first dates with full or
+    abbreviated month names, ISO 8601 and RFC 2822. Results are memoized in
+    a bounded LRU cache.
+
+    Args:
+        text: A string holding only the date
+
+    Returns:
+        The date in UTC, or None if the string is not a valid date
+    """
+    text = text.strip()
+    for pattern in (DATE_RE, _DAY_FIRST_RE):
+        match = pattern.fullmatch(text)
+        if match:
+            return _from_match(match)
+
+    try:
+        return to_utc(datetime.fromisoformat(text.replace("Z", "+00:00")))
+    except ValueError:
+        pass
+    try:
+        return to_utc(parsedate_to_datetime(text))
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+def find_date(text: str) -> Optional[datetime]:
+    """Find the first "Month DD, YYYY" date in a longer text.
+
+    Args:
+        text: Text that may contain a date, e.g. the text of an article card
+
+    Returns:
+        The date in UTC, or None if the text holds no valid date
+    """
+    match = DATE_RE.search(text)
+    if match is None:
+        return None
+    return parse_date(match.group(0))
@@ -0,0 +1,166 @@
+"""Extraction of post listings from JSON embedded in HTML pages.
+
+JavaScript-heavy blogs usually ship the data they render as JSON inside the
+page, e.g. Next.js ``__NEXT_DATA__``, Apollo / Redux state assignments or
+Substack's ``window._preloads``. Reading it directly avoids rendering the
+page in a browser.
+"""
+
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, List, NamedTuple, Optional
+from urllib.parse import urljoin, urlsplit
+
+from scrapers.dates import parse_date
+
+_JSON_SCRIPT_RE = re.compile(
+    r"<script[^>]*type=[\"']application/(?:ld\+)?json[\"'][^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+_STATE_ASSIGNMENT_RE = re.compile(
+    r"window\.(?:__[A-Z_]+__|_preloads)\s*=\s*(JSON\.parse\()?"
+)
+
+_TITLE_KEYS = ("title", "headline", "name")
+_URL_KEYS = ("canonical_url", "url", "link", "permalink", "slug")
+_DATE_KEYS = (
+    "post_date",
+    "datePublished",
+    "published_at",
+    "publishedAt",
+    "publishDate",
+    "date",
+)
+# Dates outside this range are IDs or counters that happen to be numbers
+_EARLIEST_DATE = datetime(1990, 1, 1, tzinfo=timezone.utc)
+_MAX_FUTURE = timedelta(days=2)
+
+
+class EmbeddedPost(NamedTuple):
+    """A post listing found in embedded JSON."""
+
+    title: str
+    url: str
+    date: datetime
+
+
+def extract_embedded_json(html: str) -> List[Any]:
+    """Return every JSON document embedded in an HTML page.
+
+    Args:
+        html: The page markup
+
+    Returns:
+        Decoded documents from JSON script tags and ``window.*`` state
+        assignments, in page order
+    """
+    documents: List[Any] = []
+    for match in _JSON_SCRIPT_RE.finditer(html):
+        try:
+            documents.append(json.loads(match.group(1)))
+        except ValueError:
+            continue
+
+    decoder = json.JSONDecoder()
+    for match in _STATE_ASSIGNMENT_RE.finditer(html):
+        try:
+            value, _ = decoder.raw_decode(html, match.end())
+            # JSON.parse("...") wraps the document in a string literal
+            if match.group(1) and isinstance(value, str):
+                value = json.loads(value)
+        except ValueError:
+            continue
+        documents.append(value)
+    return documents
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    """Parse a date string or a Unix timestamp into a UTC datetime.
+
+    Returns None for values that are not a date, or a date no blog post
+    could have been published at.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Millisecond timestamps are common in JavaScript state
+        seconds = value / 1000 if value > 1e11 else value
+        try:
+            date = datetime.fromtimestamp(seconds, tz=timezone.utc)
+        except (OverflowError, OSError, ValueError):
+            return None
+    elif isinstance(value, str):
+        date = parse_date(value)
+    else:
+        return None
+    if date is None:
+        return None
+    if not _EARLIEST_DATE <= date <= datetime.now(timezone.utc) + _MAX_FUTURE:
+        return None
+    return date
+
+
+def _site(host: str) -> str:
+    """The last two labels of a host name, e.g. ``uber.com``."""
+    return ".".join(host.rsplit(".", 2)[-2:])
+
+
+def _on_site(url: str, page_host: str) -> bool:
+    """True if ``url`` is a web page on the site of ``page_host``."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        return False
+    return _site(parts.hostname) == _site(page_host)
+
+
+def _first(node: dict, keys: tuple) -> Any:
+    for key in keys:
+        value = node.get(key)
+        if value:
+            return value
+    return None
+
+
+def _walk(node: Any) -> Iterator[dict]:
+    """Yield every dictionary in a JSON document, depth first."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            yield current
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
+
+
+def find_embedded_posts(html: str, base_url: str) -> List[EmbeddedPost]:
+    """Find post listings in the JSON embedded in a page.
+
+    Any object carrying a title, a URL (or slug) and a publication date is
+    treated as a post. Links to other sites, e.g. authors' profiles or
+    shared articles, and duplicates by URL are dropped.
+
+    Args:
+        html: The page markup
+        base_url: URL used to resolve relative links and slugs
+
+    Returns:
+        Posts found in the embedded JSON, in page order
+    """
+    posts: List[EmbeddedPost] = []
+    seen: set[str] = set()
+    page_host = urlsplit(base_url).hostname or ""
+
+    for document in extract_embedded_json(html):
+        for node in _walk(document):
+            title = _first(node, _TITLE_KEYS)
+            url = _first(node, _URL_KEYS)
+            date = _parse_date(_first(node, _DATE_KEYS))
+            if not isinstance(title, str) or not isinstance(url, str) or not date:
+                continue
+
+            url = urljoin(base_url, url)
+            if not _on_site(url, page_host) or url in seen:
+                continue
+            seen.add(url)
+            posts.append(EmbeddedPost(title=title.strip(), url=url, date=date))
+    return posts
@@ -0,0 +1,65 @@
+"""HTML parsing backend shared by the HTML scrapers.
+
+BeautifulSoup is only a tree API on top of a pluggable parser. The pure
+Python ``html.parser`` is the slowest of them, so the fastest installed
+backend is picked instead: lxml's C parser when available, falling back to
+``html.parser`` otherwise. Set ``KORAN_HTML_PARSER`` to force a backend.
+
+Scrapers only need a small part of each page, so parsing can be restricted
+to the matching subtrees with a ``SoupStrainer``; everything else is skipped
+by the tree builder instead of being turned into Python objects.
+"""
+
+import importlib.util
+import os
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+_BACKENDS = ("lxml", "html.parser")
+
+
+@lru_cache(maxsize=None)
+def html_backend() -> str:
+    """Return the name of the BeautifulSoup tree builder to use.
+
+    Returns:
+        ``KORAN_HTML_PARSER`` if set, otherwise the first installed backend
+        in order of speed
+    """
+    forced = os.getenv("KORAN_HTML_PARSER")
+    if forced:
+        return forced
+    for backend in _BACKENDS:
+        if backend == "html.parser" or importlib.util.find_spec(backend):
+            return backend
+    return "html.parser"
+
+
+@contextmanager
+def parse_html(
+    markup: Union[str, bytes],
+    parse_only: Optional[SoupStrainer] = None,
+    backend: Optional[str] = None,
+) -> Iterator[BeautifulSoup]:
+    """Parse a page and free its tree once the caller is done with it.
+
+    Values extracted inside the block must be copied out as plain strings
+    (``get_text()``, attribute values); the tree is decomposed on exit.
+
+    Args:
+        markup: The page markup
+        parse_only: Restrict the tree to the elements matching this strainer
+            and their descendants
+        backend: Tree builder to use instead of :func:`html_backend`
+
+    Yields:
+        The parsed document
+    """
+    soup = BeautifulSoup(markup, backend or html_backend(), parse_only=parse_only)
+    try:
+        yield soup
+    finally:
+        soup.decompose()
@@ -0,0 +1,126 @@
+"""Conditional GET cache for scraper requests."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from utils.storage import cache_dir, read_json, slugify, write_json
+
+
+class ValidatorCache:
+    """Persistent ETag / Last-Modified cache for a single source.
+
+    Alongside the validators, the cache keeps the posts parsed from the last
+    full response so that a ``304 Not Modified`` can be answered without
+    downloading or parsing the page again. Validators from new responses are
+    staged first and only written to disk with ``commit`` once the scraper
+    has parsed the page successfully.
+
+    The cached posts may have been cut off at a ``since`` date or a ``limit``.
+    That window is stored with them, and a request for a wider window is
+    sent unconditionally so the cache never hides posts it doesn't have.
+    """
+
+    def __init__(self, source_name: str, path: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            source_name: Human-readable name of the blog source
+            path: Optional cache file location, mainly for testing
+        """
+        self.path = path or cache_dir() / "http_cache" / f"{slugify(source_name)}.json"
+        self._data: Optional[Dict[str, Any]] = None
+        self._staged: Dict[str, Dict[str, str]] = {}
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            self._data = read_json(self.path, {"validators": {}})
+        return self._data
+
+    def _covers(self, since: Optional[datetime], limit: Optional[int]) -> bool:
+        """Whether the cached posts include everything in the given window."""
+        window = self._load().get("window", {})
+        cached_since = window.get("since")
+        cached_limit = window.get("limit")
+        if cached_since is not None and (
+            since is None or since < datetime.fromisoformat(cached_since)
+        ):
+            return False
+        if cached_limit is not None and (limit is None or limit > cached_limit):
+            return False
+        return True
+
+    def conditional_headers(
+        self,
+        url: str,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Return the If-None-Match / If-Modified-Since headers for ``url``.
+
+        No headers are returned unless posts from an earlier response are
+        cached and cover the requested window, since a 304 would otherwise
+        leave nothing (or too little) to return.
+
+        Args:
+            url: The URL about to be requested
+            since: Cutoff date of the current fetch
+            limit: Maximum number of posts of the current fetch
+        """
+        data = self._load()
+        validators = data["validators"].get(url)
+        if not validators or "posts" not in data or not self._covers(since, limit):
+            return {}
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def stage(self, url: str, headers: Mapping[str, str]) -> None:
+        """Remember the validators of a fresh response until ``commit``."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if etag or last_modified:
+            self._staged[url] = {
+                "etag": etag or "",
+                "last_modified": last_modified or "",
+            }
+
+    @property
+    def has_staged(self) -> bool:
+        """Whether validators are waiting to be committed."""
+        return bool(self._staged)
+
+    def load_posts(self) -> List[Dict[str, str]]:
+        """Return the serialized posts parsed from the last full response."""
+        return list(self._load().get("posts", []))
+
+    def commit(
+        self,
+        posts: List[Dict[str, str]],
+        since: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> None:
+        """Persist the staged validators together with the serialized posts.
+
+        Args:
+            posts: Serialized posts parsed from the fresh response
+            since: Cutoff date the posts were fetched with
+            limit: Maximum number of posts they were fetched with
+        """
+        data = self._load()
+        data["validators"].update(self._staged)
+        data["posts"] = posts
+        data["window"] = {
+            "since": since.isoformat() if since else None,
+            "limit": limit,
+        }
+        write_json(self.path, data)
+        self._staged = {}
+
+    def discard(self) -> None:
+        """Drop validators staged by a run that did not complete."""
+        self._staged = {}
@@ -0,0 +1,362 @@
+"""Shared asynchronous HTTP client for blog scrapers."""
+
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from scrapers.http_replay import Cassettes
+
+logger = setup_logger(__name__)
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class HttpError(Exception):
+    """Raised when a response has an error status code."""
+
+    def __init__(self, status: int, url: str) -> None:
+        super().__init__(f"HTTP {status} for url: {url}")
+        self.status = status
+        self.url = url
+
+
+@dataclass
+class HttpResponse:
+    """A fully read HTTP response."""
+
+    url: str
+    status: int
+    headers: Mapping[str, str]
+    content: bytes
+    encoding: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Response body decoded with the charset announced by the server."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def raise_for_status(self) -> None:
+        """Raise HttpError if the response has an error status code."""
+        if self.status >= 400:
+            raise HttpError(self.status, self.url)
+
+
+class StreamResponse:
+    """An HTTP response whose body is read incrementally."""
+
+    def __init__(
+        self, response: aiohttp.ClientResponse, url: Optional[str] = None
+    ) -> None:
+        self._response = response
+        self.url = url or str(response.url)
+        self.status = response.status
+        self.headers: Mapping[str, str] = response.headers
+        self.encoding: Optional[str] = response.charset
+        self.bytes_read = 0
+
+    async def iter_chunks(self, chunk_size: int = 16384) -> AsyncIterator[bytes]:
+        """Yield the response body in chunks of at most ``chunk_size`` bytes.
+
+        Breaking out of the loop early stops the download; the connection is
+        released when the surrounding ``stream()`` block exits.
+        """
+        async for chunk in self._response.content.iter_chunked(chunk_size):
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    async def read(self) -> bytes:
+        """Read the remaining response body."""
+        content = await self._response.read()
+        self.bytes_read += len(content)
+        return content
+
+    def raise_for_status(self) -> None:
+        """Raise HttpError if the response has an error status code."""
+        if self.status >= 400:
+            raise HttpError(self.status, self.url)
+
+
+class HttpClient:
+    """Asynchronous HTTP client backed by one pooled aiohttp session.
+
+    Connections are pooled per host and reused across scrapers. Failed
+    requests are retried with exponential backoff on connection errors and
+    on the status codes in ``status_forcelist``, mirroring the urllib3
+    ``Retry`` policy the scrapers used before.
+
+    Requests to the hosts in ``host_overrides`` are sent to a stand-in
+    server instead, e.g. ``{"eng.lyft.com": "http://127.0.0.1:8765/lyft"}``
+    turns ``https://eng.lyft.com/feed`` into ``http://127.0.0.1:8765/lyft/feed``.
+    Responses still report the original URL, so scrapers behave exactly as
+    they do against the real site.
+
+    With ``cassettes`` in record mode every response is also saved to disk;
+    in replay mode responses are served from disk and the network is never
+    used (see ``scrapers.http_replay``).
+    """
+
+    def __init__(
+        self,
+        limit: int = 20,
+        limit_per_host: int = 4,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+        status_forcelist: frozenset[int] = RETRY_STATUSES,
+        host_overrides: Optional[Mapping[str, str]] = None,
+        cassettes: Optional["Cassettes"] = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            limit: Maximum number of open connections in total
+            limit_per_host: Maximum number of open connections per host
+            retries: Number of retries after the first attempt
+            backoff_factor: Base delay in seconds for exponential backoff
+            status_forcelist: Status codes that trigger a retry
+            host_overrides: Host name -> base URL that requests to it go to
+            cassettes: Optional recorded responses to record to or replay from
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.status_forcelist = status_forcelist
+        self.host_overrides: Dict[str, str] = dict(host_overrides or {})
+        self.cassettes = cassettes
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it for the running event loop.
+
+        A session left over from an earlier event loop, e.g. of a previous
+        ``asyncio.run``, is closed first so its connections don't leak.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            await self._close_stale_session()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._loop = loop
+        return self._session
+
+    async def _close_stale_session(self) -> None:
+        """Close the session of an event loop other than the running one."""
+        session, loop = self._session, self._loop
+        self._session = None
+        self._loop = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # The loop runs in another thread and owns the connections
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        try:
+            await session.close()
+        except RuntimeError as e:
+            # Connections bound to a stopped loop can't be waited for; the
+            # session is still marked closed
+            logger.debug(f"Dropped the session of a stopped event loop: {str(e)}")
+            session.detach()
+
+    def _target_url(self, url: str) -> str:
+        """Return the URL a request is actually sent to."""
+        if not self.host_overrides:
+            return url
+        parts = urlsplit(url)
+        base = self.host_overrides.get(parts.hostname or "")
+        if base is None:
+            return url
+        target = base.rstrip("/") + (parts.path or "/")
+        return f"{target}?{parts.query}" if parts.query else target
+
+    def _backoff(self, attempt: int) -> float:
+        """Return the delay before retry number ``attempt`` (1-based)."""
+        if attempt <= 1:
+            return 0.0
+        return self.backoff_factor * (2 ** (attempt - 1))
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10,
+        verify_ssl: bool = True,
+    ) -> AsyncIterator[StreamResponse]:
+        """Send a GET request and yield the response without reading the body.
+
+        Retries happen before the response is handed out, so the caller only
+        ever sees the final attempt.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout: Total timeout in seconds for each attempt
+            verify_ssl: If False, skip TLS certificate verification
+
+        Yields:
+            The response of the last attempt
+        """
+        if self.cassettes is not None and self.cassettes.replaying:
+            yield await self._replay(self.cassettes, url, timeout)
+            return
+
+        if self.cassettes is not None:
+            headers = self.cassettes.request_headers(headers)
+        session = await self._get_session()
+        target_url = self._target_url(url)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        attempt = 0
+
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await session.get(
+                    target_url,
+                    headers=dict(headers or {}),
+                    timeout=client_timeout,
+                    ssl=None if verify_ssl else False,
+                )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    raise
+                attempt += 1
+                logger.debug(f"Retrying {url} after error: {str(e)}")
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            if response.status in self.status_forcelist and attempt < self.retries:
+                response.release()
+                attempt += 1
+                logger.debug(f"Retrying {url} after HTTP {response.status}")
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+
+            try:
+                if self.cassettes is not None:
+                    yield await self.cassettes.record(url, response, started)
+                else:
+                    yield StreamResponse(
+                        response, url=url if target_url != url else None
+                    )
+            finally:
+                response.release()
+            return
+
+    async def _replay(
+        self, cassettes: "Cassettes", url: str, timeout: float
+    ) -> StreamResponse:
+        """Serve a recorded response, retrying injected failures and timeouts."""
+        attempt = 0
+        while True:
+            try:
+                return await asyncio.wait_for(cassettes.replay(url), timeout)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt >= self.retries:
+                    raise
+                attempt += 1
+                logger.debug(f"Retrying {url} after error: {str(e)}")
+                await asyncio.sleep(self._backoff(attempt))
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 10,
+        verify_ssl: bool = True,
+    ) -> HttpResponse:
+        """Send a GET request and read the whole response body.
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+            timeout: Total timeout in seconds for each attempt
+            verify_ssl: If False, skip TLS certificate verification
+
+        Returns:
+            The fully read response
+        """
+        async with self.stream(
+            url, headers=headers, timeout=timeout, verify_ssl=verify_ssl
+        ) as response:
+            content = await response.read()
+            return HttpResponse(
+                url=response.url,
+                status=response.status,
+                headers=response.headers,
+                content=content,
+                encoding=response.encoding,
+            )
+
+    async def close(self) -> None:
+        """Close the pooled session and all of its connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+_client: Optional[HttpClient] = None
+
+
+def parse_host_overrides(value: str) -> Dict[str, str]:
+    """Parse ``host=base_url`` pairs separated by commas.
+
+    Raises:
+        ValueError: If a pair is malformed
+    """
+    overrides = {}
+    for pair in value.split(","):
+        if not pair.strip():
+            continue
+        host, sep, base = pair.partition("=")
+        if not sep or not host.strip() or not base.strip():
+            raise ValueError(f"Expected HOST=BASE_URL, got: {pair}")
+        overrides[host.strip()] = base.strip()
+    return overrides
+
+
+def get_http_client() -> HttpClient:
+    """Return the HTTP client shared by all scrapers.
+
+    Host overrides can be set with the ``KORAN_HOST_OVERRIDES`` environment
+    variable, e.g. to run against the stand-in server of the benchmarks, and
+    recording or replaying responses with the variables read by
+    ``Cassettes.from_env``.
+    """
+    global _client
+    if _client is None:
+        from scrapers.http_replay import Cassettes
+
+        _client = HttpClient(
+            host_overrides=parse_host_overrides(
+                os.environ.get("KORAN_HOST_OVERRIDES", "")
+            ),
+            cassettes=Cassettes.from_env(),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client if it has been created."""
+    if _client is not None:
+        await _client.close()
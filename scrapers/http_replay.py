@@ -0,0 +1,305 @@
+"""Record and replay of HTTP responses for offline, reproducible runs.
+
+In record mode every response the shared HTTP client receives is saved to
+a gzip-compressed cassette file, one per URL. In replay mode responses are
+served from those cassettes and nothing is sent over the network, so a
+whole run can be repeated exactly, e.g. to profile it or to debug a
+scraper. Replay can inject latency and connection failures, overall or per
+host, to simulate slow or broken sources.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from scrapers.http_client import StreamResponse
+from utils.logger import setup_logger
+from utils.storage import slugify
+
+logger = setup_logger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+
+# The body is saved decoded, so these would no longer describe it
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding"}
+)
+# Conditional request headers; recording with them could save a bodiless 304
+_VALIDATOR_HEADERS = frozenset({"if-none-match", "if-modified-since"})
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode for a URL that has not been recorded."""
+
+    def __init__(self, url: str, path: Path) -> None:
+        super().__init__(f"No recorded response for {url} (expected {path})")
+        self.url = url
+        self.path = path
+
+
+class InjectedFailure(aiohttp.ClientConnectionError):
+    """A connection failure injected while replaying."""
+
+
+class PerHost:
+    """A number with optional per-host values, e.g. ``0.2,eng.lyft.com=5``.
+
+    Entries without a host set the default for every other host.
+    """
+
+    def __init__(
+        self, default: float = 0.0, hosts: Optional[Dict[str, float]] = None
+    ) -> None:
+        self.default = default
+        self.hosts = dict(hosts or {})
+
+    @classmethod
+    def parse(cls, value: str) -> "PerHost":
+        """Parse a comma-separated default and ``host=value`` entries.
+
+        Raises:
+            ValueError: If a value is not a number
+        """
+        spec = cls()
+        for entry in value.split(","):
+            host, sep, number = entry.strip().rpartition("=")
+            if not number:
+                continue
+            if sep:
+                spec.hosts[host.strip()] = float(number)
+            else:
+                spec.default = float(number)
+        return spec
+
+    def for_url(self, url: str) -> float:
+        """The value for the host of ``url``."""
+        return self.hosts.get(urlsplit(url).hostname or "", self.default)
+
+
+@dataclass
+class Recording:
+    """A recorded response."""
+
+    url: str
+    status: int
+    headers: List[Tuple[str, str]]
+    encoding: Optional[str]
+    body: bytes
+    elapsed: float
+    recorded_at: float
+
+
+class ReplayResponse(StreamResponse):
+    """A response served from a recording instead of the network."""
+
+    def __init__(self, recording: Recording) -> None:
+        self._body = recording.body
+        self._position = 0
+        self.url = recording.url
+        self.status = recording.status
+        self.headers: Mapping[str, str] = CIMultiDictProxy(
+            CIMultiDict(recording.headers)
+        )
+        self.encoding = recording.encoding
+        self.bytes_read = 0
+
+    async def iter_chunks(self, chunk_size: int = 16384) -> AsyncIterator[bytes]:
+        """Yield the recorded body in chunks of at most ``chunk_size`` bytes."""
+        while self._position < len(self._body):
+            chunk = self._body[self._position : self._position + chunk_size]
+            self._position += len(chunk)
+            self.bytes_read += len(chunk)
+            yield chunk
+
+    async def read(self) -> bytes:
+        """Read the remaining recorded body."""
+        content = self._body[self._position :]
+        self._position = len(self._body)
+        self.bytes_read += len(content)
+        return content
+
+
+class Cassettes:
+    """A directory of recorded responses, one gzip file per URL.
+
+    A cassette file holds a JSON header line followed by the raw response
+    body. Files are grouped by host and named after the URL path plus a
+    hash of the full URL, so they are easy to find and edit.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        mode: str,
+        latency: Optional[PerHost] = None,
+        failure_rate: Optional[PerHost] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """Initialize the cassettes.
+
+        Args:
+            directory: Where cassettes are written to or read from
+            mode: ``record`` or ``replay``
+            latency: Seconds added before each replayed response
+            failure_rate: Share of replayed requests that fail to connect
+            seed: Seed of the failure injection, for repeatable runs
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown HTTP cassette mode: {mode}")
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency or PerHost()
+        self.failure_rate = failure_rate or PerHost()
+        self._random = random.Random(seed)
+
+    @property
+    def replaying(self) -> bool:
+        """True if responses are served from the cassettes."""
+        return self.mode == REPLAY
+
+    @classmethod
+    def from_env(cls) -> Optional["Cassettes"]:
+        """Configure cassettes from the environment, if enabled.
+
+        ``KORAN_HTTP_RECORD`` or ``KORAN_HTTP_REPLAY`` name the cassette
+        directory. Replay also reads ``KORAN_HTTP_LATENCY`` and
+        ``KORAN_HTTP_FAILURE_RATE`` (``PerHost`` values) and
+        ``KORAN_HTTP_SEED``.
+        """
+        record = os.environ.get("KORAN_HTTP_RECORD")
+        replay = os.environ.get("KORAN_HTTP_REPLAY")
+        if record and replay:
+            raise ValueError("Set only one of KORAN_HTTP_RECORD and KORAN_HTTP_REPLAY")
+        if not record and not replay:
+            return None
+        seed = os.environ.get("KORAN_HTTP_SEED")
+        return cls(
+            Path(record or replay),
+            RECORD if record else REPLAY,
+            latency=PerHost.parse(os.environ.get("KORAN_HTTP_LATENCY", "")),
+            failure_rate=PerHost.parse(os.environ.get("KORAN_HTTP_FAILURE_RATE", "")),
+            seed=int(seed) if seed else None,
+        )
+
+    def request_headers(self, headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+        """The headers to send for a request that is being recorded.
+
+        Cassettes are keyed by URL only, so conditional headers are dropped
+        and every recording holds the full response.
+        """
+        return {
+            name: value
+            for name, value in (headers or {}).items()
+            if name.lower() not in _VALIDATOR_HEADERS
+        }
+
+    def path(self, url: str) -> Path:
+        """The cassette file of a URL."""
+        parts = urlsplit(url)
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+        name = slugify(parts.path)[:60] or "index"
+        return self.directory / slugify(parts.netloc) / f"{name}-{digest}.gz"
+
+    async def record(
+        self, url: str, response: aiohttp.ClientResponse, started: float
+    ) -> ReplayResponse:
+        """Read a response in full and save it to its cassette.
+
+        Args:
+            url: The URL that was requested
+            response: The response, with its body not read yet
+            started: ``time.perf_counter()`` when the request was sent
+
+        Returns:
+            The response to hand to the caller in place of ``response``
+        """
+        recording = Recording(
+            url=url,
+            status=response.status,
+            headers=[
+                (name, value)
+                for name, value in response.headers.items()
+                if name.lower() not in _DROPPED_HEADERS
+            ],
+            encoding=response.charset,
+            body=await response.read(),
+            elapsed=time.perf_counter() - started,
+            recorded_at=time.time(),
+        )
+        await asyncio.to_thread(self._save, recording)
+        return ReplayResponse(recording)
+
+    async def replay(self, url: str) -> ReplayResponse:
+        """Serve the recorded response of a URL, after any injected latency.
+
+        Raises:
+            InjectedFailure: If a connection failure is injected
+            CassetteMissError: If the URL has not been recorded
+        """
+        latency = self.latency.for_url(url)
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if self._random.random() < self.failure_rate.for_url(url):
+            raise InjectedFailure(f"Injected connection failure for {url}")
+
+        path = self.path(url)
+        recording = await asyncio.to_thread(self._load, path)
+        if recording is None:
+            raise CassetteMissError(url, path)
+        return ReplayResponse(recording)
+
+    def _save(self, recording: Recording) -> None:
+        path = self.path(recording.url)
+        if recording.status == 304 and path.exists():
+            logger.debug(f"Keeping the recorded response of {recording.url} over a 304")
+            return
+        path.parent.mkdir(exist_ok=True, parents=True)
+        header = {
+            "url": recording.url,
+            "status": recording.status,
+            "headers": recording.headers,
+            "encoding": recording.encoding,
+            "elapsed": recording.elapsed,
+            "recorded_at": recording.recorded_at,
+        }
+        # Write next to the cassette first so a replay never reads half a file
+        tmp_path = path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(recording.body)
+        os.replace(tmp_path, path)
+        logger.debug(f"Recorded {recording.url} to {path}")
+
+    @staticmethod
+    def _load(path: Path) -> Optional[Recording]:
+        try:
+            with gzip.open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        header_line, _, body = data.partition(b"\n")
+        header = json.loads(header_line)
+        return Recording(
+            url=header["url"],
+            status=header["status"],
+            headers=[tuple(pair) for pair in header["headers"]],
+            encoding=header["encoding"],
+            body=body,
+            elapsed=header["elapsed"],
+            recorded_at=header["recorded_at"],
+        )
@@ -0,0 +1,134 @@
+"""Streaming extraction of article metadata from the head of HTML pages.
+
+Post metadata (JSON-LD, OpenGraph and ``article:*`` meta tags) lives in the
+``<head>`` of a page, so there is no need to download or parse the body.
+The extractor feeds the response to an incremental parser as it arrives and
+stops the download as soon as the head has been read or the caller has what
+it needs.
+"""
+
+import codecs
+import json
+import time
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Any, Callable, Dict, List, Optional
+
+from scrapers.http_client import StreamResponse
+from utils import profiling
+
+
+@dataclass
+class PageMetadata:
+    """Metadata read from the head of an HTML page."""
+
+    json_ld: List[Dict[str, Any]] = field(default_factory=list)
+    meta: Dict[str, str] = field(default_factory=dict)
+    bytes_read: int = 0
+    # Time spent parsing, excluding the time waiting for the network
+    parse_seconds: float = 0.0
+
+    def find_json_ld(self, schema_type: str) -> Optional[Dict[str, Any]]:
+        """Return the first JSON-LD object of the given ``@type``, if any."""
+        for data in self.json_ld:
+            if data.get("@type") == schema_type:
+                return data
+            for node in data.get("@graph", []):
+                if isinstance(node, dict) and node.get("@type") == schema_type:
+                    return node
+        return None
+
+    @property
+    def title(self) -> Optional[str]:
+        """The OpenGraph title of the page."""
+        return self.meta.get("og:title")
+
+    @property
+    def published_time(self) -> Optional[str]:
+        """The ``article:published_time`` of the page."""
+        return self.meta.get("article:published_time")
+
+
+class _HeadParser(HTMLParser):
+    """Collects JSON-LD scripts and meta tags until the head ends."""
+
+    def __init__(self, metadata: PageMetadata) -> None:
+        super().__init__(convert_charrefs=True)
+        self.metadata = metadata
+        self.head_done = False
+        self._script_parts: Optional[List[str]] = None
+
+    def handle_starttag(self, tag: str, attrs: List[tuple]) -> None:
+        attributes = dict(attrs)
+        if tag == "body":
+            self.head_done = True
+        elif tag == "meta":
+            key = attributes.get("property") or attributes.get("name")
+            content = attributes.get("content")
+            if key and content is not None:
+                self.metadata.meta.setdefault(key, content)
+        elif tag == "script" and attributes.get("type") == "application/ld+json":
+            self._script_parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "head":
+            self.head_done = True
+        elif tag == "script" and self._script_parts is not None:
+            try:
+                data = json.loads("".join(self._script_parts))
+            except ValueError:
+                data = None
+            if isinstance(data, dict):
+                self.metadata.json_ld.append(data)
+            elif isinstance(data, list):
+                self.metadata.json_ld.extend(d for d in data if isinstance(d, dict))
+            self._script_parts = None
+
+    def handle_data(self, data: str) -> None:
+        if self._script_parts is not None:
+            self._script_parts.append(data)
+
+
+async def read_page_metadata(
+    response: StreamResponse,
+    until: Optional[Callable[[PageMetadata], bool]] = None,
+    chunk_size: int = 8192,
+) -> PageMetadata:
+    """Read metadata from a streaming response, stopping as early as possible.
+
+    Reading stops once the ``<head>`` has been parsed or ``until`` returns
+    True for the metadata collected so far. The caller should then leave the
+    ``stream()`` block, which aborts the rest of the download.
+
+    Args:
+        response: A response whose body has not been read yet
+        until: Optional predicate that ends reading early when satisfied
+        chunk_size: Size of the chunks read from the network
+
+    Returns:
+        The collected metadata
+    """
+    metadata = PageMetadata()
+    parser = _HeadParser(metadata)
+    try:
+        decoder_class = codecs.getincrementaldecoder(response.encoding or "utf-8")
+    except LookupError:
+        decoder_class = codecs.getincrementaldecoder("utf-8")
+    decoder = decoder_class(errors="replace")
+
+    async for chunk in response.iter_chunks(chunk_size):
+        metadata.bytes_read += len(chunk)
+        start = time.perf_counter()
+        with profiling.stage("parse"):
+            parser.feed(decoder.decode(chunk))
+        metadata.parse_seconds += time.perf_counter() - start
+        if parser.head_done or (until is not None and until(metadata)):
+            break
+    else:
+        start = time.perf_counter()
+        with profiling.stage("parse"):
+            parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+        metadata.parse_seconds += time.perf_counter() - start
+
+    return metadata
@@ -0,0 +1,76 @@
+"""Registry of the available blog sources, loaded on first use.
+
+Scraper modules pull in heavy dependencies (Selenium for the browser based
+ones), so they are only imported when a source is actually selected.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Type
+
+if TYPE_CHECKING:
+    from scrapers.base_scraper import BaseScraper
+
+# Source IDs in delivery order, mapped to "module:ClassName"
+SOURCES: Dict[str, str] = {
+    "uber": "scrapers.uber:UberScraper",
+    "netflix": "scrapers.netflix:NetflixScraper",
+    "airbnb": "scrapers.airbnb:AirbnbScraper",
+    "bytebytego": "scrapers.bytebytego:ByteByteGoScraper",
+    "aws": "scrapers.aws:AWSArchitectureScraper",
+    "lyft": "scrapers.lyft:LyftScraper",
+    "anthropic": "scrapers.anthropic:AnthropicScraper",
+    "github": "scrapers.github:GitHubAIScraper",
+    "google_research": "scrapers.google_research:GoogleResearchScraper",
+    "claude": "scrapers.claude:ClaudeScraper",
+}
+
+
+def resolve_sources(sources: Optional[Iterable[str]] = None) -> List[str]:
+    """Validate and normalize a selection of source IDs.
+
+    Args:
+        sources: Source IDs, case-insensitive; None selects every source
+
+    Returns:
+        The selected source IDs in registry order
+
+    Raises:
+        ValueError: If a source ID is unknown
+    """
+    if sources is None:
+        return list(SOURCES)
+    selected = {source.strip().lower() for source in sources if source.strip()}
+    unknown = selected - SOURCES.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown sources: {', '.join(sorted(unknown))}. "
+            f"Available: {', '.join(SOURCES)}"
+        )
+    return [source for source in SOURCES if source in selected]
+
+
+def load_scraper_class(source: str) -> Type["BaseScraper"]:
+    """Import and return the scraper class of a source.
+
+    Args:
+        source: Source ID
+
+    Returns:
+        The scraper class
+    """
+    module_name, class_name = SOURCES[source].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def create_scraper(source: str) -> "BaseScraper":
+    """Instantiate the scraper of a source.
+
+    Args:
+        source: Source ID
+
+    Returns:
+        A new scraper instance, with its ``source_id`` set
+    """
+    scraper = load_scraper_class(source)()
+    scraper.source_id = source
+    return scraper
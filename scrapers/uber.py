@@ -1,20 +1,25 @@
 """Uber Engineering blog scraper implementation."""
 
-from datetime import datetime, timezone
-from typing import List
+import asyncio
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+from bs4 import BeautifulSoup, SoupStrainer
 
 from scrapers.base_scraper import BaseScraper, BlogPost
+from scrapers.browser_pool import get_browser_pool
+from scrapers.dates import DATE_RE, parse_date
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 
 class UberScraper(BaseScraper):
     """Scraper for the Uber Engineering blog."""
 
+    # Links outside of any div never have a date, so only divs are parsed
+    parse_only = SoupStrainer("div")
+
     def __init__(self) -> None:
         """Initialize the Uber blog scraper."""
         super().__init__(
@@ -22,7 +27,34 @@ class UberScraper(BaseScraper):
             source_name="Uber Engineering",
         )
 
-    async def fetch_latest_posts(self) -> List[BlogPost]:
+    async def fetch_latest_posts(
+        self, since: Optional[datetime] = None, limit: Optional[int] = None
+    ) -> List[BlogPost]:
+        """Fetch latest blog posts from Uber Engineering.
+
+        The post listing is read from the JSON embedded in the plain HTML page
+        first; the page is only rendered in a browser if that finds nothing.
+
+        Args:
+            since: Only return posts newer than this date
+            limit: Maximum number of posts to return
+        """
+        return await self.fetch_tiered(
+            [
+                ("embedded_json", self._fetch_from_embedded_json),
+                ("browser", self._fetch_with_browser),
+            ],
+            since=since,
+            limit=limit,
+        )
+
+    async def _fetch_from_embedded_json(self) -> List[BlogPost]:
+        """Fetch posts from the page's embedded JSON without a browser."""
+        return await self.fetch_embedded_posts(
+            self.base_url, url_filter=lambda url: "/blog/" in url
+        )
+
+    async def _fetch_with_browser(self) -> List[BlogPost]:
         """Fetch latest blog posts from Uber Engineering using Selenium.
 
         Note: Uber's engineering blog is a JavaScript-heavy site, so we use
@@ -30,110 +62,11 @@ class UberScraper(BaseScraper):
         """
         posts: List[BlogPost] = []
 
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-
-        driver = webdriver.Chrome(options=options)
-        wait = WebDriverWait(driver, 15)
-
         try:
-            driver.get(self.base_url)
-            self.logger.info(f"Navigated to {self.base_url}")
-
-            # Wait for article cards to be present
-            wait.until(
-                EC.presence_of_all_elements_located(
-                    (By.CSS_SELECTOR, "a[href*='blog/']")
-                )
-            )
-
-            # Get the rendered page content
-            content = driver.page_source
-            soup = BeautifulSoup(content, "html.parser")
-
-            # Find all article cards - look for divs that contain article links with dates
-            for link in soup.find_all("a", href=True):
-                try:
-                    href = link.get("href", "")
-
-                    # Filter for blog post URLs
-                    if not href or "/blog/" not in href:
-                        continue
-                    if not href.startswith("http"):
-                        href = f"https://www.uber.com{href}"
-
-                    title = link.get_text(strip=True)
-                    if not title or len(title) < 10:
-                        continue
-
-                    # Find the parent container and look for date
-                    container = link.find_parent("div")
-                    date_elem = None
-
-                    # Search up the tree for a date element
-                    while container and not date_elem:
-                        date_elem = container.find(
-                            lambda tag: tag.name == "div"
-                            and (
-                                any(
-                                    month in tag.get_text()
-                                    for month in [
-                                        "January",
-                                        "February",
-                                        "March",
-                                        "April",
-                                        "May",
-                                        "June",
-                                        "July",
-                                        "August",
-                                        "September",
-                                        "October",
-                                        "November",
-                                        "December",
-                                    ]
-                                )
-                                or any(f"{i} " in tag.get_text() for i in range(1, 32))
-                            )
-                        )
-                        container = container.find_parent("div")
-
-                    if not date_elem:
-                        self.logger.debug(f"No date found for: {title[:40]}")
-                        continue
-
-                    date_str = date_elem.get_text(strip=True)
-                    try:
-                        # Parse dates like "March 11, 2026" and make timezone-aware (UTC)
-                        pub_date = datetime.strptime(date_str, "%B %d, %Y").replace(
-                            tzinfo=timezone.utc
-                        )
-                    except ValueError:
-                        self.logger.debug(f"Could not parse date: {date_str}")
-                        continue
-
-                    posts.append(
-                        BlogPost(
-                            title=title,
-                            url=href,
-                            date=pub_date,
-                            source=self.source_name,
-                        )
-                    )
-                    self.logger.debug(f"Found post: {title}")
-
-                except (AttributeError, KeyError, ValueError) as e:
-                    self.logger.debug(f"Error parsing article: {str(e)}")
-                    continue
-
-            # Remove duplicates based on URL
-            unique_posts = {}
-            for post in posts:
-                if post.url not in unique_posts:
-                    unique_posts[post.url] = post
+            async with get_browser_pool().browser() as driver:
+                content = await asyncio.to_thread(self._render, driver)
 
-            posts = list(unique_posts.values())
+            posts = self.parse_posts(content)
 
             self.logger.info(
                 f"Successfully fetched {len(posts)} posts from Uber Engineering"
@@ -142,7 +75,131 @@ class UberScraper(BaseScraper):
         except Exception as e:
             self.logger.error(f"Error fetching Uber Engineering posts: {str(e)}")
             raise
-        finally:
-            driver.quit()
 
         return posts
+
+    def _render(self, driver: "WebDriver") -> str:
+        """Load the blog in a browser and return the rendered HTML.
+
+        Runs in a worker thread since Selenium calls are blocking.
+        """
+        # Selenium is only imported when the browser tier runs
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        driver.get(self.base_url)
+        self.logger.info(f"Navigated to {self.base_url}")
+
+        # Wait for article cards to be present
+        WebDriverWait(driver, 15).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "a[href*='blog/']"))
+        )
+
+        # Get the rendered page content
+        return driver.page_source
+
+    def parse_posts(self, html: str) -> List[BlogPost]:
+        """Parse blog posts from the rendered blog page.
+
+        Dates are found in linear time: a single pass over the text nodes
+        indexes the divs that hold a date, and every link then takes the
+        date of its nearest indexed ancestor.
+
+        Args:
+            html: The rendered page markup
+
+        Returns:
+            Posts found on the page, deduplicated by URL
+        """
+        with self.parse_html(html) as soup:
+            return self.extract_posts(soup)
+
+    def extract_posts(self, soup: BeautifulSoup) -> List[BlogPost]:
+        """Extract blog posts from an already parsed blog page.
+
+        Args:
+            soup: The parsed page
+
+        Returns:
+            Posts found on the page, deduplicated by URL
+        """
+        dates_by_container = self._index_dates(soup)
+        posts: Dict[str, BlogPost] = {}
+
+        # Find all article cards - look for divs that contain article links with dates
+        for link in soup.find_all("a", href=True):
+            try:
+                href = link.get("href", "")
+
+                # Filter for blog post URLs
+                if not href or "/blog/" not in href:
+                    continue
+                if not href.startswith("http"):
+                    href = f"https://www.uber.com{href}"
+                if href in posts:
+                    continue
+
+                title = link.get_text(strip=True)
+                if not title or len(title) < 10:
+                    continue
+
+                # Take the date of the nearest container that holds one
+                container = link.find_parent("div")
+                while container is not None and id(container) not in dates_by_container:
+                    container = container.find_parent("div")
+                pub_date = dates_by_container.get(id(container))
+
+                if pub_date is None:
+                    self.logger.debug(f"No date found for: {title[:40]}")
+                    continue
+
+                posts[href] = BlogPost(
+                    title=title,
+                    url=href,
+                    date=pub_date,
+                    source=self.source_name,
+                )
+                self.logger.debug(f"Found post: {title}")
+
+            except (AttributeError, KeyError, ValueError) as e:
+                self.logger.debug(f"Error parsing article: {str(e)}")
+                continue
+
+        return list(posts.values())
+
+    @staticmethod
+    def _index_dates(soup: BeautifulSoup) -> Dict[int, Optional[datetime]]:
+        """Map every div that contains a date to that date.
+
+        Divs containing more than one date are listings rather than article
+        cards and map to None, so links outside any card (navigation, footer)
+        don't pick up the date of an unrelated post. Each ancestor is updated
+        at most twice, so the index is built in time linear in the page size.
+
+        Args:
+            soup: The parsed page
+
+        Returns:
+            Dates, or None for listings, keyed by ``id()`` of the divs
+        """
+        dates_by_container: Dict[int, Optional[datetime]] = {}
+        for text in soup.find_all(string=DATE_RE):
+            date_elem = text.find_parent("div")
+            # Only text nodes holding nothing but a date like "March 11, 2026"
+            pub_date = parse_date(text)
+            if date_elem is None or pub_date is None:
+                continue
+
+            container = date_elem.find_parent("div")
+            while container is not None:
+                key = id(container)
+                if key not in dates_by_container:
+                    dates_by_container[key] = pub_date
+                elif dates_by_container[key] is None:
+                    # Everything above is already marked as a listing
+                    break
+                else:
+                    dates_by_container[key] = None
+                container = container.find_parent("div")
+        return dates_by_container
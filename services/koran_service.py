@@ -1,96 +1,383 @@
 """Service layer for Koran Teknologi."""
 
+import asyncio
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
+from channels.message_packer import PackedMessage
+from channels.outbox import DeliveryReport
 from channels.telegram import TelegramChannel
-from scrapers.airbnb import AirbnbScraper
-from scrapers.anthropic import AnthropicScraper
-from scrapers.aws import AWSArchitectureScraper
-from scrapers.base_scraper import BlogPost
-from scrapers.bytebytego import ByteByteGoScraper
-from scrapers.claude import ClaudeScraper
-from scrapers.github import GitHubAIScraper
-from scrapers.google_research import GoogleResearchScraper
-from scrapers.lyft import LyftScraper
-from scrapers.netflix import NetflixScraper
-from scrapers.uber import UberScraper
+from scrapers.base_scraper import BaseScraper, BlogPost
+from scrapers.browser_pool import close_browser_pool
+from scrapers.circuit_breaker import BreakerStatus, CircuitOpenError
+from scrapers.http_client import close_http_client
+from scrapers.registry import create_scraper, resolve_sources
+from services.post_ledger import PostLedger
+from services.result_cache import ResultCache, SourceFreshness
+from services.single_flight import SingleFlight
 from utils.logger import setup_logger
+from utils.storage import cache_dir
 
 logger = setup_logger(__name__)
 
 
+@dataclass
+class Digest:
+    """New posts and their rendered messages, prepared ahead of delivery."""
+
+    since: datetime
+    posts: List[BlogPost]
+    messages: List[PackedMessage]
+    generated_at: datetime
+
+
+@dataclass
+class SendResult:
+    """New posts handed to the channel and how their delivery went."""
+
+    posts: List[BlogPost]
+    # None in dry-run mode, where nothing is delivered
+    delivery: Optional[DeliveryReport] = None
+
+
 class KoranService:
     """Service class that orchestrates blog fetching and distribution."""
 
-    def __init__(self, dry_run: bool = False):
-        self.scrapers = [
-            UberScraper(),
-            NetflixScraper(),
-            AirbnbScraper(),
-            ByteByteGoScraper(),
-            AWSArchitectureScraper(),
-            LyftScraper(),
-            AnthropicScraper(),
-            GitHubAIScraper(),
-            GoogleResearchScraper(),
-            ClaudeScraper(),
-        ]
+    def __init__(
+        self,
+        dry_run: bool = False,
+        max_concurrency: int = 4,
+        scraper_timeout: Optional[float] = 60.0,
+        ledger: Optional[PostLedger] = None,
+        cache_ttl: float = 300,
+        cache_max_stale: float = 3600,
+        max_waiting_requests: int = 4,
+        sources: Optional[Iterable[str]] = None,
+    ):
+        """Initialize the service.
+
+        Args:
+            dry_run: If True, print messages instead of sending them
+            max_concurrency: Maximum number of scrapers running at the same time.
+                Use 1 to fetch sources one after another.
+            scraper_timeout: Seconds a single scraper may take before its
+                results are dropped. None disables the timeout.
+            ledger: Record of delivered posts; defaults to the on-disk ledger
+            cache_ttl: Seconds scraped posts are served from the cache before
+                they are refreshed in the background. Zero disables the cache.
+            cache_max_stale: Seconds past ``cache_ttl`` cached posts are still
+                served while they are refreshed. Zero only serves fresh posts.
+            max_waiting_requests: Fetches that may queue behind a running
+                fetch they cannot share before callers are turned away
+            sources: IDs of the sources to scrape (see ``scrapers.registry``);
+                None selects every source. Scrapers are loaded on first use.
+
+        Raises:
+            ValueError: If a source ID is unknown
+        """
+        self.sources = resolve_sources(sources)
+        self._scrapers: Dict[str, BaseScraper] = {}
         self.channel = TelegramChannel(dry_run=dry_run)
         self.dry_run = dry_run
+        self.max_concurrency = max(1, max_concurrency)
+        self.scraper_timeout = scraper_timeout
+        self.ledger = ledger or PostLedger()
+        self.result_cache = ResultCache(
+            ttl=cache_ttl,
+            max_stale=cache_max_stale,
+            path=cache_dir() / "result_cache.json",
+        )
+        self.digest: Optional[Digest] = None
+        self._fetches = SingleFlight(max_waiting=max_waiting_requests)
+        self._send_lock = asyncio.Lock()
+
+    @property
+    def scrapers(self) -> List[BaseScraper]:
+        """The scrapers of every configured source."""
+        return self.get_scrapers()
+
+    def get_scrapers(
+        self, sources: Optional[Iterable[str]] = None
+    ) -> List[BaseScraper]:
+        """Return the scrapers of the given sources, loading them on first use.
+
+        Args:
+            sources: Source IDs; None selects every configured source
+
+        Returns:
+            The scrapers, in registry order
+
+        Raises:
+            ValueError: If a source is unknown or not configured
+        """
+        selected = self.sources if sources is None else resolve_sources(sources)
+        missing = set(selected) - set(self.sources)
+        if missing:
+            raise ValueError(f"Sources not enabled: {', '.join(sorted(missing))}")
+        for source in selected:
+            if source not in self._scrapers:
+                self._scrapers[source] = create_scraper(source)
+        return [self._scrapers[source] for source in selected]
 
-    async def fetch_new_posts(self, since: Optional[datetime] = None) -> List[BlogPost]:
-        """Fetch new posts from all configured scrapers.
+    async def fetch_new_posts(
+        self,
+        since: Optional[datetime] = None,
+        sources: Optional[Iterable[str]] = None,
+    ) -> List[BlogPost]:
+        """Fetch new posts from the configured scrapers.
 
         Args:
             since: Only return posts newer than this date. Defaults to 24h ago.
+            sources: Only fetch from these source IDs. Defaults to all
+                configured sources.
+
+        Posts that were already delivered in an earlier run are left out,
+        regardless of how far back ``since`` reaches. Concurrent calls share
+        one fetch when their windows overlap.
 
         Returns:
             List of new blog posts
+
+        Raises:
+            ServiceBusyError: If too many calls are already queued behind a
+                running fetch
+            ValueError: If a source is unknown or not configured
         """
         if since is None:
             since = datetime.now(timezone.utc) - timedelta(days=1)
         elif since.tzinfo is None:
             since = since.replace(tzinfo=timezone.utc)
 
+        scrapers = self.get_scrapers(sources)
+        names = None
+        if sources is not None:
+            names = frozenset(scraper.source_name for scraper in scrapers)
+        return await self._fetches.run(
+            since, lambda window: self._fetch_all(window, scrapers), sources=names
+        )
+
+    async def _fetch_all(
+        self, since: datetime, scrapers: List[BaseScraper]
+    ) -> List[BlogPost]:
+        """Fetch undelivered posts newer than ``since`` from the scrapers."""
         logger.info(f"Starting blog check since {since}...")
-        all_posts = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        results = await asyncio.gather(
+            *(
+                self._fetch_from_scraper(scraper, since, semaphore)
+                for scraper in scrapers
+            )
+        )
+        all_posts = self.ledger.filter_undelivered(
+            post for posts in results for post in posts
+        )
+
+        return sorted(all_posts, key=lambda x: x.date, reverse=True)
+
+    async def _fetch_from_scraper(
+        self, scraper: BaseScraper, since: datetime, semaphore: asyncio.Semaphore
+    ) -> List[BlogPost]:
+        """Fetch new posts from a single scraper, isolating its failures.
+
+        Posts are served from the result cache when possible. Errors and
+        timeouts are logged and yield an empty list so that one broken source
+        never affects the results of the others.
+
+        Args:
+            scraper: The scraper to run
+            since: Only return posts newer than this date
+            semaphore: Limits how many scrapers run at the same time
+
+        Returns:
+            List of new blog posts from this scraper
+        """
+        try:
+            new_posts = await self.result_cache.get(
+                scraper.source_id,
+                since,
+                lambda window: self._scrape(scraper, window, semaphore),
+            )
+        except asyncio.TimeoutError:
+            logger.error(
+                f"Timed out after {self.scraper_timeout}s fetching posts "
+                f"from {scraper.source_name}"
+            )
+            return []
+        except CircuitOpenError as e:
+            logger.info(str(e))
+            return []
+        except Exception as e:
+            logger.error(f"Error fetching posts from {scraper.source_name}: {str(e)}")
+            return []
+
+        if new_posts:
+            logger.info(f"Found {len(new_posts)} new posts from {scraper.source_name}")
+        else:
+            logger.info(f"No new posts from {scraper.source_name}")
+        return new_posts
+
+    async def _scrape(
+        self, scraper: BaseScraper, since: datetime, semaphore: asyncio.Semaphore
+    ) -> List[BlogPost]:
+        """Run a scraper with the concurrency limit and timeout applied.
+
+        Args:
+            scraper: The scraper to run
+            since: Only return posts newer than this date
+            semaphore: Limits how many scrapers run at the same time
 
-        for scraper in self.scrapers:
+        Returns:
+            List of blog posts newer than ``since``
+        """
+        async with semaphore:
+            logger.info(f"Fetching posts from {scraper.source_name}")
             try:
-                logger.info(f"Fetching posts from {scraper.source_name}")
-                posts = await scraper.fetch_latest_posts()
-                new_posts = [p for p in posts if p.date > since]
-
-                if new_posts:
-                    logger.info(
-                        f"Found {len(new_posts)} new posts from {scraper.source_name}"
-                    )
-                    all_posts.extend(new_posts)
-                else:
-                    logger.info(f"No new posts from {scraper.source_name}")
-
-            except Exception as e:
-                logger.error(
-                    f"Error fetching posts from {scraper.source_name}: {str(e)}"
+                posts = await asyncio.wait_for(
+                    scraper.scrape(since=since), timeout=self.scraper_timeout
                 )
+            except asyncio.TimeoutError:
+                scraper.record_timeout(self.scraper_timeout)
+                raise
+        # Scrapers apply the cutoff themselves; keep this as a safety net
+        return [p for p in posts if p.date > since]
 
-        return sorted(all_posts, key=lambda x: x.date, reverse=True)
+    async def refresh_source(
+        self, scraper: BaseScraper, since: datetime, semaphore: asyncio.Semaphore
+    ) -> None:
+        """Scrape a source now and update its cached posts.
+
+        Args:
+            scraper: The scraper to run
+            since: Refresh posts newer than this date
+            semaphore: Limits how many scrapers run at the same time
+        """
+        await self.result_cache.refresh(
+            scraper.source_id,
+            since,
+            lambda window: self._scrape(scraper, window, semaphore),
+        )
+
+    async def prepare_digest(self, since: datetime) -> Digest:
+        """Collect the new posts and render their messages ahead of time.
+
+        ``send_posts`` reuses the rendered messages when it is asked to send
+        exactly the posts of the digest.
+
+        Args:
+            since: Only include posts newer than this date
+
+        Returns:
+            The prepared digest, also kept as ``self.digest``
+        """
+        posts = await self.fetch_new_posts(since=since)
+        self.digest = Digest(
+            since=since,
+            posts=posts,
+            messages=self.channel.render_messages(posts),
+            generated_at=datetime.now(timezone.utc),
+        )
+        logger.info(f"Prepared digest of {len(posts)} posts")
+        return self.digest
+
+    def source_freshness(self) -> List[SourceFreshness]:
+        """Describe how current the cached posts of each source are.
+
+        Sources are identified by their ID; cached entries of sources that
+        are not configured are left out.
+        """
+        return [
+            record
+            for record in self.result_cache.freshness()
+            if record.source in self.sources
+        ]
+
+    def breaker_status(self) -> List[BreakerStatus]:
+        """Describe the circuit breaker of each configured source, by ID."""
+        return [
+            replace(scraper.breaker.status(), source=scraper.source_id)
+            for scraper in self.scrapers
+        ]
 
-    async def send_posts(self, posts: List[BlogPost]) -> None:
+    def reset_breaker(self, source: str) -> BreakerStatus:
+        """Close the circuit of a source so it is scraped again right away.
+
+        Args:
+            source: Source ID
+
+        Returns:
+            The breaker's new status
+
+        Raises:
+            ValueError: If the source is unknown or not configured
+        """
+        (scraper,) = self.get_scrapers([source])
+        scraper.breaker.reset()
+        return replace(scraper.breaker.status(), source=scraper.source_id)
+
+    async def send_posts(self, posts: List[BlogPost]) -> SendResult:
         """Send posts to the configured notification channel.
 
-        In dry-run mode, messages are printed instead of sent.
+        In dry-run mode, messages are printed instead of sent. Otherwise they
+        are queued in the channel's outbox, which keeps them until Telegram
+        accepts them, and the posts are recorded as delivered before sending
+        starts. Messages still queued from earlier runs are sent too.
+        Deliveries are serialized and posts delivered in the meantime, e.g.
+        by a concurrent request that fetched the same posts, are skipped.
 
         Args:
             posts: List of posts to send
+
+        Returns:
+            The posts that were sent or queued for delivery, and the outcome
+            of delivering the queued messages
         """
-        if not posts:
-            logger.info("No new posts to send")
-            return
+        async with self._send_lock:
+            posts = self.ledger.filter_undelivered(posts)
+            if not posts:
+                logger.info("No new posts to send")
+            else:
+                logger.info(f"Processing {len(posts)} new posts")
+                digest = self.digest
+                messages = digest.messages if digest and digest.posts == posts else None
+                if messages is None:
+                    messages = self.channel.render_messages(posts)
 
-        try:
-            logger.info(f"Processing {len(posts)} new posts")
-            await self.channel.send_posts(posts)
-        except Exception as e:
-            logger.error(f"Error processing posts: {str(e)}")
+                if self.dry_run:
+                    await self.channel.send_posts(posts, messages=messages)
+                    return SendResult(posts)
+                self.channel.queue_messages(messages)
+                # The outbox delivers them from now on, even across restarts
+                self.ledger.mark_delivered(posts)
+                # The digest may now list delivered posts
+                self.digest = None
+
+            if self.dry_run:
+                return SendResult(posts)
+            return SendResult(posts, await self.channel.deliver_queued())
+
+    async def flush_outbox(self) -> DeliveryReport:
+        """Send the messages still queued in the outbox, e.g. after failures.
+
+        Returns:
+            The messages sent, and those still queued or given up on
+        """
+        if self.dry_run:
+            return DeliveryReport()
+        async with self._send_lock:
+            return await self.channel.deliver_queued()
+
+    async def close(self) -> None:
+        """Release scraper resources, the shared HTTP client and browsers.
+
+        Background cache refreshes are awaited first so their results are
+        kept for the next run.
+        """
+        await self.result_cache.close()
+        for scraper in self._scrapers.values():
+            await scraper.close()
+        await close_http_client()
+        await close_browser_pool()
+        self.ledger.close()
+        self.channel.close()
@@ -0,0 +1,137 @@
+"""Persistent ledger of delivered blog posts."""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from scrapers.base_scraper import BlogPost
+from utils.storage import data_dir
+
+# SQLite limits the number of bound parameters per statement
+_QUERY_CHUNK_SIZE = 500
+# Query parameters added by feeds and share links that don't identify a post
+_TRACKING_PARAMS = frozenset({"source", "gi", "ref"})
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a post URL so that trivially different links compare equal.
+
+    Lowercases the scheme and host, drops ``www.``, fragments, tracking query
+    parameters and trailing slashes.
+
+    Args:
+        url: The URL to normalize
+
+    Returns:
+        The normalized URL used as the ledger key
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+            and key.lower() not in _TRACKING_PARAMS
+        )
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower() or "https", host, path, query, ""))
+
+
+class PostLedger:
+    """SQLite-backed record of every post that has been delivered.
+
+    Posts are keyed by their normalized URL (the primary key gives O(log n)
+    lookups) and indexed by source and publication date.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Open the ledger, creating the database if needed.
+
+        Args:
+            path: Optional database location, mainly for testing
+        """
+        self.path = path or data_dir() / "ledger.sqlite3"
+        self._conn = sqlite3.connect(self.path)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS delivered_posts (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                source TEXT NOT NULL,
+                title TEXT NOT NULL,
+                published_at TEXT NOT NULL,
+                delivered_at TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_delivered_posts_source_date
+                ON delivered_posts (source, published_at);
+            """
+        )
+
+    def _delivered_keys(self, keys: List[str]) -> set[str]:
+        """Return the subset of ``keys`` that is already in the ledger."""
+        delivered: set[str] = set()
+        for start in range(0, len(keys), _QUERY_CHUNK_SIZE):
+            chunk = keys[start : start + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                "SELECT url_key FROM delivered_posts "
+                f"WHERE url_key IN ({placeholders})",
+                chunk,
+            )
+            delivered.update(row[0] for row in rows)
+        return delivered
+
+    def filter_undelivered(self, posts: Iterable[BlogPost]) -> List[BlogPost]:
+        """Return the posts that have never been delivered.
+
+        Duplicates within ``posts`` are collapsed to their first occurrence.
+
+        Args:
+            posts: Candidate posts
+
+        Returns:
+            Posts whose normalized URL is not in the ledger, in input order
+        """
+        unique: dict[str, BlogPost] = {}
+        for post in posts:
+            unique.setdefault(normalize_url(post.url), post)
+
+        delivered = self._delivered_keys(list(unique))
+        return [post for key, post in unique.items() if key not in delivered]
+
+    def mark_delivered(self, posts: Iterable[BlogPost]) -> None:
+        """Record posts as delivered.
+
+        Args:
+            posts: Posts that have been sent
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO delivered_posts
+                    (url_key, url, source, title, published_at, delivered_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        normalize_url(post.url),
+                        post.url,
+                        post.source,
+                        post.title,
+                        post.date.isoformat(),
+                        now,
+                    )
+                    for post in posts
+                ],
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,268 @@
+"""Per-source cache of scraped posts with stale-while-revalidate refreshes."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from scrapers.base_scraper import BlogPost
+from utils import metrics
+from utils.logger import setup_logger
+from utils.storage import read_json, write_json
+
+logger = setup_logger(__name__)
+
+Fetcher = Callable[[datetime], Awaitable[List[BlogPost]]]
+
+CACHE_REQUESTS = metrics.Counter(
+    "koran_result_cache_requests_total",
+    "Lookups of cached posts, by result (fresh, stale or miss)",
+    ["source", "result"],
+)
+
+
+@dataclass
+class CacheEntry:
+    """Posts scraped from one source and the window they cover."""
+
+    since: datetime
+    fetched_at: float
+    posts: List[BlogPost] = field(default_factory=list)
+    last_error: Optional[str] = None
+
+    def covers(self, since: datetime) -> bool:
+        """Whether the entry holds every post newer than ``since``."""
+        return self.since <= since
+
+    def to_dict(self) -> Dict:
+        return {
+            "since": self.since.isoformat(),
+            "fetched_at": self.fetched_at,
+            "posts": [post.to_dict() for post in self.posts],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "CacheEntry":
+        return cls(
+            since=datetime.fromisoformat(data["since"]),
+            fetched_at=data["fetched_at"],
+            posts=[BlogPost.from_dict(post) for post in data["posts"]],
+        )
+
+
+@dataclass
+class SourceFreshness:
+    """How current the cached posts of a source are."""
+
+    source: str
+    state: str
+    fetched_at: datetime
+    age_seconds: float
+    posts: int
+    refreshing: bool
+    last_error: Optional[str] = None
+
+
+class ResultCache:
+    """Caches each source's scraped posts and refreshes them in the background.
+
+    An entry younger than ``ttl`` is served as is. An older entry is still
+    served immediately for up to ``max_stale`` more seconds, while a
+    background task scrapes the source again (stale-while-revalidate). Entries
+    older than that, and requests reaching further back than the cached
+    window, wait for a fresh scrape. Every scrape caches the window it was
+    asked for, so one request for a long lookback doesn't widen the later
+    refreshes. A failed refresh keeps the old entry.
+
+    Memory is bounded by keeping at most ``max_entries`` sources (least
+    recently used are evicted) and the ``max_posts`` newest posts of each;
+    the window of a truncated entry shrinks to the posts it kept.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        max_stale: float = 3600,
+        max_entries: int = 64,
+        max_posts: int = 200,
+        path: Optional[Path] = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served without being refreshed. Zero or
+                less disables caching.
+            max_stale: Seconds past ``ttl`` an entry is still served while it
+                is being refreshed
+            max_entries: Maximum number of cached sources
+            max_posts: Maximum number of posts kept per source
+            path: Optional JSON file that keeps the cache across runs
+        """
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self.max_posts = max_posts
+        self.path = path
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._refreshes: Dict[str, asyncio.Task] = {}
+        if path is not None:
+            self._load()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    def _load(self) -> None:
+        for key, data in read_json(self.path, {}).items():
+            try:
+                self._entries[key] = CacheEntry.from_dict(data)
+            except (KeyError, TypeError, ValueError):
+                logger.warning(f"Ignoring corrupt cache entry for {key}")
+
+    def _save(self) -> None:
+        if self.path is not None:
+            write_json(
+                self.path,
+                {key: entry.to_dict() for key, entry in self._entries.items()},
+            )
+
+    def _store(self, key: str, since: datetime, posts: List[BlogPost]) -> None:
+        newest = sorted(posts, key=lambda post: post.date, reverse=True)
+        if len(newest) > self.max_posts:
+            newest = newest[: self.max_posts]
+            # Dropped posts are no newer than the oldest kept one, so the
+            # entry only covers the window from there on
+            since = max(since, newest[-1].date)
+        self._entries[key] = CacheEntry(
+            since=since, fetched_at=time.time(), posts=newest
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._save()
+
+    async def get(self, key: str, since: datetime, fetch: Fetcher) -> List[BlogPost]:
+        """Return the posts of a source newer than ``since``.
+
+        Args:
+            key: Name of the source
+            since: Only return posts newer than this date
+            fetch: Scrapes the source for posts newer than the given date;
+                its errors propagate when there is nothing to serve instead
+
+        Returns:
+            Posts newer than ``since``
+        """
+        if not self.enabled:
+            return await fetch(since)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.covers(since):
+            self._entries.move_to_end(key)
+            age = time.time() - entry.fetched_at
+            if age < self.ttl:
+                CACHE_REQUESTS.inc(source=key, result="fresh")
+                return self._select(entry, since)
+            if age < self.ttl + self.max_stale:
+                CACHE_REQUESTS.inc(source=key, result="stale")
+                self._start_refresh(key, since, fetch)
+                return self._select(entry, since)
+
+        CACHE_REQUESTS.inc(source=key, result="miss")
+
+        # Join a refresh that is already underway instead of scraping twice
+        refresh = self._refreshes.get(key)
+        if refresh is not None:
+            await asyncio.shield(refresh)
+            entry = self._entries.get(key)
+            if entry is not None and entry.covers(since) and not entry.last_error:
+                return self._select(entry, since)
+
+        posts = await fetch(since)
+        self._store(key, since, posts)
+        return [post for post in posts if post.date > since]
+
+    async def refresh(self, key: str, since: datetime, fetch: Fetcher) -> None:
+        """Scrape a source now and cache the result, e.g. from a scheduler.
+
+        Joins a refresh of the same source that is already underway.
+
+        Args:
+            key: Name of the source
+            since: Refresh posts newer than this date
+            fetch: Scrapes the source for posts newer than the given date
+        """
+        if not self.enabled:
+            await fetch(since)
+            return
+
+        self._start_refresh(key, since, fetch)
+        await asyncio.shield(self._refreshes[key])
+
+    @staticmethod
+    def _select(entry: CacheEntry, since: datetime) -> List[BlogPost]:
+        return [post for post in entry.posts if post.date > since]
+
+    def _start_refresh(self, key: str, since: datetime, fetch: Fetcher) -> None:
+        """Refresh an entry in the background unless already underway."""
+        if key in self._refreshes:
+            return
+        task = asyncio.create_task(self._refresh(key, since, fetch))
+        self._refreshes[key] = task
+        task.add_done_callback(lambda _: self._refreshes.pop(key, None))
+
+    async def _refresh(self, key: str, since: datetime, fetch: Fetcher) -> None:
+        logger.info(f"Refreshing cached posts of {key}")
+        try:
+            posts = await fetch(since)
+        except Exception as e:
+            logger.warning(f"Background refresh of {key} failed: {str(e)}")
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.last_error = str(e)
+            return
+        self._store(key, since, posts)
+
+    def freshness(self) -> List[SourceFreshness]:
+        """Describe how current each cached source is.
+
+        Returns:
+            One record per cached source, in least recently used order
+        """
+        now = time.time()
+        records = []
+        for key, entry in self._entries.items():
+            age = now - entry.fetched_at
+            if age < self.ttl:
+                state = "fresh"
+            elif age < self.ttl + self.max_stale:
+                state = "stale"
+            else:
+                state = "expired"
+            records.append(
+                SourceFreshness(
+                    source=key,
+                    state=state,
+                    fetched_at=datetime.fromtimestamp(entry.fetched_at, timezone.utc),
+                    age_seconds=round(age, 1),
+                    posts=len(entry.posts),
+                    refreshing=key in self._refreshes,
+                    last_error=entry.last_error,
+                )
+            )
+        return records
+
+    async def cancel_refreshes(self) -> None:
+        """Cancel the background refreshes that are still running."""
+        tasks = list(self._refreshes.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def close(self) -> None:
+        """Wait for background refreshes so their results are kept."""
+        if self._refreshes:
+            await asyncio.gather(*self._refreshes.values(), return_exceptions=True)
@@ -0,0 +1,147 @@
+"""In-process scheduler that keeps scraped posts fresh in HTTP mode."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+import schedule
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.circuit_breaker import OPEN
+from services.koran_service import KoranService
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class RefreshScheduler:
+    """Refreshes each source on its own interval and pre-renders the digest.
+
+    It also retries the messages left in the outbox by failed deliveries.
+
+    Jobs are registered on a ``schedule.Scheduler`` that is polled from an
+    asyncio task, and each job runs as its own task so slow scrapers never
+    delay the others. A job is skipped while its previous run is still going.
+    With intervals shorter than the service's cache TTL, API requests are
+    always served from fresh cache entries and never scrape on the request
+    path.
+    """
+
+    def __init__(
+        self,
+        service: KoranService,
+        interval: float = 240,
+        source_intervals: Optional[Dict[str, float]] = None,
+        digest_interval: float = 60,
+        outbox_interval: float = 30,
+        lookback_days: int = 1,
+        tick: float = 1.0,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            service: The service whose sources are refreshed
+            interval: Default seconds between refreshes of a source
+            source_intervals: Per-source intervals keyed by source ID
+            digest_interval: Seconds between digest renders
+            outbox_interval: Seconds between attempts to send queued messages
+            lookback_days: Days of posts kept fresh and included in the digest
+            tick: Seconds between checks for due jobs
+        """
+        self.service = service
+        self.interval = interval
+        self.source_intervals = source_intervals or {}
+        self.digest_interval = digest_interval
+        self.outbox_interval = outbox_interval
+        self.lookback_days = lookback_days
+        self.tick = tick
+        self._scheduler = schedule.Scheduler()
+        self._jobs: Dict[str, asyncio.Task] = {}
+        self._loop_task: Optional[asyncio.Task] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _since(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+
+    def _spawn(self, name: str, job: Callable[[], Awaitable[None]]) -> None:
+        """Run a job in its own task unless its previous run is unfinished."""
+        if name in self._jobs:
+            logger.debug(f"Skipping {name}: previous run still in progress")
+            return
+        task = asyncio.create_task(job())
+        self._jobs[name] = task
+        task.add_done_callback(lambda _: self._jobs.pop(name, None))
+
+    async def _refresh_source(self, scraper: BaseScraper) -> None:
+        if scraper.breaker.state == OPEN:
+            logger.debug(f"Skipping refresh of {scraper.source_name}: circuit open")
+            return
+        try:
+            await self.service.refresh_source(scraper, self._since(), self._semaphore)
+        except Exception as e:
+            logger.error(f"Scheduled refresh of {scraper.source_name} failed: {str(e)}")
+
+    async def _prepare_digest(self) -> None:
+        try:
+            await self.service.prepare_digest(self._since())
+        except Exception as e:
+            logger.error(f"Scheduled digest failed: {str(e)}")
+
+    async def _flush_outbox(self) -> None:
+        try:
+            report = await self.service.flush_outbox()
+            if report.error is not None:
+                logger.warning(
+                    f"Scheduled outbox delivery stopped, {report.queued} messages "
+                    f"still queued: {report.error}"
+                )
+        except Exception as e:
+            logger.error(f"Scheduled outbox delivery failed: {str(e)}")
+
+    async def _warm_up(self) -> None:
+        """Refresh every source once, then render the first digest."""
+        await asyncio.gather(
+            *(self._refresh_source(scraper) for scraper in self.service.scrapers)
+        )
+        await self._prepare_digest()
+
+    async def _run(self) -> None:
+        while True:
+            self._scheduler.run_pending()
+            await asyncio.sleep(self.tick)
+
+    async def start(self) -> None:
+        """Register the jobs and start running them in the background."""
+        self._semaphore = asyncio.Semaphore(self.service.max_concurrency)
+        for scraper in self.service.scrapers:
+            source = scraper.source_id
+            interval = self.source_intervals.get(source, self.interval)
+            self._scheduler.every(interval).seconds.do(
+                self._spawn,
+                f"refresh:{source}",
+                lambda s=scraper: self._refresh_source(s),
+            ).tag(source)
+            logger.info(f"Refreshing {scraper.source_name} every {interval:g}s")
+        self._scheduler.every(self.digest_interval).seconds.do(
+            self._spawn, "digest", self._prepare_digest
+        ).tag("digest")
+        self._scheduler.every(self.outbox_interval).seconds.do(
+            self._spawn, "outbox", self._flush_outbox
+        ).tag("outbox")
+
+        self._spawn("warm-up", self._warm_up)
+        self._loop_task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop scheduling and cancel the jobs that are still running."""
+        self._scheduler.clear()
+        tasks = list(self._jobs.values())
+        if self._loop_task is not None:
+            tasks.append(self._loop_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Don't hold up shutdown for scrapes the jobs had started
+        await self.service.result_cache.cancel_refreshes()
+        self._loop_task = None
+        logger.info("Refresh scheduler stopped")
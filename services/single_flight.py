@@ -0,0 +1,114 @@
+"""Coalescing of concurrent post fetches into a single in-flight run."""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, FrozenSet, List, Optional
+
+from scrapers.base_scraper import BlogPost
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+FetchPosts = Callable[[datetime], Awaitable[List[BlogPost]]]
+
+
+class ServiceBusyError(Exception):
+    """Raised when too many callers are already waiting for a fetch."""
+
+    def __init__(self, waiting: int) -> None:
+        super().__init__(f"A fetch is already running with {waiting} callers queued")
+        self.waiting = waiting
+
+
+@dataclass
+class _Flight:
+    since: datetime
+    sources: Optional[FrozenSet[str]]
+    task: asyncio.Task
+
+    def covers(self, since: datetime, sources: Optional[FrozenSet[str]]) -> bool:
+        """Whether the flight fetches everything a caller asks for."""
+        if self.since > since:
+            return False
+        return self.sources is None or (sources is not None and sources <= self.sources)
+
+
+class SingleFlight:
+    """Runs at most one fetch at a time and shares its result.
+
+    A caller whose window is covered by the running fetch (its ``since`` is
+    no earlier and its sources are among those fetched) joins that fetch
+    instead of starting another one. Other callers queue until the running
+    fetch is done, up to ``max_waiting`` of them; beyond that
+    :class:`ServiceBusyError` is raised so the caller can be turned away.
+    """
+
+    def __init__(self, max_waiting: int = 4) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            max_waiting: Maximum number of callers queued behind a running
+                fetch they cannot join
+        """
+        self.max_waiting = max_waiting
+        self.coalesced = 0
+        self._flight: Optional[_Flight] = None
+        self._waiting = 0
+
+    async def run(
+        self,
+        since: datetime,
+        fetch: FetchPosts,
+        sources: Optional[FrozenSet[str]] = None,
+    ) -> List[BlogPost]:
+        """Fetch posts newer than ``since``, sharing a fetch already running.
+
+        Args:
+            since: Only return posts newer than this date
+            fetch: Fetches the posts newer than the given date
+            sources: Names of the sources ``fetch`` reads; None for all
+
+        Returns:
+            Posts newer than ``since``
+
+        Raises:
+            ServiceBusyError: If the queue of waiting callers is full
+        """
+        while self._flight is not None:
+            flight = self._flight
+            if flight.covers(since, sources):
+                self.coalesced += 1
+                logger.info("Joining the fetch that is already running")
+                posts = await asyncio.shield(flight.task)
+                return [
+                    post
+                    for post in posts
+                    if post.date > since and (sources is None or post.source in sources)
+                ]
+
+            if self._waiting >= self.max_waiting:
+                raise ServiceBusyError(self._waiting)
+            self._waiting += 1
+            try:
+                # Its outcome belongs to the callers that started or joined it
+                await asyncio.wait({flight.task})
+            finally:
+                self._waiting -= 1
+
+        flight = _Flight(
+            since=since, sources=sources, task=asyncio.create_task(fetch(since))
+        )
+        self._flight = flight
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            if self._flight is flight and flight.task.done():
+                self._flight = None
+            elif self._flight is flight:
+                # The caller was cancelled; clear the slot once the fetch ends
+                flight.task.add_done_callback(lambda _: self._release(flight))
+
+    def _release(self, flight: _Flight) -> None:
+        if self._flight is flight:
+            self._flight = None
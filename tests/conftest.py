@@ -0,0 +1,36 @@
+"""Shared test fixtures."""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from scrapers.base_scraper import BlogPost
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep every file a test writes in its own temporary data directory."""
+    path = tmp_path / "data"
+    path.mkdir()
+    monkeypatch.setenv("KORAN_DATA_DIR", str(path))
+    monkeypatch.delenv("KORAN_CACHE_DIR", raising=False)
+    return path
+
+
+def _make_post(
+    number: int, source: str = "Test Blog", url: str = "https://example.com/posts"
+) -> BlogPost:
+    return BlogPost(
+        title=f"Post {number}",
+        url=f"{url}/{number}",
+        date=datetime(2026, 1, 1 + number % 28, tzinfo=timezone.utc),
+        source=source,
+    )
+
+
+@pytest.fixture
+def make_post() -> Callable[..., BlogPost]:
+    """Build a post with a unique URL and a date derived from its number."""
+    return _make_post
@@ -0,0 +1,131 @@
+"""Tests for leasing pooled browsers, including cancelled leases."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from scrapers.browser_pool import BrowserPool, PooledBrowser
+
+
+class FakeDriver:
+    """Stands in for a Selenium WebDriver with one base tab."""
+
+    def __init__(self) -> None:
+        self.current_window_handle = "base"
+        self.quit_called = False
+        self.switch_to = SimpleNamespace(
+            new_window=self._new_window, window=self._window
+        )
+        self.service = SimpleNamespace(process=None)
+
+    def _new_window(self, kind: str) -> None:
+        self.current_window_handle = "tab"
+
+    def _window(self, handle: str) -> None:
+        self.current_window_handle = handle
+
+    def close(self) -> None:
+        self.current_window_handle = None
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+class Launcher:
+    """Launches fake browsers, optionally holding each launch until released."""
+
+    def __init__(self, blocking: bool = False) -> None:
+        self.drivers: List[FakeDriver] = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not blocking:
+            self.release.set()
+
+    def __call__(self) -> PooledBrowser:
+        self.started.set()
+        self.release.wait(timeout=5)
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return PooledBrowser(driver)
+
+
+@pytest.fixture
+def launcher() -> Launcher:
+    return Launcher()
+
+
+@pytest.fixture
+def pool(launcher, monkeypatch: pytest.MonkeyPatch) -> BrowserPool:
+    pool = BrowserPool(max_browsers=1, max_pages_per_browser=2)
+    monkeypatch.setattr(pool, "_launch", launcher)
+    return pool
+
+
+async def test_browsers_are_reused_until_they_are_recycled(pool, launcher):
+    for _ in range(3):
+        async with pool.browser() as driver:
+            assert driver.current_window_handle == "tab"
+
+    assert len(launcher.drivers) == 2
+    assert launcher.drivers[0].quit_called
+    assert not launcher.drivers[1].quit_called
+    await pool.close()
+    assert launcher.drivers[1].quit_called
+
+
+async def test_a_failing_caller_does_not_discard_the_browser(pool, launcher):
+    with pytest.raises(RuntimeError):
+        async with pool.browser():
+            raise RuntimeError("page did not load")
+
+    async with pool.browser():
+        pass
+
+    assert len(launcher.drivers) == 1
+
+
+async def test_a_lease_cancelled_while_in_use_quits_the_browser(pool, launcher):
+    in_use = asyncio.Event()
+
+    async def lease() -> None:
+        async with pool.browser():
+            in_use.set()
+            await asyncio.sleep(10)
+
+    task = asyncio.create_task(lease())
+    await in_use.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    (driver,) = launcher.drivers
+    assert driver.quit_called
+    assert pool._idle == []
+
+
+async def test_a_browser_launched_for_a_cancelled_lease_is_quit(
+    pool, monkeypatch: pytest.MonkeyPatch
+):
+    launcher = Launcher(blocking=True)
+    monkeypatch.setattr(pool, "_launch", launcher)
+
+    async def lease() -> None:
+        async with pool.browser():
+            pass
+
+    task = asyncio.create_task(lease())
+    await asyncio.to_thread(launcher.started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # The launch finishes after the lease was given up on
+    launcher.release.set()
+    await pool.close()
+
+    (driver,) = launcher.drivers
+    assert driver.quit_called
+    assert pool._idle == []
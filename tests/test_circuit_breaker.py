@@ -0,0 +1,181 @@
+"""Tests for the per-source circuit breaker."""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from scrapers import circuit_breaker
+from scrapers.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "breaker.json"
+
+
+def make_breaker(path: Path) -> CircuitBreaker:
+    return CircuitBreaker(
+        "Test Blog", failure_threshold=3, cooldown=60, max_cooldown=200, path=path
+    )
+
+
+def fail(breaker: CircuitBreaker, times: int = 1) -> None:
+    for _ in range(times):
+        breaker.before_call()
+        breaker.record_failure("HTTP 503")
+
+
+def test_opens_after_consecutive_failures(clock, path):
+    breaker = make_breaker(path)
+
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+    fail(breaker)
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError) as excinfo:
+        breaker.before_call()
+    assert excinfo.value.retry_at == clock.now + 60
+
+
+def test_a_success_resets_the_failure_count(clock, path):
+    breaker = make_breaker(path)
+
+    fail(breaker, 2)
+    breaker.record_success()
+    fail(breaker, 2)
+
+    assert breaker.state == CLOSED
+    assert breaker.status().consecutive_failures == 2
+
+
+def test_half_open_after_the_cooldown_allows_a_single_probe(clock, path):
+    breaker = make_breaker(path)
+    fail(breaker, 3)
+
+    clock.now += 59
+    assert breaker.state == OPEN
+    clock.now += 1
+    assert breaker.state == HALF_OPEN
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_a_successful_probe_closes_the_circuit(clock, path):
+    breaker = make_breaker(path)
+    fail(breaker, 3)
+    clock.now += 60
+    fail(breaker)
+    clock.now += 120
+
+    breaker.before_call()
+    breaker.record_success()
+
+    status = breaker.status()
+    assert status.state == CLOSED
+    assert status.consecutive_failures == 0
+    assert status.cooldown_seconds == 60
+    breaker.before_call()
+
+
+def test_failed_probes_double_the_cooldown_up_to_the_maximum(clock, path):
+    breaker = make_breaker(path)
+    fail(breaker, 3)
+
+    cooldowns = []
+    for _ in range(4):
+        clock.now += breaker.status().cooldown_seconds
+        fail(breaker)
+        cooldowns.append(breaker.status().cooldown_seconds)
+        assert breaker.state == OPEN
+
+    assert cooldowns == [120, 200, 200, 200]
+
+
+def test_a_released_probe_can_be_retried(clock, path):
+    breaker = make_breaker(path)
+    fail(breaker, 3)
+    clock.now += 60
+
+    breaker.before_call()
+    breaker.release()
+
+    breaker.before_call()
+
+
+def test_state_carries_over_to_a_new_breaker(clock, path):
+    fail(make_breaker(path), 3)
+
+    breaker = make_breaker(path)
+
+    assert breaker.state == OPEN
+    status = breaker.status()
+    assert status.consecutive_failures == 3
+    assert status.last_error == "HTTP 503"
+    assert status.retry_at == datetime.fromtimestamp(clock.now + 60, timezone.utc)
+
+
+def test_reset_closes_the_circuit(clock, path):
+    breaker = make_breaker(path)
+    fail(breaker, 3)
+
+    breaker.reset()
+
+    assert make_breaker(path).state == CLOSED
+    breaker.before_call()
+
+
+@pytest.mark.parametrize(
+    "saved",
+    [
+        {"state": OPEN, "failures": 3, "cooldown": 60},
+        {"state": OPEN, "failures": 3, "cooldown": 60, "opened_at": "yesterday"},
+        {"state": "melted", "failures": 3},
+        {"state": CLOSED, "failures": None},
+        ["not", "an", "object"],
+    ],
+)
+def test_unusable_saved_state_is_reset(clock, path, saved):
+    path.write_text(json.dumps(saved))
+
+    breaker = make_breaker(path)
+
+    assert breaker.state == CLOSED
+    assert breaker.status().consecutive_failures == 0
+    breaker.before_call()
+
+
+def test_missing_fields_of_saved_state_are_filled_in(clock, path):
+    path.write_text(json.dumps({"failures": 2}))
+
+    breaker = make_breaker(path)
+    fail(breaker)
+
+    assert breaker.state == OPEN
+    assert breaker.status().cooldown_seconds == 60
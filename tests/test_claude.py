@@ -0,0 +1,88 @@
+"""Tests for resolving Claude blog posts from the listing and cached metadata."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import pytest
+
+from scrapers.claude import ClaudeScraper
+from scrapers.http_client import HttpResponse
+from utils.storage import read_json, write_json
+
+NOW = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+def url(slug: str) -> str:
+    return f"https://claude.com/blog/{slug}"
+
+
+class FakeBlog:
+    """Serves a listing page and the publication dates of its posts."""
+
+    def __init__(self, days_old: Dict[str, int]) -> None:
+        self.days_old = days_old
+        self.fetched: List[str] = []
+
+    async def fetch(self, page_url, headers=None, conditional=False, **kwargs):
+        links = "".join(f'<a href="/blog/{slug}">{slug}</a>' for slug in self.days_old)
+        links += '<a href="/blog/category/news">News</a>'
+        return HttpResponse(page_url, 200, {}, links.encode())
+
+    async def fetch_post_metadata(self, post_url, headers):
+        self.fetched.append(post_url)
+        date = NOW - timedelta(days=self.days_old[post_url.rsplit("/", 1)[-1]])
+        return {"headline": post_url, "datePublished": date.isoformat()}
+
+
+@pytest.fixture
+def scraper() -> ClaudeScraper:
+    return ClaudeScraper(max_concurrent_fetches=2)
+
+
+def serve(scraper: ClaudeScraper, blog: FakeBlog, monkeypatch) -> None:
+    monkeypatch.setattr(scraper, "fetch", blog.fetch)
+    monkeypatch.setattr(scraper, "_fetch_post_metadata", blog.fetch_post_metadata)
+
+
+async def test_new_posts_after_old_featured_ones_are_found(scraper, monkeypatch):
+    # Featured posts of any age lead the listing
+    blog = FakeBlog({"f1": 300, "f2": 200, "f3": 100, "f4": 400, "new": 1, "newer": 0})
+    serve(scraper, blog, monkeypatch)
+
+    posts = await scraper.fetch_latest_posts(since=NOW - timedelta(days=7))
+
+    assert [post.url for post in posts] == [url("newer"), url("new")]
+
+
+async def test_only_posts_without_cached_metadata_are_fetched(scraper, monkeypatch):
+    write_json(
+        scraper._metadata_path,
+        {url("old"): {"headline": "Old", "datePublished": "2025-01-01"}},
+    )
+    blog = FakeBlog({"new": 1, "old": 400})
+    serve(scraper, blog, monkeypatch)
+
+    posts = await scraper.fetch_latest_posts()
+
+    assert blog.fetched == [url("new")]
+    assert [post.title for post in posts] == [url("new"), "Old"]
+
+
+async def test_posts_no_longer_listed_are_dropped_from_the_cache(scraper, monkeypatch):
+    write_json(
+        scraper._metadata_path,
+        {url("gone"): {"headline": "Gone", "datePublished": "2025-01-01"}},
+    )
+    serve(scraper, FakeBlog({"a": 1, "b": 2}), monkeypatch)
+
+    await scraper.fetch_latest_posts()
+
+    assert sorted(read_json(scraper._metadata_path, {})) == [url("a"), url("b")]
+
+
+async def test_the_limit_keeps_the_newest_posts(scraper, monkeypatch):
+    serve(scraper, FakeBlog({"f1": 300, "a": 3, "b": 1, "c": 2}), monkeypatch)
+
+    posts = await scraper.fetch_latest_posts(limit=2)
+
+    assert [post.url for post in posts] == [url("b"), url("c")]
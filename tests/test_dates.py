@@ -0,0 +1,112 @@
+"""Tests for the date parsing shared by the scrapers."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from scrapers.dates import find_date, parse_date, to_utc
+
+MARCH_11 = datetime(2026, 3, 11, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "March 11, 2026",
+        "March 11 2026",
+        "Mar 11, 2026",
+        "Mar. 11, 2026",
+        "MAR 11 2026",
+        "11 March 2026",
+        "11 MAR 2026",
+        "  March 11, 2026\n",
+        "2026-03-11",
+        "2026-03-11T00:00:00Z",
+        "2026-03-11T00:00:00+00:00",
+        "Wed, 11 Mar 2026 00:00:00 +0000",
+        "Wed, 11 Mar 2026 00:00:00 GMT",
+    ],
+)
+def test_every_blog_date_format_is_parsed(text):
+    assert parse_date(text) == MARCH_11
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Sept 9, 2026", datetime(2026, 9, 9, tzinfo=timezone.utc)),
+        ("Sep 9, 2026", datetime(2026, 9, 9, tzinfo=timezone.utc)),
+        ("May 1, 2026", datetime(2026, 5, 1, tzinfo=timezone.utc)),
+    ],
+)
+def test_month_abbreviations(text, expected):
+    assert parse_date(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2026-03-11T02:00:00+02:00",
+        "2026-03-10T19:00:00-05:00",
+        "Wed, 11 Mar 2026 09:00:00 +0900",
+    ],
+)
+def test_dates_with_an_offset_are_normalized_to_utc(text):
+    date = parse_date(text)
+
+    assert date == MARCH_11
+    assert date.utcoffset() == timedelta(0)
+
+
+def test_naive_timestamps_are_taken_as_utc():
+    date = parse_date("2026-03-11T00:00:00")
+
+    assert date == MARCH_11
+    assert date.tzinfo is timezone.utc
+
+
+def test_to_utc_converts_aware_and_labels_naive_datetimes():
+    tokyo = timezone(timedelta(hours=9))
+
+    assert to_utc(datetime(2026, 3, 11, 9, tzinfo=tokyo)) == MARCH_11
+    assert to_utc(datetime(2026, 3, 11)).tzinfo is timezone.utc
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "yesterday",
+        "February 30, 2026",
+        "Posted March 11, 2026",
+        "March 11, 2026 by Jane",
+        "Marchy 11, 2026",
+    ],
+)
+def test_strings_that_are_not_only_a_valid_date_are_rejected(text):
+    assert parse_date(text) is None
+
+
+def test_parsed_dates_are_memoized():
+    parse_date.cache_clear()
+
+    first = parse_date("April 1, 2026")
+    second = parse_date("April 1, 2026")
+
+    assert first is second
+    info = parse_date.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    assert info.maxsize is not None
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Scaling KafkaMar 11, 2026 · 5 min read", MARCH_11),
+        ("Announcements\nMarch 11, 2026\nRead more", MARCH_11),
+        ("No date here", None),
+        ("Due February 30, 2026", None),
+    ],
+)
+def test_find_date_searches_longer_texts(text, expected):
+    assert find_date(text) == expected
@@ -0,0 +1,112 @@
+"""Tests for reading post listings from JSON embedded in HTML pages."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from scrapers.embedded_json import (
+    EmbeddedPost,
+    extract_embedded_json,
+    find_embedded_posts,
+)
+
+BASE_URL = "https://www.uber.com/blog/engineering/"
+DATE = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+
+
+def next_data(*posts: dict) -> str:
+    document = {"props": {"pageProps": {"posts": list(posts)}}}
+    return (
+        '<html><script id="__NEXT_DATA__" type="application/json">'
+        f"{json.dumps(document)}</script></html>"
+    )
+
+
+def listing(title: str = "Post", url: str = "/blog/post/", date="2026-03-01T10:00:00Z"):
+    return {"title": title, "url": url, "date": date}
+
+
+def test_documents_are_read_from_script_tags_and_state_assignments():
+    state = json.dumps(json.dumps({"source": "apollo"}))
+    html = (
+        '<script type="application/ld+json">{"@type": "Blog"}</script>'
+        '<script type="application/json">{not json}</script>'
+        '<script>window.__REDUX_STATE__ = {"source": "redux"};</script>'
+        f"<script>window._preloads = JSON.parse({state})</script>"
+    )
+
+    assert extract_embedded_json(html) == [
+        {"@type": "Blog"},
+        {"source": "redux"},
+        {"source": "apollo"},
+    ]
+
+
+def test_posts_are_found_anywhere_in_the_documents():
+    html = next_data(
+        listing("First", "/blog/first/"),
+        {
+            "node": {
+                "headline": " Second ",
+                "slug": "second",
+                "publishedAt": 1772359200000,
+            }
+        },
+    )
+
+    assert find_embedded_posts(html, BASE_URL) == [
+        EmbeddedPost("First", "https://www.uber.com/blog/first/", DATE),
+        EmbeddedPost("Second", "https://www.uber.com/blog/engineering/second", DATE),
+    ]
+
+
+def test_duplicate_urls_are_dropped():
+    html = next_data(listing("First"), listing("Again"))
+
+    assert [post.title for post in find_embedded_posts(html, BASE_URL)] == ["First"]
+
+
+@pytest.mark.parametrize(
+    "url, kept",
+    [
+        ("https://eng.uber.com/post/", True),
+        ("https://uber.com/post/", True),
+        ("https://twitter.com/uber", False),
+        ("https://uber.com.evil.example/post/", False),
+        ("mailto:blog@uber.com", False),
+        ("javascript:void(0)", False),
+    ],
+)
+def test_only_links_to_the_pages_site_are_posts(url, kept):
+    html = next_data(listing(url=url))
+
+    assert bool(find_embedded_posts(html, BASE_URL)) is kept
+
+
+@pytest.mark.parametrize(
+    "date",
+    [
+        # IDs and counters that happen to be numbers
+        42,
+        123456,
+        10**20,
+        True,
+        "2999-01-01T00:00:00Z",
+        "1970-01-02",
+        "not a date",
+        None,
+    ],
+)
+def test_values_that_are_not_publication_dates_are_rejected(date):
+    html = next_data(listing(date=date))
+
+    assert find_embedded_posts(html, BASE_URL) == []
+
+
+@pytest.mark.parametrize("date", [1772359200, 1772359200000, "2026-03-01T10:00:00Z"])
+def test_dates_may_be_timestamps_in_seconds_or_milliseconds(date):
+    html = next_data(listing(date=date))
+
+    (post,) = find_embedded_posts(html, BASE_URL)
+    assert post.date == DATE
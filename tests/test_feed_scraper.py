@@ -0,0 +1,156 @@
+"""Tests for the streaming RSS / Atom feed engine."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List
+
+import pytest
+
+from scrapers.feed_scraper import FeedItem, FeedParser, FeedScraper
+
+NEWEST = datetime(2026, 3, 10, 12, tzinfo=timezone.utc)
+
+
+def rss_item(number: int) -> str:
+    date = NEWEST - timedelta(days=number)
+    return (
+        f"<item><title>Post {number}</title>"
+        f"<link>https://example.com/posts/{number}</link>"
+        f"<pubDate>{date:%a, %d %b %Y %H:%M:%S} +0000</pubDate></item>"
+    )
+
+
+def rss_chunks(count: int) -> List[bytes]:
+    """An RSS feed of ``count`` items, newest first, one item per chunk."""
+    return [
+        b'<?xml version="1.0"?><rss version="2.0"><channel><title>Blog</title>',
+        *(rss_item(number).encode() for number in range(count)),
+        b"</channel></rss>",
+    ]
+
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Blog</title>
+  <entry>
+    <title>Atom post</title>
+    <link rel="replies" href="https://example.com/atom#comments"/>
+    <link href="https://example.com/atom"/>
+    <published>2026-03-10T12:00:00+02:00</published>
+    <updated>2026-03-11T08:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+
+def parse(chunks: List[bytes]) -> List[FeedItem]:
+    parser = FeedParser()
+    items = [item for chunk in chunks for item in parser.feed(chunk)]
+    return items + list(parser.close())
+
+
+def test_rss_items_are_parsed_in_order():
+    items = parse(rss_chunks(3))
+
+    assert [item.title for item in items] == ["Post 0", "Post 1", "Post 2"]
+    assert items[0].url == "https://example.com/posts/0"
+    assert items[0].date == NEWEST
+
+
+def test_atom_entries_use_the_alternate_link_and_published_date():
+    (item,) = parse([ATOM])
+
+    assert item == FeedItem(
+        title="Atom post",
+        url="https://example.com/atom",
+        date=datetime(2026, 3, 10, 10, tzinfo=timezone.utc),
+    )
+
+
+def test_items_are_yielded_as_soon_as_they_are_complete():
+    parser = FeedParser()
+    document = b"".join(rss_chunks(2))
+    split = document.index(b"</item>") + len(b"</item>")
+
+    assert [item.title for item in parser.feed(document[:split])] == ["Post 0"]
+    assert [item.title for item in parser.feed(document[split:])] == ["Post 1"]
+
+
+def test_incomplete_items_are_skipped_and_counted():
+    parser = FeedParser()
+    document = (
+        b"<rss><channel>"
+        b"<item><title>No link</title><pubDate>Tue, 10 Mar 2026 12:00:00 +0000"
+        b"</pubDate></item>"
+        b"<item><title>Bad date</title><link>https://example.com/1</link>"
+        b"<pubDate>someday</pubDate></item>"
+        b"<item><title>Good</title><link>https://example.com/2</link>"
+        b"<pubDate>Tue, 10 Mar 2026 12:00:00 +0000</pubDate></item>"
+        b"</channel></rss>"
+    )
+
+    items = list(parser.feed(document)) + list(parser.close())
+
+    assert [item.title for item in items] == ["Good"]
+    assert parser.skipped == 2
+
+
+class FakeResponse:
+    """A streamed response that counts the chunks read from it."""
+
+    status = 200
+
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.chunks = chunks
+        self.read = 0
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+
+@pytest.fixture
+def response() -> FakeResponse:
+    return FakeResponse(rss_chunks(10))
+
+
+@pytest.fixture
+def scraper(response, monkeypatch: pytest.MonkeyPatch) -> FeedScraper:
+    scraper = FeedScraper(
+        base_url="https://example.com/",
+        source_name="Test Blog",
+        feed_url="https://example.com/feed",
+    )
+
+    @asynccontextmanager
+    async def stream(url, **kwargs):
+        yield response
+
+    monkeypatch.setattr(scraper, "stream", stream)
+    return scraper
+
+
+async def test_reading_stops_at_the_first_item_past_the_cutoff(scraper, response):
+    since = NEWEST - timedelta(days=2)
+
+    posts = await scraper.fetch_latest_posts(since=since)
+
+    assert [post.title for post in posts] == ["Post 0", "Post 1"]
+    # The header, three items and nothing after the first old one
+    assert response.read == 4
+
+
+async def test_reading_stops_once_the_limit_is_reached(scraper, response):
+    posts = await scraper.fetch_latest_posts(limit=3)
+
+    assert [post.title for post in posts] == ["Post 0", "Post 1", "Post 2"]
+    assert response.read == 4
+
+
+async def test_the_whole_feed_is_read_without_a_window(scraper, response):
+    posts = await scraper.fetch_latest_posts()
+
+    assert len(posts) == 10
+    assert response.read == len(response.chunks)
+    assert all(post.source == "Test Blog" for post in posts)
@@ -0,0 +1,58 @@
+"""Tests for the status codes of the /send-posts endpoint."""
+
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from cmd import http
+from services.koran_service import KoranService
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> Iterator[KoranService]:
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+    monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@channel")
+    service = KoranService(dry_run=True, sources=["netflix"])
+    monkeypatch.setattr(http, "_service", service)
+    yield service
+    service.ledger.close()
+    service.channel.close()
+
+
+@pytest.fixture
+async def client(service) -> AsyncIterator[httpx.AsyncClient]:
+    transport = httpx.ASGITransport(app=http.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"sources": ["nope"]},
+        {"sources": ["aws"]},
+        {"days": 0},
+        {"days": -3},
+        {"days": 10**9},
+    ],
+)
+async def test_invalid_requests_are_answered_with_400(client, body):
+    response = await client.post("/send-posts", json={"dry_run": True, **body})
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["status"] == "error"
+
+
+async def test_a_value_error_while_fetching_is_a_server_error(
+    client, service, monkeypatch
+):
+    async def fetch_all(since, scrapers):
+        raise ValueError("unparseable date")
+
+    monkeypatch.setattr(service, "_fetch_all", fetch_all)
+
+    response = await client.post("/send-posts", json={"dry_run": True})
+
+    assert response.status_code == 500
+    assert response.json()["detail"]["message"] == "unparseable date"
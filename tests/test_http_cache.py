@@ -0,0 +1,114 @@
+"""Tests for the conditional GET cache of scraper requests."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from scrapers.http_cache import ValidatorCache
+
+URL = "https://example.com/feed"
+SINCE = datetime(2026, 3, 1, tzinfo=timezone.utc)
+POSTS = [{"title": "Post 1", "url": "https://example.com/1"}]
+RESPONSE_HEADERS = {"ETag": '"v1"', "Last-Modified": "Sun, 01 Mar 2026 10:00:00 GMT"}
+CONDITIONAL_HEADERS = {
+    "If-None-Match": '"v1"',
+    "If-Modified-Since": "Sun, 01 Mar 2026 10:00:00 GMT",
+}
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    return tmp_path / "validators.json"
+
+
+def committed(path: Path, since=SINCE, limit=None) -> ValidatorCache:
+    cache = ValidatorCache("Test Blog", path=path)
+    cache.stage(URL, RESPONSE_HEADERS)
+    cache.commit(POSTS, since, limit)
+    return cache
+
+
+def test_staged_validators_are_not_used_before_commit(path):
+    cache = ValidatorCache("Test Blog", path=path)
+
+    cache.stage(URL, RESPONSE_HEADERS)
+
+    assert cache.has_staged
+    assert cache.conditional_headers(URL, SINCE) == {}
+    assert not path.exists()
+
+
+def test_committed_validators_are_sent_with_the_posts_kept(path):
+    cache = committed(path)
+
+    assert cache.conditional_headers(URL, SINCE) == CONDITIONAL_HEADERS
+    assert cache.conditional_headers("https://example.com/other", SINCE) == {}
+    assert cache.load_posts() == POSTS
+    assert not cache.has_staged
+
+
+def test_commit_persists_across_instances(path):
+    committed(path)
+
+    cache = ValidatorCache("Test Blog", path=path)
+
+    assert cache.conditional_headers(URL, SINCE) == CONDITIONAL_HEADERS
+    assert cache.load_posts() == POSTS
+
+
+def test_only_the_validators_a_response_sent_are_used(path):
+    cache = ValidatorCache("Test Blog", path=path)
+    cache.stage(URL, {"ETag": '"v1"'})
+    cache.commit(POSTS, SINCE)
+
+    assert cache.conditional_headers(URL, SINCE) == {"If-None-Match": '"v1"'}
+
+
+def test_responses_without_validators_stage_nothing(path):
+    cache = ValidatorCache("Test Blog", path=path)
+
+    cache.stage(URL, {"Content-Type": "text/html"})
+
+    assert not cache.has_staged
+
+
+@pytest.mark.parametrize(
+    "since, covered",
+    [
+        (SINCE, True),
+        (SINCE + timedelta(days=1), True),
+        (SINCE - timedelta(days=1), False),
+        (None, False),
+    ],
+)
+def test_a_wider_cutoff_is_requested_unconditionally(path, since, covered):
+    cache = committed(path)
+
+    assert bool(cache.conditional_headers(URL, since)) is covered
+
+
+@pytest.mark.parametrize(
+    "limit, covered", [(10, True), (5, True), (11, False), (None, False)]
+)
+def test_a_higher_limit_is_requested_unconditionally(path, limit, covered):
+    cache = committed(path, since=None, limit=10)
+
+    assert bool(cache.conditional_headers(URL, SINCE, limit)) is covered
+
+
+def test_posts_fetched_without_a_window_cover_every_request(path):
+    cache = committed(path, since=None, limit=None)
+
+    assert cache.conditional_headers(URL) == CONDITIONAL_HEADERS
+    assert cache.conditional_headers(URL, SINCE, 5) == CONDITIONAL_HEADERS
+
+
+def test_discarded_validators_are_never_committed(path):
+    cache = ValidatorCache("Test Blog", path=path)
+    cache.stage(URL, RESPONSE_HEADERS)
+
+    cache.discard()
+    cache.commit(POSTS, SINCE)
+
+    assert cache.conditional_headers(URL, SINCE) == {}
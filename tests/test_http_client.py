@@ -0,0 +1,92 @@
+"""Tests for the pooled session of the shared HTTP client."""
+
+import asyncio
+import gc
+import threading
+import warnings
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator
+
+import pytest
+
+from scrapers.http_client import HttpClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        # Sockets kept alive by a loop that has been closed can't be closed
+        # any more, so don't leave any behind
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def run(coro):
+    """Runs ``coro`` on its own event loop, leaving the current one alone."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_a_new_event_loop_closes_the_session_of_the_old_one(url):
+    client = HttpClient()
+
+    async def fetch() -> bytes:
+        response = await client.get(url)
+        return response.content
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert run(fetch()) == b"ok"
+        first_session = client._session
+        assert run(fetch()) == b"ok"
+        second_session = client._session
+        run(client.close())
+        del first_session, second_session
+        gc.collect()
+
+    assert not [w for w in caught if "Unclosed" in str(w.message)]
+
+
+async def test_the_session_is_reused_within_a_loop(url):
+    client = HttpClient()
+
+    await client.get(url)
+    session = client._session
+    await client.get(url)
+
+    assert client._session is session
+    await client.close()
+    assert session.closed
+
+
+def test_the_old_session_is_closed_when_replaced(url):
+    client = HttpClient()
+    run(client.get(url))
+    old = client._session
+
+    run(client.get(url))
+
+    assert old.closed
+    assert not client._session.closed
+    run(client.close())
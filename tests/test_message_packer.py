@@ -0,0 +1,139 @@
+"""Tests for packing digest sections into Telegram messages."""
+
+from datetime import date, timedelta
+from typing import List
+
+import pytest
+
+from channels.message_packer import (
+    MESSAGE_LIMIT,
+    Day,
+    Entry,
+    MessagePacker,
+    PackedMessage,
+    Section,
+    text_length,
+)
+
+FIRST_DAY = date(2026, 3, 10)
+
+
+def make_day(offset: int, entries_per_section: List[int], title: str = "Post") -> Day:
+    """A day with one section per source, newest day first by ``offset``."""
+    post_date = FIRST_DAY - timedelta(days=offset)
+    return Day(
+        post_date=post_date,
+        header=f"📰 *{post_date:%b %d, %Y}*",
+        sections=[
+            Section(
+                header=f"🚀 *Source {source}*",
+                entries=[
+                    Entry(
+                        prefix=f"  *{i}.* ",
+                        title=f"{title} {i} 🧪",
+                        suffix=f"\n      [Read →](https://example.com/{i})",
+                    )
+                    for i in range(1, count + 1)
+                ],
+            )
+            for source, count in enumerate(entries_per_section)
+        ],
+    )
+
+
+def entries(message: PackedMessage) -> int:
+    return message.text.count("[Read →]")
+
+
+def test_text_length_counts_utf16_code_units():
+    assert text_length("abc") == 3
+    assert text_length("é") == 1
+    # Characters outside the Basic Multilingual Plane take two code units
+    assert text_length("📰") == 2
+    assert text_length("📰 news") == len("📰 news") + 1
+
+
+def test_quiet_days_share_a_message():
+    days = [make_day(offset, [2, 1]) for offset in range(3)]
+
+    (message,) = MessagePacker().pack(days)
+
+    assert message.post_count == 9
+    assert entries(message) == 9
+    assert message.first_date == FIRST_DAY
+    assert message.last_date == FIRST_DAY - timedelta(days=2)
+    assert message.date_range == "2026-03-08 to 2026-03-10"
+    for day in days:
+        assert day.header in message.text
+
+
+@pytest.mark.parametrize("limit", [MESSAGE_LIMIT, 500])
+def test_messages_stay_within_the_utf16_limit(limit):
+    # Emoji make the UTF-16 length exceed len(), which would overflow a
+    # message if characters were counted instead
+    days = [make_day(offset, [40, 3, 25], title="🔥" * 20) for offset in range(4)]
+
+    messages = MessagePacker(limit=limit).pack(days)
+
+    assert len(messages) > 1
+    for message in messages:
+        assert text_length(message.text) <= limit
+    assert sum(message.post_count for message in messages) == 4 * 68
+    assert sum(entries(message) for message in messages) == 4 * 68
+
+
+def test_messages_are_filled_before_starting_a_new_one():
+    days = [make_day(offset, [10, 10]) for offset in range(10)]
+    packer = MessagePacker()
+
+    messages = packer.pack(days)
+
+    smallest_section = min(
+        text_length(section.render()) for day in days for section in day.sections
+    )
+    for message in messages[:-1]:
+        assert text_length(message.text) > MESSAGE_LIMIT - smallest_section - 100
+
+
+def test_days_keep_their_order():
+    days = [make_day(offset, [30]) for offset in range(6)]
+
+    messages = MessagePacker(limit=1000).pack(days)
+
+    dates = [message.first_date for message in messages]
+    assert dates == sorted(dates, reverse=True)
+    for message in messages:
+        assert message.first_date >= message.last_date
+
+
+def test_split_sections_repeat_their_headers_as_continued():
+    (day,) = days = [make_day(0, [60])]
+
+    messages = MessagePacker(limit=1000).pack(days)
+
+    assert len(messages) > 1
+    section_header = day.sections[0].header
+    assert messages[0].text.startswith(f"{day.header}\n\n{section_header}\n")
+    for message in messages[1:]:
+        assert message.text.startswith(
+            f"{day.header} (cont.)\n\n{section_header} (cont.)\n"
+        )
+    numbers = [
+        int(line.split("*")[1].rstrip("."))
+        for message in messages
+        for line in message.text.splitlines()
+        if line.startswith("  *")
+    ]
+    assert numbers == list(range(1, 61))
+
+
+@pytest.mark.parametrize("limit", [MESSAGE_LIMIT, 500])
+def test_only_the_title_of_an_entry_longer_than_a_message_is_shortened(limit):
+    day = make_day(0, [1], title="🧵" * 3000)
+
+    (message,) = MessagePacker(limit=limit).pack([day])
+
+    assert text_length(message.text) <= limit
+    assert message.text.endswith("🧵…\n      [Read →](https://example.com/1)")
+    assert "\n  *1.* 🧵" in message.text
+    assert message.post_count == 1
@@ -0,0 +1,196 @@
+"""Tests for the outbox of messages waiting to be delivered."""
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from channels.message_packer import PackedMessage
+from channels.outbox import FAILED, PENDING, SENT, Outbox
+from channels.rate_limiter import TelegramRateLimiter
+from channels.telegram import TelegramChannel
+
+
+def messages(count: int) -> List[PackedMessage]:
+    day = date(2026, 3, 10)
+    return [PackedMessage(f"Message {i}", 2, day, day) for i in range(count)]
+
+
+@pytest.fixture
+def outbox(tmp_path: Path) -> Iterator[Outbox]:
+    outbox = Outbox(tmp_path / "outbox.sqlite3", max_attempts=3, backoff=30)
+    yield outbox
+    outbox.close()
+
+
+def move_due_dates(outbox: Outbox, seconds: float) -> None:
+    """Move every retry into the past, as if ``seconds`` had passed."""
+    with outbox._conn:
+        for message in outbox.messages(limit=1000):
+            due = message.next_attempt_at - timedelta(seconds=seconds)
+            outbox._conn.execute(
+                "UPDATE outbox_messages SET next_attempt_at = ? WHERE id = ?",
+                (due.isoformat(), message.id),
+            )
+
+
+def test_queued_messages_are_due_per_chat_in_order(outbox):
+    outbox.enqueue(["@a", "@b"], messages(3))
+
+    due = outbox.due()
+
+    assert sorted(due) == ["@a", "@b"]
+    for chat_messages in due.values():
+        assert [m.text for m in chat_messages] == [
+            "Message 0",
+            "Message 1",
+            "Message 2",
+        ]
+        assert all(m.status == PENDING for m in chat_messages)
+
+
+def test_sent_messages_are_no_longer_due(outbox):
+    first, second = outbox.enqueue(["@a"], messages(2))
+
+    outbox.mark_sent(first)
+
+    assert [m.id for m in outbox.due()["@a"]] == [second]
+    assert outbox.get(first).sent_at is not None
+    assert outbox.counts() == {PENDING: 1, SENT: 1, FAILED: 0}
+
+
+def test_a_failed_message_holds_back_the_rest_of_its_chat(outbox):
+    first, _ = outbox.enqueue(["@a"], messages(2))
+    outbox.enqueue(["@b"], messages(1))
+
+    assert outbox.mark_attempt_failed(first, "timed out") == PENDING
+
+    due = outbox.due()
+    assert "@a" not in due
+    assert len(due["@b"]) == 1
+    message = outbox.get(first)
+    assert message.attempts == 1
+    assert message.last_error == "timed out"
+
+
+def test_retries_back_off_exponentially(outbox):
+    (message_id,) = outbox.enqueue(["@a"], messages(1))
+
+    delays = []
+    for _ in range(2):
+        before = datetime.now(timezone.utc)
+        outbox.mark_attempt_failed(message_id, "timed out")
+        delay = outbox.get(message_id).next_attempt_at - before
+        delays.append(round(delay.total_seconds()))
+        move_due_dates(outbox, delay.total_seconds())
+        assert [m.id for m in outbox.due()["@a"]] == [message_id]
+
+    assert delays == [30, 60]
+
+
+def test_backoff_is_capped(tmp_path):
+    outbox = Outbox(tmp_path / "outbox.sqlite3", max_attempts=20, max_backoff=100)
+    (message_id,) = outbox.enqueue(["@a"], messages(1))
+
+    for _ in range(6):
+        outbox.mark_attempt_failed(message_id, "timed out")
+
+    delay = outbox.get(message_id).next_attempt_at - datetime.now(timezone.utc)
+    assert 90 < delay.total_seconds() <= 100
+    outbox.close()
+
+
+def test_a_message_is_given_up_on_after_max_attempts(outbox):
+    failing, following = outbox.enqueue(["@a"], messages(2))
+
+    statuses = [outbox.mark_attempt_failed(failing, "chat not found") for _ in range(3)]
+
+    assert statuses == [PENDING, PENDING, FAILED]
+    # A failed message no longer holds up its chat
+    assert [m.id for m in outbox.due()["@a"]] == [following]
+
+
+def test_retry_failed_queues_messages_again(outbox):
+    (message_id,) = outbox.enqueue(["@a"], messages(1))
+    for _ in range(3):
+        outbox.mark_attempt_failed(message_id, "chat not found")
+
+    assert outbox.retry_failed() == 1
+
+    message = outbox.get(message_id)
+    assert message.status == PENDING
+    assert message.attempts == 0
+    assert [m.id for m in outbox.due()["@a"]] == [message_id]
+
+
+def test_queued_messages_survive_reopening(tmp_path):
+    path = tmp_path / "outbox.sqlite3"
+    Outbox(path).enqueue(["@a"], messages(2))
+
+    reopened = Outbox(path)
+
+    assert len(reopened.due()["@a"]) == 2
+    reopened.close()
+
+
+def test_sent_messages_are_purged_after_the_retention(tmp_path):
+    path = tmp_path / "outbox.sqlite3"
+    outbox = Outbox(path, sent_retention=3600)
+    old, recent, pending = outbox.enqueue(["@a"], messages(3))
+    outbox.mark_sent(old)
+    outbox.mark_sent(recent)
+    sent_long_ago = datetime.now(timezone.utc) - timedelta(hours=2)
+    with outbox._conn:
+        outbox._conn.execute(
+            "UPDATE outbox_messages SET sent_at = ? WHERE id = ?",
+            (sent_long_ago.isoformat(), old),
+        )
+
+    assert outbox.purge_sent() == 1
+    assert outbox.get(old) is None
+    assert outbox.get(recent) is not None
+    assert outbox.get(pending) is not None
+    outbox.close()
+
+
+class FlakyBot:
+    """A bot whose sends fail for the listed message texts."""
+
+    def __init__(self, failing: List[str]) -> None:
+        self.failing = failing
+        self.sent: List[str] = []
+
+    async def send_message(self, chat_id: str, text: str, parse_mode: str) -> None:
+        if text in self.failing:
+            raise RuntimeError("Bad Gateway")
+        self.sent.append(text)
+
+
+@pytest.fixture
+def channel(outbox, monkeypatch) -> TelegramChannel:
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+    monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@channel")
+    limiter = TelegramRateLimiter(global_rate=1000, chat_rate=1000, group_rate=1000)
+    return TelegramChannel(bot=FlakyBot([]), limiter=limiter, outbox=outbox)
+
+
+async def test_delivery_reports_sent_and_queued_messages(channel, outbox):
+    channel._bot = FlakyBot(["Message 1"])
+    channel.queue_messages(messages(3))
+
+    report = await channel.deliver_queued()
+
+    assert channel.bot.sent == ["Message 0"]
+    assert (report.sent, report.queued, report.failed) == (1, 2, 0)
+    assert report.error == "Bad Gateway"
+    assert not report.complete
+
+    # Once the retry is due the rest is delivered, in order
+    channel._bot = FlakyBot([])
+    move_due_dates(outbox, 30)
+    report = await channel.deliver_queued()
+
+    assert channel.bot.sent == ["Message 1", "Message 2"]
+    assert (report.sent, report.queued, report.failed) == (2, 0, 0)
+    assert report.complete
@@ -0,0 +1,144 @@
+"""Tests for reading article metadata from the head of streamed pages."""
+
+import json
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+import pytest
+
+from scrapers.base_scraper import PARSE_DURATION
+from scrapers.feed_scraper import FeedScraper
+from scrapers.page_metadata import read_page_metadata
+
+POSTING = {
+    "@type": "BlogPosting",
+    "headline": "Café ☕ notes",
+    "datePublished": "2026-03-10",
+}
+HEAD = (
+    "<html><head>"
+    '<meta property="og:title" content="Café ☕ notes">'
+    '<meta property="og:title" content="Ignored duplicate">'
+    '<meta property="article:published_time" content="2026-03-10T12:00:00Z">'
+    '<script type="application/ld+json">'
+    f'{json.dumps({"@context": "https://schema.org", "@graph": [POSTING]})}'
+    "</script>"
+    "</head>"
+)
+BODY = "<body>" + "<p>Lorem ipsum dolor sit amet.</p>" * 2000 + "</body></html>"
+
+
+class FakeResponse:
+    """A streamed response that serves a page in small chunks."""
+
+    def __init__(self, page: str, encoding: Optional[str] = "utf-8") -> None:
+        self.content = page.encode(encoding or "utf-8")
+        self.encoding = encoding
+        self.chunks_read = 0
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[start : start + chunk_size]
+
+
+def chunks_until(response: FakeResponse, marker: str, chunk_size: int) -> int:
+    end = response.content.index(marker.encode()) + len(marker)
+    return -(-end // chunk_size)
+
+
+async def test_reading_stops_once_the_head_is_parsed():
+    response = FakeResponse(HEAD + BODY)
+
+    metadata = await read_page_metadata(response, chunk_size=64)
+
+    assert response.chunks_read == chunks_until(response, "</head>", 64)
+    assert metadata.bytes_read < len(response.content) // 10
+    assert metadata.title == "Café ☕ notes"
+    assert metadata.published_time == "2026-03-10T12:00:00Z"
+    assert metadata.find_json_ld("BlogPosting") == POSTING
+    assert metadata.find_json_ld("Person") is None
+    assert metadata.parse_seconds > 0
+
+
+async def test_a_body_without_a_closing_head_tag_also_stops_reading():
+    page = (HEAD + BODY).replace("</head>", "")
+    response = FakeResponse(page)
+
+    await read_page_metadata(response, chunk_size=64)
+
+    assert response.chunks_read == chunks_until(response, "<body>", 64)
+
+
+async def test_reading_stops_as_soon_as_the_caller_has_what_it_needs():
+    response = FakeResponse(HEAD + BODY)
+    seen: List[int] = []
+
+    def until(metadata) -> bool:
+        seen.append(metadata.bytes_read)
+        return metadata.title is not None
+
+    metadata = await read_page_metadata(response, until=until, chunk_size=64)
+
+    assert metadata.title == "Café ☕ notes"
+    assert response.chunks_read == chunks_until(response, 'notes">', 64)
+    assert metadata.find_json_ld("BlogPosting") is None
+    assert len(seen) == response.chunks_read
+
+
+async def test_a_page_without_a_head_is_read_to_the_end():
+    page = '<meta property="og:title" content="Bare">' + "x" * 500
+    response = FakeResponse(page)
+
+    metadata = await read_page_metadata(response, chunk_size=64)
+
+    assert metadata.bytes_read == len(response.content)
+    assert metadata.title == "Bare"
+
+
+async def test_characters_split_across_chunks_are_decoded():
+    # One-byte chunks split every multi-byte character
+    metadata = await read_page_metadata(FakeResponse(HEAD), chunk_size=1)
+
+    assert metadata.title == "Café ☕ notes"
+    assert metadata.find_json_ld("BlogPosting")["headline"] == "Café ☕ notes"
+
+
+async def test_the_announced_encoding_is_used():
+    page = '<head><meta property="og:title" content="Café"></head>'
+    metadata = await read_page_metadata(FakeResponse(page, "latin-1"))
+
+    assert metadata.title == "Café"
+
+
+async def test_broken_json_ld_is_ignored():
+    page = (
+        '<head><script type="application/ld+json">{broken</script>'
+        '<script type="application/ld+json">[{"@type": "Article"}, 1]</script></head>'
+    )
+
+    metadata = await read_page_metadata(FakeResponse(page))
+
+    assert metadata.json_ld == [{"@type": "Article"}]
+
+
+async def test_scrapers_record_the_parse_time(monkeypatch: pytest.MonkeyPatch):
+    scraper = FeedScraper(
+        base_url="https://example.com/",
+        source_name="Page Metadata Test",
+        feed_url="https://example.com/feed",
+    )
+
+    @asynccontextmanager
+    async def stream(url, **kwargs):
+        yield FakeResponse(HEAD + BODY)
+
+    monkeypatch.setattr(scraper, "stream", stream)
+
+    metadata = await scraper.fetch_page_metadata("https://example.com/post")
+
+    assert metadata.title == "Café ☕ notes"
+    assert (
+        'koran_parse_duration_seconds_count{source="Page Metadata Test"} 1'
+        in PARSE_DURATION.samples()
+    )
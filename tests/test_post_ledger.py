@@ -0,0 +1,92 @@
+"""Tests for the ledger of delivered posts."""
+
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from services import post_ledger
+from services.post_ledger import PostLedger, normalize_url
+
+
+@pytest.fixture
+def ledger(tmp_path: Path) -> Iterator[PostLedger]:
+    ledger = PostLedger(tmp_path / "ledger.sqlite3")
+    yield ledger
+    ledger.close()
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.example.com/posts/1/",
+        "HTTPS://Example.com/posts/1#comments",
+        "https://example.com/posts/1?utm_source=feed&utm_medium=rss",
+        "https://example.com/posts/1?source=rss&gi=abc123",
+    ],
+)
+def test_normalize_url_ignores_trivial_differences(url):
+    assert normalize_url(url) == "https://example.com/posts/1"
+
+
+def test_normalize_url_keeps_identifying_query_parameters():
+    assert normalize_url("https://example.com/?p=2&lang=en") == (
+        "https://example.com/?lang=en&p=2"
+    )
+    assert normalize_url("https://example.com/?p=1") != normalize_url(
+        "https://example.com/?p=2"
+    )
+
+
+def test_filter_undelivered_collapses_duplicates_to_first(ledger, make_post):
+    first = make_post(1)
+    duplicate = make_post(1, url="https://www.example.com/posts")
+    second = make_post(2)
+
+    assert ledger.filter_undelivered([first, duplicate, second]) == [first, second]
+
+
+def test_delivered_posts_are_filtered_out(ledger, make_post):
+    posts = [make_post(i) for i in range(5)]
+    ledger.mark_delivered(posts[:2])
+
+    assert ledger.filter_undelivered(posts) == posts[2:]
+
+
+def test_mark_delivered_twice_is_ignored(ledger, make_post):
+    post = make_post(1)
+    ledger.mark_delivered([post])
+    ledger.mark_delivered([post])
+
+    assert ledger.filter_undelivered([post]) == []
+
+
+def test_lookups_are_chunked(ledger, make_post, monkeypatch):
+    monkeypatch.setattr(post_ledger, "_QUERY_CHUNK_SIZE", 3)
+    posts = [make_post(i) for i in range(10)]
+    # Delivered posts on both sides of every chunk boundary
+    ledger.mark_delivered(posts[2:5] + posts[8:])
+
+    assert ledger.filter_undelivered(posts) == posts[:2] + posts[5:8]
+
+
+def test_lookups_beyond_the_sqlite_parameter_limit(ledger, make_post):
+    posts = [make_post(i) for i in range(40_000)]
+    ledger.mark_delivered(posts[::2])
+
+    assert ledger.filter_undelivered(posts) == posts[1::2]
+
+
+def test_deliveries_persist_across_reopening(tmp_path, make_post):
+    path = tmp_path / "ledger.sqlite3"
+    ledger = PostLedger(path)
+    ledger.mark_delivered([make_post(1)])
+    ledger.close()
+
+    reopened = PostLedger(path)
+    try:
+        assert reopened.filter_undelivered([make_post(1), make_post(2)]) == [
+            make_post(2)
+        ]
+    finally:
+        reopened.close()
@@ -0,0 +1,198 @@
+"""Tests for rate-limited, ordered delivery to Telegram chats."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from channels import rate_limiter
+from channels.rate_limiter import DeliveryPipeline, TelegramRateLimiter, TokenBucket
+
+
+class FakeClock:
+    """Monotonic time that only moves when the code under test sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += max(seconds, 0.0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(
+        rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic)
+    )
+    monkeypatch.setattr(
+        rate_limiter,
+        "asyncio",
+        SimpleNamespace(sleep=clock.sleep, Lock=asyncio.Lock, gather=asyncio.gather),
+    )
+    return clock
+
+
+class FloodError(Exception):
+    """Stands in for telegram.error.RetryAfter."""
+
+    def __init__(self, retry_after) -> None:
+        super().__init__(f"Flood control exceeded, retry in {retry_after}")
+        self.retry_after = retry_after
+
+
+async def acquire_times(
+    bucket: TokenBucket, clock: FakeClock, count: int
+) -> List[float]:
+    times = []
+    for _ in range(count):
+        await bucket.acquire()
+        times.append(clock.now)
+    return times
+
+
+async def test_bucket_spaces_acquisitions_by_its_rate(clock):
+    bucket = TokenBucket(rate=2)
+
+    assert await acquire_times(bucket, clock, 4) == [0.0, 0.5, 1.0, 1.5]
+
+
+async def test_bucket_allows_bursts_up_to_its_capacity(clock):
+    bucket = TokenBucket(rate=1, capacity=3)
+
+    assert await acquire_times(bucket, clock, 5) == [0.0, 0.0, 0.0, 1.0, 2.0]
+
+
+async def test_paused_bucket_starts_empty_after_the_pause(clock):
+    bucket = TokenBucket(rate=1, capacity=3)
+    await bucket.acquire()
+
+    bucket.pause(10)
+
+    assert await acquire_times(bucket, clock, 2) == [11.0, 12.0]
+
+
+async def test_bucket_serves_waiters_in_arrival_order():
+    bucket = TokenBucket(rate=200)
+    served = []
+
+    async def waiter(number: int) -> None:
+        await bucket.acquire()
+        served.append(number)
+
+    await asyncio.gather(*(waiter(number) for number in range(10)))
+
+    assert served == list(range(10))
+
+
+@pytest.mark.parametrize(
+    "chat_id, is_group",
+    [("-1001234567890", True), ("@channel", True), ("123456789", False)],
+)
+def test_groups_and_channels_are_told_apart(chat_id, is_group):
+    assert TelegramRateLimiter.is_group(chat_id) is is_group
+
+
+async def test_limiter_applies_the_group_rate_to_channels(clock):
+    limiter = TelegramRateLimiter(global_rate=30, chat_rate=1, group_rate=20 / 60)
+
+    times = []
+    for _ in range(3):
+        await limiter.acquire("@channel")
+        times.append(clock.now)
+
+    assert times == pytest.approx([0.0, 3.0, 6.0])
+
+
+class Recorder:
+    """A send function that records deliveries and can fail on demand."""
+
+    def __init__(
+        self, failures: Optional[Dict[Tuple[str, int], List[Exception]]] = None
+    ):
+        self.failures = failures or {}
+        self.sent: List[Tuple[str, int]] = []
+        self.attempts: List[Tuple[str, int]] = []
+
+    async def __call__(self, chat_id: str, message: int) -> None:
+        self.attempts.append((chat_id, message))
+        # Let the other chats' workers run in between
+        await asyncio.sleep(0)
+        errors = self.failures.get((chat_id, message))
+        if errors:
+            raise errors.pop(0)
+        self.sent.append((chat_id, message))
+
+
+def fast_limiter() -> TelegramRateLimiter:
+    return TelegramRateLimiter(global_rate=10_000, chat_rate=10_000, group_rate=10_000)
+
+
+def sent_to(recorder: Recorder, chat_id: str) -> List[int]:
+    return [message for chat, message in recorder.sent if chat == chat_id]
+
+
+async def test_pipeline_keeps_each_chats_order_while_interleaving_chats():
+    send = Recorder()
+    pipeline = DeliveryPipeline(send, fast_limiter())
+
+    await pipeline.deliver({"a": [1, 2, 3, 4], "b": [10, 20, 30]})
+
+    assert sent_to(send, "a") == [1, 2, 3, 4]
+    assert sent_to(send, "b") == [10, 20, 30]
+    chats = [chat for chat, _ in send.sent]
+    # Both chats were served concurrently, not one after the other
+    assert chats != sorted(chats)
+
+
+@pytest.mark.parametrize("retry_after", [0.01, timedelta(milliseconds=10)])
+async def test_flood_control_retries_the_message_in_order(retry_after):
+    send = Recorder({("a", 2): [FloodError(retry_after), FloodError(retry_after)]})
+    pipeline = DeliveryPipeline(send, fast_limiter())
+
+    await pipeline.deliver({"a": [1, 2, 3]})
+
+    assert sent_to(send, "a") == [1, 2, 3]
+    assert send.attempts.count(("a", 2)) == 3
+
+
+async def test_flood_control_gives_up_after_max_attempts():
+    send = Recorder({("a", 1): [FloodError(0.001) for _ in range(3)]})
+    failures = []
+    pipeline = DeliveryPipeline(
+        send,
+        fast_limiter(),
+        max_attempts=3,
+        on_failure=lambda chat, message, error: failures.append((chat, message)),
+    )
+
+    with pytest.raises(FloodError):
+        await pipeline.deliver({"a": [1, 2]})
+
+    assert send.sent == []
+    assert failures == [("a", 1)]
+
+
+async def test_an_error_stops_only_its_chat_and_is_raised_afterwards():
+    error = RuntimeError("chat not found")
+    send = Recorder({("a", 2): [error]})
+    failures = []
+    pipeline = DeliveryPipeline(
+        send,
+        fast_limiter(),
+        on_failure=lambda chat, message, error: failures.append((chat, message)),
+    )
+
+    with pytest.raises(RuntimeError, match="chat not found"):
+        await pipeline.deliver({"a": [1, 2, 3], "b": [10, 20, 30]})
+
+    # The rest of chat "a" is held back so it can't arrive out of order
+    assert sent_to(send, "a") == [1]
+    assert sent_to(send, "b") == [10, 20, 30]
+    assert send.attempts.count(("a", 2)) == 1
+    assert failures == [("a", 2)]
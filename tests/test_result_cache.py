@@ -0,0 +1,227 @@
+"""Tests for the stale-while-revalidate cache of scraped posts."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+
+from scrapers.base_scraper import BlogPost
+from services import result_cache
+from services.result_cache import ResultCache
+
+NOW = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+def days_ago(days: int) -> datetime:
+    return NOW - timedelta(days=days)
+
+
+def post(days: int) -> BlogPost:
+    return BlogPost(
+        title=f"Post {days}",
+        url=f"https://example.com/posts/{days}",
+        date=days_ago(days) - timedelta(hours=1),
+        source="Test Blog",
+    )
+
+
+POSTS = [post(days) for days in range(10)]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(result_cache, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+class Fetcher:
+    """Scrapes POSTS, records the windows asked for and can fail or block."""
+
+    def __init__(self) -> None:
+        self.calls: List[datetime] = []
+        self.error: Optional[Exception] = None
+        self.release: Optional[asyncio.Event] = None
+
+    async def __call__(self, since: datetime) -> List[BlogPost]:
+        self.calls.append(since)
+        if self.release is not None:
+            await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return [post for post in POSTS if post.date > since]
+
+
+@pytest.fixture
+def fetch() -> Fetcher:
+    return Fetcher()
+
+
+def make_cache(**kwargs) -> ResultCache:
+    return ResultCache(ttl=60, max_stale=600, **kwargs)
+
+
+async def settle() -> None:
+    """Let background refreshes run until they block or finish."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_a_miss_scrapes_and_a_fresh_entry_is_served(clock, fetch):
+    cache = make_cache()
+
+    assert await cache.get("test", days_ago(3), fetch) == POSTS[:3]
+    clock.now += 59
+    assert await cache.get("test", days_ago(2), fetch) == POSTS[:2]
+
+    assert fetch.calls == [days_ago(3)]
+    (record,) = cache.freshness()
+    assert record.state == "fresh"
+
+
+async def test_a_stale_entry_is_served_while_it_is_refreshed(clock, fetch):
+    cache = make_cache()
+    await cache.get("test", days_ago(3), fetch)
+    clock.now += 60
+    fetch.release = asyncio.Event()
+
+    assert await cache.get("test", days_ago(3), fetch) == POSTS[:3]
+    await settle()
+    assert cache.freshness()[0].refreshing
+
+    fetch.release.set()
+    await cache.close()
+    assert fetch.calls == [days_ago(3), days_ago(3)]
+    assert cache.freshness()[0].state == "fresh"
+
+
+async def test_an_expired_entry_waits_for_a_scrape(clock, fetch):
+    cache = make_cache()
+    await cache.get("test", days_ago(3), fetch)
+    clock.now += 60 + 600
+
+    await cache.get("test", days_ago(3), fetch)
+
+    assert len(fetch.calls) == 2
+    assert cache.freshness()[0].state == "fresh"
+
+
+async def test_a_wider_window_is_a_miss(clock, fetch):
+    cache = make_cache()
+    await cache.get("test", days_ago(1), fetch)
+
+    assert await cache.get("test", days_ago(5), fetch) == POSTS[:5]
+
+    assert fetch.calls == [days_ago(1), days_ago(5)]
+
+
+async def test_refreshes_scrape_the_requested_window_only(clock, fetch):
+    cache = make_cache()
+    await cache.get("test", days_ago(30), fetch)
+    clock.now += 60
+
+    await cache.get("test", days_ago(1), fetch)
+    await cache.close()
+    await cache.refresh("test", days_ago(2), fetch)
+
+    assert fetch.calls == [days_ago(30), days_ago(1), days_ago(2)]
+    # The long window was not kept, so asking for it again scrapes again
+    await cache.get("test", days_ago(30), fetch)
+    assert fetch.calls[-1] == days_ago(30)
+
+
+async def test_a_truncated_entry_only_covers_the_posts_it_kept(clock, fetch):
+    cache = make_cache(max_posts=3)
+
+    assert await cache.get("test", days_ago(5), fetch) == POSTS[:5]
+
+    # The kept posts still answer narrower requests
+    assert await cache.get("test", POSTS[2].date, fetch) == POSTS[:2]
+    assert len(fetch.calls) == 1
+    # The dropped ones are scraped again
+    assert await cache.get("test", days_ago(5), fetch) == POSTS[:5]
+    assert len(fetch.calls) == 2
+
+
+async def test_a_refresh_joins_one_already_running(clock, fetch):
+    cache = make_cache()
+    await cache.get("test", days_ago(3), fetch)
+    clock.now += 60
+    fetch.release = asyncio.Event()
+    await cache.get("test", days_ago(3), fetch)
+    await settle()
+
+    refresh = asyncio.create_task(cache.refresh("test", days_ago(3), fetch))
+    await settle()
+    fetch.release.set()
+    await refresh
+
+    assert fetch.calls == [days_ago(3), days_ago(3)]
+
+
+async def test_a_miss_joins_a_running_refresh(clock, fetch):
+    cache = make_cache()
+    fetch.release = asyncio.Event()
+    refresh = asyncio.create_task(cache.refresh("test", days_ago(3), fetch))
+    await settle()
+
+    waiting = asyncio.create_task(cache.get("test", days_ago(2), fetch))
+    await settle()
+    fetch.release.set()
+
+    assert await waiting == POSTS[:2]
+    await refresh
+    assert fetch.calls == [days_ago(3)]
+
+
+async def test_a_failed_refresh_keeps_the_old_entry(clock, fetch):
+    cache = make_cache()
+    await cache.get("test", days_ago(3), fetch)
+    clock.now += 60
+    fetch.error = RuntimeError("HTTP 503")
+
+    await cache.refresh("test", days_ago(3), fetch)
+
+    assert await cache.get("test", days_ago(3), fetch) == POSTS[:3]
+    (record,) = cache.freshness()
+    assert record.state == "stale"
+    assert record.last_error == "HTTP 503"
+    await cache.close()
+
+
+async def test_entries_are_kept_across_instances(clock, fetch, tmp_path: Path):
+    path = tmp_path / "result_cache.json"
+    await make_cache(path=path).get("test", days_ago(3), fetch)
+
+    assert await make_cache(path=path).get("test", days_ago(3), fetch) == POSTS[:3]
+    assert len(fetch.calls) == 1
+
+
+async def test_least_recently_used_sources_are_evicted(clock, fetch):
+    cache = make_cache(max_entries=2)
+
+    for key in ("a", "b", "a", "c"):
+        await cache.get(key, days_ago(3), fetch)
+
+    assert [record.source for record in cache.freshness()] == ["a", "c"]
+
+
+async def test_a_zero_ttl_always_scrapes(clock, fetch):
+    cache = ResultCache(ttl=0)
+
+    await cache.get("test", days_ago(3), fetch)
+    await cache.get("test", days_ago(3), fetch)
+
+    assert len(fetch.calls) == 2
+    assert cache.freshness() == []
@@ -0,0 +1,209 @@
+"""Tests for coalescing concurrent fetches, and turning callers away."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List
+
+import httpx
+import pytest
+
+from cmd import http
+from scrapers.base_scraper import BlogPost
+from services.koran_service import KoranService
+from services.single_flight import ServiceBusyError, SingleFlight
+
+NOW = datetime(2026, 3, 10, tzinfo=timezone.utc)
+
+
+def post(days_ago: int, source: str = "Netflix Tech Blog") -> BlogPost:
+    return BlogPost(
+        title=f"{source} {days_ago}",
+        url=f"https://example.com/{source}/{days_ago}",
+        date=NOW - timedelta(days=days_ago, hours=1),
+        source=source,
+    )
+
+
+POSTS = [post(0), post(1), post(2), post(0, "AWS Architecture")]
+
+
+class Fetcher:
+    """A fetch that blocks until released and counts its calls."""
+
+    def __init__(self, posts: List[BlogPost] = POSTS) -> None:
+        self.posts = posts
+        self.calls: List[datetime] = []
+        self.release = asyncio.Event()
+
+    async def __call__(self, since: datetime) -> List[BlogPost]:
+        self.calls.append(since)
+        await self.release.wait()
+        return [post for post in self.posts if post.date > since]
+
+
+async def settle() -> None:
+    """Let the running tasks go on until they block."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_concurrent_callers_share_one_fetch():
+    flight = SingleFlight()
+    fetch = Fetcher()
+    since = NOW - timedelta(days=3)
+
+    tasks = [asyncio.create_task(flight.run(since, fetch)) for _ in range(5)]
+    await settle()
+    fetch.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert fetch.calls == [since]
+    assert flight.coalesced == 4
+    assert all(result == POSTS for result in results)
+
+
+async def test_a_narrower_window_joins_and_is_filtered():
+    flight = SingleFlight()
+    fetch = Fetcher()
+
+    first = asyncio.create_task(flight.run(NOW - timedelta(days=3), fetch))
+    await settle()
+    recent = asyncio.create_task(
+        flight.run(
+            NOW - timedelta(days=1), fetch, sources=frozenset({"Netflix Tech Blog"})
+        )
+    )
+    await settle()
+    fetch.release.set()
+
+    assert await first == POSTS
+    assert await recent == [post(0)]
+    assert len(fetch.calls) == 1
+
+
+async def test_a_fetch_of_some_sources_is_not_joined_by_one_of_all():
+    flight = SingleFlight()
+    fetch = Fetcher()
+    since = NOW - timedelta(days=3)
+
+    some = asyncio.create_task(
+        flight.run(since, fetch, sources=frozenset({"Netflix Tech Blog"}))
+    )
+    await settle()
+    everything = asyncio.create_task(flight.run(since, fetch))
+    await settle()
+
+    assert len(fetch.calls) == 1
+    fetch.release.set()
+    await asyncio.gather(some, everything)
+    assert len(fetch.calls) == 2
+
+
+async def test_a_wider_window_waits_and_fetches_again():
+    flight = SingleFlight()
+    fetch = Fetcher()
+
+    recent = asyncio.create_task(flight.run(NOW - timedelta(days=1), fetch))
+    await settle()
+    older = asyncio.create_task(flight.run(NOW - timedelta(days=3), fetch))
+    await settle()
+
+    assert fetch.calls == [NOW - timedelta(days=1)]
+    fetch.release.set()
+    assert await recent == [POSTS[0], POSTS[3]]
+    assert await older == POSTS
+    assert fetch.calls == [NOW - timedelta(days=1), NOW - timedelta(days=3)]
+    assert flight.coalesced == 0
+
+
+async def test_callers_beyond_the_queue_are_turned_away():
+    flight = SingleFlight(max_waiting=1)
+    fetch = Fetcher()
+
+    running = asyncio.create_task(flight.run(NOW - timedelta(days=1), fetch))
+    await settle()
+    queued = asyncio.create_task(flight.run(NOW - timedelta(days=2), fetch))
+    await settle()
+
+    with pytest.raises(ServiceBusyError) as excinfo:
+        await flight.run(NOW - timedelta(days=3), fetch)
+    assert excinfo.value.waiting == 1
+
+    # Joining the running fetch never needs a place in the queue
+    joined = asyncio.create_task(flight.run(NOW - timedelta(hours=1), fetch))
+    await settle()
+    fetch.release.set()
+    await asyncio.gather(running, queued, joined)
+
+
+async def test_errors_reach_every_caller_and_free_the_slot():
+    flight = SingleFlight()
+    calls = 0
+
+    async def failing(since: datetime) -> List[BlogPost]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("source down")
+
+    since = NOW - timedelta(days=1)
+    results = await asyncio.gather(
+        flight.run(since, failing), flight.run(since, failing), return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(RuntimeError):
+        await flight.run(since, failing)
+    assert calls == 2
+
+
+async def test_a_cancelled_caller_does_not_cancel_the_shared_fetch():
+    flight = SingleFlight()
+    fetch = Fetcher()
+    since = NOW - timedelta(days=3)
+
+    starter = asyncio.create_task(flight.run(since, fetch))
+    await settle()
+    joiner = asyncio.create_task(flight.run(since, fetch))
+    await settle()
+    starter.cancel()
+    await settle()
+    fetch.release.set()
+
+    assert await joiner == POSTS
+    await asyncio.sleep(0)
+    # The slot is free again once the fetch has finished
+    assert flight._flight is None
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> Iterator[KoranService]:
+    monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "token")
+    monkeypatch.setenv("TELEGRAM_CHANNEL_ID", "@channel")
+    service = KoranService(dry_run=True, sources=["netflix"], max_waiting_requests=0)
+    monkeypatch.setattr(http, "_service", service)
+    yield service
+    service.ledger.close()
+    service.channel.close()
+
+
+async def test_send_posts_answers_429_when_the_queue_is_full(service, monkeypatch):
+    fetch = Fetcher([])
+    monkeypatch.setattr(service, "_fetch_all", lambda since, scrapers: fetch(since))
+    transport = httpx.ASGITransport(app=http.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        running = asyncio.create_task(
+            client.post("/send-posts", json={"days": 1, "dry_run": True})
+        )
+        while not fetch.calls:
+            await asyncio.sleep(0.001)
+
+        response = await client.post("/send-posts", json={"days": 2, "dry_run": True})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == str(http.RETRY_AFTER_SECONDS)
+        assert response.json()["detail"]["status"] == "error"
+
+        fetch.release.set()
+        assert (await running).status_code == 200
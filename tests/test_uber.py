@@ -0,0 +1,83 @@
+"""Tests for dating the article cards of the Uber Engineering blog."""
+
+from datetime import datetime, timezone
+
+from bs4 import BeautifulSoup
+
+from scrapers.uber import UberScraper
+
+
+def card(slug: str, date: str) -> str:
+    return (
+        '<div class="card">'
+        f'<a href="/blog/{slug}/">Building {slug} at Uber scale</a>'
+        f'<div class="meta"><div class="date">{date}</div></div>'
+        "</div>"
+    )
+
+
+LISTING = (
+    "<html><body>"
+    '<a href="/blog/">Engineering blog home</a>'
+    '<div class="page">'
+    '<div class="nav"><a href="/blog/careers/">Careers at Uber</a></div>'
+    '<div class="grid">'
+    f'{card("kafka", "March 11, 2026")}'
+    f'{card("pricing", "Mar 2 2026")}'
+    "</div></div>"
+    "</body></html>"
+)
+
+
+def date(day: int) -> datetime:
+    return datetime(2026, 3, day, tzinfo=timezone.utc)
+
+
+def divs_by_class(soup: BeautifulSoup):
+    return {div["class"][0]: div for div in soup.find_all("div", class_=True)}
+
+
+def test_cards_map_to_their_date_and_listings_to_none():
+    soup = BeautifulSoup(LISTING, "html.parser")
+    divs = divs_by_class(soup)
+    cards = soup.find_all("div", class_="card")
+
+    index = UberScraper._index_dates(soup)
+
+    assert index[id(cards[0])] == date(11)
+    assert index[id(cards[1])] == date(2)
+    assert index[id(divs["grid"])] is None
+    assert index[id(divs["page"])] is None
+    # The div holding the date text itself is not a container
+    assert id(divs["date"]) not in index
+    assert id(divs["nav"]) not in index
+
+
+def test_text_that_is_not_only_a_date_is_ignored():
+    html = (
+        '<div class="card"><a href="/blog/a/">Some long title</a>'
+        '<div class="meta"><div>Posted March 11, 2026 by Jane</div></div></div>'
+    )
+    soup = BeautifulSoup(html, "html.parser")
+
+    assert UberScraper._index_dates(soup) == {}
+
+
+def test_links_take_the_date_of_their_own_card_only():
+    scraper = UberScraper()
+
+    posts = scraper.parse_posts(LISTING)
+
+    assert [(post.url, post.date) for post in posts] == [
+        ("https://www.uber.com/blog/kafka/", date(11)),
+        ("https://www.uber.com/blog/pricing/", date(2)),
+    ]
+    assert all(post.source == "Uber Engineering" for post in posts)
+
+
+def test_a_page_with_a_single_card_dates_its_link():
+    html = f'<div class="page">{card("kafka", "March 11, 2026")}</div>'
+
+    (post,) = UberScraper().parse_posts(html)
+
+    assert post.date == date(11)
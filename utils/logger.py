@@ -6,6 +6,20 @@ from pathlib import Path
 from typing import Optional
 
 
+class _LazyFileHandler(logging.FileHandler):
+    """File handler that creates its directory and file on the first record.
+
+    Importing a module that sets up a logger then touches no files.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path, delay=True)
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(exist_ok=True, parents=True)
+        return super()._open()
+
+
 def setup_logger(name: str, log_level: Optional[int] = None) -> logging.Logger:
     """Configure and return a logger instance.
 
@@ -23,13 +37,9 @@ def setup_logger(name: str, log_level: Optional[int] = None) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # Create logs directory if it doesn't exist
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True, parents=True)
-
-    # Create handlers
+    # Create handlers; the log file is only opened on the first record
     c_handler = logging.StreamHandler(sys.stdout)
-    f_handler = logging.FileHandler(log_dir / "app.log")
+    f_handler = _LazyFileHandler(Path("logs") / "app.log")
 
     # Set levels
     c_handler.setLevel(logger.level)
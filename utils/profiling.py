@@ -0,0 +1,272 @@
+"""Per-stage, per-source profiling of CLI runs.
+
+Scrapers, the browser pool and the Telegram channel mark their work with
+``stage("fetch")``, ``stage("parse")`` and so on. The stages cost nothing
+unless profiling was started with ``start_profiling``, in which case their
+wall and CPU time is recorded. The time covered by nested stages is
+subtracted from the stage around them, so a stream fetch that parses its
+feed while downloading is not counted twice. Nested stages may run
+concurrently, e.g. the post pages Claude fetches in batches; only the union
+of their intervals is subtracted, and their summed wall time is marked as
+overlapping. For every source the peak traced memory is recorded too, and
+optionally a cProfile written to ``<profile_dir>/<source>.pstats``.
+
+CPU time is process-wide, so it is only attributable to a stage whose calls
+ran alone. Profiled runs scrape one source after another for that reason;
+stages whose calls overlapped report no CPU time of their own.
+"""
+
+import cProfile
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ContextManager, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from utils.storage import slugify
+
+# Stages in the order they are listed in the summary
+STAGES = ("scrape", "fetch", "parse", "render", "send")
+
+StageKey = Tuple[str, str]
+
+
+@dataclass
+class StageStats:
+    """Accumulated timings of one stage of one source.
+
+    ``wall`` sums the duration of every call, so it can exceed the time
+    that passed when calls overlapped, which ``concurrent`` records.
+    ``self_wall`` excludes the time covered by nested stages; ``cpu`` and
+    ``self_cpu`` are the process CPU time measured the same way, and only
+    meaningful when ``concurrent`` is False.
+    """
+
+    calls: int = 0
+    wall: float = 0.0
+    self_wall: float = 0.0
+    cpu: float = 0.0
+    self_cpu: float = 0.0
+    concurrent: bool = False
+
+
+@dataclass
+class _Frame:
+    source: str
+    wall_start: float
+    cpu_start: float
+    # (start, end, stage) of the nested stages that have finished, in wall
+    # and in CPU time
+    children: List[Tuple[float, float, StageKey]] = field(default_factory=list)
+    cpu_children: List[Tuple[float, float, StageKey]] = field(default_factory=list)
+    parent: Optional["_Frame"] = field(default=None, repr=False)
+
+
+def _union(
+    intervals: Iterable[Tuple[float, float, StageKey]]
+) -> Tuple[float, Set[StageKey]]:
+    """Total length covered by intervals, and the stages that overlapped."""
+    covered = 0.0
+    overlapping: Set[StageKey] = set()
+    current_start = current_end = None
+    current_key = None
+    for start, end, key in sorted(intervals):
+        if current_end is not None and start < current_end:
+            overlapping.update((key, current_key))
+            if end > current_end:
+                current_end, current_key = end, key
+            continue
+        if current_end is not None:
+            covered += current_end - current_start
+        current_start, current_end, current_key = start, end, key
+    if current_end is not None:
+        covered += current_end - current_start
+    return covered, overlapping
+
+
+_current_frame: ContextVar[Optional[_Frame]] = ContextVar("profile_frame", default=None)
+
+
+class Profiler:
+    """Collects stage timings, memory peaks and cProfiles of a run."""
+
+    def __init__(self, profile_dir: Optional[Path] = None) -> None:
+        """Initialize the profiler.
+
+        Args:
+            profile_dir: If set, write a cProfile of every source here
+        """
+        self.profile_dir = profile_dir
+        self.stats: Dict[Tuple[str, str], StageStats] = defaultdict(StageStats)
+        self.memory_peaks: Dict[str, int] = {}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._started = time.perf_counter()
+        self._started_cpu = time.process_time()
+
+    @contextmanager
+    def stage(self, name: str, source: Optional[str] = None) -> Iterator[None]:
+        """Time a stage, attributed to ``source`` or that of the enclosing stage."""
+        parent = _current_frame.get()
+        if source is None:
+            source = parent.source if parent is not None else "-"
+        frame = _Frame(
+            source=source,
+            wall_start=time.perf_counter(),
+            cpu_start=time.process_time(),
+            parent=parent,
+        )
+        token = _current_frame.set(frame)
+        try:
+            yield
+        finally:
+            _current_frame.reset(token)
+            end = time.perf_counter()
+            cpu_end = time.process_time()
+            wall = end - frame.wall_start
+            cpu = cpu_end - frame.cpu_start
+            covered, overlapping = _union(frame.children)
+            covered_cpu, _ = _union(frame.cpu_children)
+            stats = self.stats[(source, name)]
+            stats.calls += 1
+            stats.wall += wall
+            stats.self_wall += max(wall - covered, 0.0)
+            stats.cpu += cpu
+            stats.self_cpu += max(cpu - covered_cpu, 0.0)
+            for key in overlapping:
+                self.stats[key].concurrent = True
+            if parent is not None:
+                key = (source, name)
+                parent.children.append((frame.wall_start, end, key))
+                parent.cpu_children.append((frame.cpu_start, cpu_end, key))
+
+    @contextmanager
+    def source(self, source: str) -> Iterator[None]:
+        """Profile a whole scrape of a source, with CPU, memory and cProfile."""
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        profile = None
+        if self.profile_dir is not None:
+            profile = self._profiles.setdefault(source, cProfile.Profile())
+            profile.enable()
+        try:
+            with self.stage("scrape", source):
+                yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            if tracemalloc.is_tracing():
+                peak = tracemalloc.get_traced_memory()[1]
+                self.memory_peaks[source] = max(self.memory_peaks.get(source, 0), peak)
+
+    def write_profiles(self) -> List[Path]:
+        """Write the collected cProfiles as pstats files.
+
+        Returns:
+            The files written
+        """
+        if self.profile_dir is None:
+            return []
+        self.profile_dir.mkdir(exist_ok=True, parents=True)
+        paths = []
+        for source, profile in self._profiles.items():
+            path = self.profile_dir / f"{slugify(source)}.pstats"
+            profile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+    def summary(self) -> str:
+        """Render the timings as a table, slowest source first."""
+        by_source: Dict[str, Dict[str, StageStats]] = defaultdict(dict)
+        any_concurrent = False
+        for (source, name), stats in self.stats.items():
+            by_source[source][name] = stats
+
+        def total_wall(source: str) -> float:
+            return sum(stats.self_wall for stats in by_source[source].values())
+
+        header = (
+            f"{'source':<24}{'stage':<8}{'calls':>6}{'wall s':>10}{'self s':>9}"
+            f"{'cpu s':>9}{'self cpu':>9}{'peak MiB':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        for source in sorted(by_source, key=total_wall, reverse=True):
+            stages = by_source[source]
+            names = sorted(
+                stages, key=lambda n: STAGES.index(n) if n in STAGES else len(STAGES)
+            )
+            for i, name in enumerate(names):
+                stats = stages[name]
+                any_concurrent = any_concurrent or stats.concurrent
+                peak = ""
+                if i == 0 and source in self.memory_peaks:
+                    peak = f"{self.memory_peaks[source] / 2**20:.1f}"
+                marker = "*" if stats.concurrent else " "
+                if stats.concurrent:
+                    cpu = f"{'-':>9}{'-':>9}"
+                else:
+                    cpu = f"{stats.cpu:>9.3f}{stats.self_cpu:>9.3f}"
+                lines.append(
+                    f"{source if i == 0 else '':<24.24}{name:<8}{stats.calls:>6}"
+                    f"{stats.wall:>9.3f}{marker}{stats.self_wall:>9.3f}{cpu}"
+                    f"{peak:>10}"
+                )
+        wall = time.perf_counter() - self._started
+        cpu = time.process_time() - self._started_cpu
+        peak = tracemalloc.get_traced_memory()[1] if tracemalloc.is_tracing() else 0
+        lines.append("-" * len(header))
+        if any_concurrent:
+            lines.append(
+                "* calls overlapped; their wall time is summed and their CPU "
+                "time can't be told apart"
+            )
+        lines.append(
+            f"Total: {wall:.3f}s wall, {cpu:.3f}s CPU, {peak / 2**20:.1f} MiB peak"
+        )
+        return "\n".join(lines)
+
+
+_active: Optional[Profiler] = None
+
+
+def start_profiling(
+    profile_dir: Optional[Path] = None, trace_memory: bool = True
+) -> Profiler:
+    """Start profiling the stages of this process.
+
+    Args:
+        profile_dir: If set, write a cProfile of every source here
+        trace_memory: If False, skip tracemalloc, which slows Python code down
+
+    Returns:
+        The active profiler
+    """
+    global _active
+    if trace_memory:
+        tracemalloc.start()
+    _active = Profiler(profile_dir)
+    return _active
+
+
+def stop_profiling() -> None:
+    """Stop profiling and memory tracing."""
+    global _active
+    _active = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def stage(name: str, source: Optional[str] = None) -> ContextManager[None]:
+    """Time a stage if profiling is active; a no-op otherwise."""
+    if _active is None:
+        return nullcontext()
+    return _active.stage(name, source)
+
+
+def profile_source(source: str) -> ContextManager[None]:
+    """Profile a scrape of a source if profiling is active; a no-op otherwise."""
+    if _active is None:
+        return nullcontext()
+    return _active.source(source)
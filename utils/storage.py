@@ -0,0 +1,78 @@
+"""Local on-disk storage helpers."""
+
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any
+
+
+def data_dir() -> Path:
+    """Return the directory for persistent local state, creating it if needed.
+
+    The location defaults to ``data`` in the working directory and can be
+    changed with the ``KORAN_DATA_DIR`` environment variable.
+    """
+    path = Path(os.environ.get("KORAN_DATA_DIR", "data"))
+    path.mkdir(exist_ok=True, parents=True)
+    return path
+
+
+def cache_dir() -> Path:
+    """Return the directory for cached scraper state, creating it if needed.
+
+    Cached results, saved validators, circuit breakers and post metadata live
+    here. It is the data directory unless ``KORAN_CACHE_DIR`` points
+    elsewhere, which lets a replayed run start without them while still
+    using the real post ledger and outbox.
+    """
+    cache = os.environ.get("KORAN_CACHE_DIR")
+    if not cache:
+        return data_dir()
+    path = Path(cache)
+    path.mkdir(exist_ok=True, parents=True)
+    return path
+
+
+def slugify(name: str) -> str:
+    """Turn a name, e.g. of a blog source, into a safe file name."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def read_json(path: Path, default: Any) -> Any:
+    """Read a JSON file, returning ``default`` if it is missing or corrupt.
+
+    Args:
+        path: File to read
+        default: Value returned when the file cannot be loaded
+
+    Returns:
+        The decoded JSON document or ``default``
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Atomically write ``data`` as JSON to ``path``.
+
+    The document is written to a temporary file first and then moved into
+    place, so readers never see a partially written file.
+
+    Args:
+        path: File to write
+        data: JSON-serializable document
+    """
+    path.parent.mkdir(exist_ok=True, parents=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise